@@ -0,0 +1,276 @@
+"""
+Micro-benchmarks des fonctions les plus chaudes du jeu.
+
+Chaque noyau est mesuré pour plusieurs tailles (nombre d'ennemis, de tours,
+de projectiles ou longueur du chemin), ce qui donne une courbe de mise à
+l'échelle par fonction : une optimisation peut ainsi être validée noyau par
+noyau. Les temps sont ceux d'un appel du noyau complet pour la taille donnée
+(meilleure de plusieurs séries, via `timeit`).
+
+Depuis la racine du projet :
+
+    python benchmarks/micro.py
+    python benchmarks/micro.py --noyau Tour._choisir_cible --tailles 10,100,1000
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RACINE, "src"))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from classes.constants import (  # noqa: E402
+    GAME_HEIGHT,
+    GAME_WIDTH,
+    TILE_SIZE,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
+)
+from classes.position import Position  # noqa: E402
+from classes.types_ennemis import BAS, COTE, HAUT  # noqa: E402
+from classes.utils import cases_depuis_chemin  # noqa: E402
+from models.ennemi import classe_ennemi  # noqa: E402
+from models.projectile import ProjectileFleche, ProjectileTourMage  # noqa: E402
+from models.tour import Archer, Catapulte  # noqa: E402
+from scenarios import DOSSIER_RESULTATS, informations_machine  # noqa: E402
+
+# Une fonction de préparation reçoit une taille et retourne l'appel à chronométrer
+Preparation = Callable[[int], Callable[[], None]]
+
+Gobelin = classe_ennemi("Gobelin")
+
+
+# ------------------- DONNÉES SYNTHÉTIQUES -------------------
+
+
+def chemin_zigzag(nb_points: int) -> List[Position]:
+    """Chemin en créneaux sur la carte, avec `nb_points` sommets."""
+    points = []
+    for i in range(nb_points):
+        x = 32 + (i * 97) % (GAME_WIDTH - 64)
+        y = 32 + ((i // 2) * 61) % (GAME_HEIGHT - 64)
+        points.append(Position(x, y))
+    return points
+
+
+def ennemis_autour(
+    nb: int, centre: Tuple[float, float], rayon: float, chemin: List[Position]
+) -> list:
+    """Crée `nb` gobelins visibles répartis en spirale autour d'un point."""
+    ennemis = []
+    for i in range(nb):
+        e = Gobelin(tempsApparition=0, chemin=chemin)
+        angle = i * 2.399963  # angle d'or : répartition homogène
+        distance = rayon * math.sqrt((i + 0.5) / nb)
+        e.position.x = centre[0] + distance * math.cos(angle)
+        e.position.y = centre[1] + distance * math.sin(angle)
+        e._segment_index = i % (len(chemin) - 1)
+        e.pointsDeVie = e.pointsDeVieMax = e.pointsDeVieInitiaux = 10**9
+        e.visible = True
+        ennemis.append(e)
+    return ennemis
+
+
+# ------------------- NOYAUX -------------------
+
+
+def prep_se_deplacer(nb: int) -> Callable[[], None]:
+    chemin = chemin_zigzag(200)
+    ennemis = [Gobelin(tempsApparition=0, chemin=chemin) for _ in range(nb)]
+
+    def noyau() -> None:
+        for e in ennemis:
+            e.seDeplacer(1 / 60)
+            if e._arrive_au_bout:
+                e.recycler(0)
+
+    return noyau
+
+
+def prep_distance_restante(nb_points: int) -> Callable[[], None]:
+    e = Gobelin(tempsApparition=0, chemin=chemin_zigzag(nb_points))
+    return e.get_distance_restante
+
+
+def _prep_choix_cible(classe_tour) -> Preparation:
+    def prep(nb: int) -> Callable[[], None]:
+        tour = classe_tour(1, Position(400, 400))
+        ennemis = ennemis_autour(nb, (400, 400), tour.portee * 1.5, chemin_zigzag(50))
+        return lambda: tour._choisir_cible(ennemis)
+
+    return prep
+
+
+def prep_choix_cible_tours(nb_tours: int) -> Callable[[], None]:
+    centre = (GAME_WIDTH / 2, GAME_HEIGHT / 2)
+    ennemis = ennemis_autour(100, centre, 300, chemin_zigzag(50))
+    tours = [
+        Archer(i, Position(64 + (i * 128) % (GAME_WIDTH - 128), 64 + (i // 8) * 96))
+        for i in range(nb_tours)
+    ]
+
+    def noyau() -> None:
+        for t in tours:
+            t._choisir_cible(ennemis)
+
+    return noyau
+
+
+def prep_projectiles_mettre_a_jour(nb: int) -> Callable[[], None]:
+    cibles = ennemis_autour(nb, (600, 400), 200, chemin_zigzag(50))
+    projectiles = []
+    for i, cible in enumerate(cibles):
+        pr = ProjectileFleche(Position(100, 100 + i % 500), cible.position)
+        pr.cible = cible
+        pr.portee_max = None
+        projectiles.append(pr)
+
+    def noyau() -> None:
+        for pr in projectiles:
+            pr.mettreAJour(1 / 60)
+
+    return noyau
+
+
+def prep_projectiles_a_touche(nb_ennemis: int) -> Callable[[], None]:
+    ennemis = ennemis_autour(nb_ennemis, (600, 400), 300, chemin_zigzag(50))
+    projectiles = [
+        ProjectileFleche(Position(300 + 20 * i, 400), Position(600, 400))
+        for i in range(20)
+    ]
+
+    def noyau() -> None:
+        for pr in projectiles:
+            for e in ennemis:
+                if pr.aTouche(e):
+                    break
+
+    return noyau
+
+
+def prep_degats_zone(nb: int) -> Callable[[], None]:
+    ennemis = ennemis_autour(nb, (600, 400), 200, chemin_zigzag(50))
+    pr = ProjectileTourMage(Position(600, 400), Position(600, 400))
+    return lambda: pr.appliquerDegatsZone(ennemis)
+
+
+def prep_cases_depuis_chemin(nb_points: int) -> Callable[[], None]:
+    chemin = chemin_zigzag(nb_points)
+    return lambda: cases_depuis_chemin(chemin, TILE_SIZE)
+
+
+def prep_meilleure_orientation(nb: int) -> Callable[[], None]:
+    anim = Archer(1, Position(400, 400))._anim
+    angles = [2 * math.pi * i / nb for i in range(nb)]
+    cibles = [(400 + 100 * math.cos(a), 400 + 100 * math.sin(a)) for a in angles]
+
+    def noyau() -> None:
+        for x, y in cibles:
+            anim.meilleure_orientation(400, 400, x, y)
+
+    return noyau
+
+
+def prep_draw(nb: int) -> Callable[[], None]:
+    ecran = pygame.display.get_surface()
+    centre = (GAME_WIDTH / 2, GAME_HEIGHT / 2)
+    ennemis = ennemis_autour(nb, centre, 400, chemin_zigzag(50))
+    for i, e in enumerate(ennemis):
+        e.visible = i % 2 == 0
+        e.etat = (BAS, HAUT, COTE)[i % 3]
+        e.flip = i % 6 == 2
+
+    def noyau() -> None:
+        for e in ennemis:
+            e.draw(ecran)
+
+    return noyau
+
+
+# nom -> (préparation, paramètre qui varie, tailles par défaut)
+NOYAUX: Dict[str, Tuple[Preparation, str, List[int]]] = {
+    "Ennemi.seDeplacer": (prep_se_deplacer, "ennemis", [10, 100, 1000]),
+    "Ennemi.get_distance_restante": (
+        prep_distance_restante, "points_chemin", [10, 100, 1000]
+    ),
+    "Tour._choisir_cible": (_prep_choix_cible(Archer), "ennemis", [10, 100, 1000]),
+    "Tour._choisir_cible/tours": (prep_choix_cible_tours, "tours", [1, 10, 50]),
+    "Catapulte._choisir_cible": (
+        _prep_choix_cible(Catapulte), "ennemis", [10, 100, 1000]
+    ),
+    "Projectile.mettreAJour": (
+        prep_projectiles_mettre_a_jour, "projectiles", [10, 100, 1000]
+    ),
+    "Projectile.aTouche": (prep_projectiles_a_touche, "ennemis", [10, 100, 1000]),
+    "ProjectileTourMage.appliquerDegatsZone": (
+        prep_degats_zone, "ennemis", [10, 100, 1000]
+    ),
+    "cases_depuis_chemin": (prep_cases_depuis_chemin, "points_chemin", [10, 100, 1000]),
+    "AnimateurDirectionnel.meilleure_orientation": (
+        prep_meilleure_orientation, "appels", [10, 100, 1000]
+    ),
+    "Ennemi.draw": (prep_draw, "ennemis", [10, 100, 1000]),
+}
+
+
+# ------------------- EXÉCUTION -------------------
+
+
+def chronometrer(noyau: Callable[[], None], repetitions: int = 5) -> float:
+    """Retourne le temps d'un appel en secondes (meilleure série de `timeit`)."""
+    minuteur = timeit.Timer(noyau)
+    nombre, _ = minuteur.autorange()
+    return min(minuteur.repeat(repeat=repetitions, number=nombre)) / nombre
+
+
+def main() -> None:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Micro-benchmarks par noyau.")
+    parser.add_argument(
+        "--noyau", action="append", choices=sorted(NOYAUX),
+        help="noyau à mesurer (tous par défaut, option répétable)",
+    )
+    parser.add_argument("--tailles", help="tailles à mesurer, ex : 10,100,1000")
+    parser.add_argument("--repetitions", type=int, default=5, help="séries par mesure")
+    parser.add_argument("--sortie", help="fichier JSON de résultats")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    rapport = {"machine": informations_machine(), "noyaux": {}}
+    for nom in args.noyau or list(NOYAUX):
+        preparation, parametre, tailles = NOYAUX[nom]
+        if args.tailles:
+            tailles = [int(t) for t in args.tailles.split(",")]
+        courbe = []
+        for taille in tailles:
+            secondes = chronometrer(preparation(taille), args.repetitions)
+            courbe.append({parametre: taille, "temps_us": secondes * 1e6})
+            mesure = f"{parametre}={taille}"
+            print(f"{nom:<45}{mesure:<20}{secondes * 1e6:12.2f} µs")
+        rapport["noyaux"][nom] = courbe
+
+    sortie = args.sortie
+    if sortie is None:
+        os.makedirs(DOSSIER_RESULTATS, exist_ok=True)
+        horodatage = datetime.now().strftime("%Y%m%d-%H%M%S")
+        sortie = os.path.join(DOSSIER_RESULTATS, f"micro-{horodatage}.json")
+    with open(sortie, "w", encoding="utf-8") as f:
+        json.dump(rapport, f, indent=2)
+    print(f"Résultats : {sortie}")
+
+
+if __name__ == "__main__":
+    main()
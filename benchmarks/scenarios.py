@@ -0,0 +1,210 @@
+"""
+Scénarios de benchmark reproductibles (simulation et rendu).
+
+Chaque scénario prépare une partie (tours, vague) puis la fait tourner sans
+fenêtre, à pas fixe, pendant N ticks. On mesure les ticks par seconde, le
+temps moyen et le p99 d'un tick, le temps de rendu (pilote SDL « dummy »)
+et les allocations par tick (tracemalloc, sur une seconde passe plus courte
+pour ne pas fausser les temps). Les résultats sont écrits en JSON avec les
+informations de la machine, pour comparer les exécutions dans le temps.
+
+Depuis la racine du projet :
+
+    python benchmarks/scenarios.py
+    python benchmarks/scenarios.py --scenario nuit_12_feux --ticks 1200
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RACINE, "src"))
+
+import pygame  # noqa: E402
+
+from game import Game  # noqa: E402
+from headless import (  # noqa: E402
+    SimulationHeadless,
+    cases_bord_chemin,
+    cases_libres,
+    creer_partie,
+    repartir,
+)
+
+DOSSIER_RESULTATS = os.path.join(RACINE, "benchmarks", "resultats")
+
+
+# ------------------- OUTILS DE PRÉPARATION -------------------
+
+
+def placer_tours(game: Game, types: List[str], cases: List[Tuple[int, int]]) -> None:
+    """Place une tour par case, en répétant la liste des types dans l'ordre."""
+    game.joueur.argent = 10**9
+    for i, case in enumerate(cases):
+        game.tour_manager.placer_tour(case, types[i % len(types)])
+
+
+def lancer_vague_ennemis(game: Game, id_ennemi: int, nombre: int, ecart: float) -> None:
+    """Lance une vague de `nombre` ennemis du même type, espacés de `ecart` secondes."""
+    game.ennemi_manager.lancer_vague(
+        [(id_ennemi, round(i * ecart, 1)) for i in range(nombre)]
+    )
+
+
+# ------------------- SCÉNARIOS -------------------
+
+
+def vague_30_40_tours_mixtes(game: Game) -> None:
+    """Vague 30 du CSV contre 40 tours archer/catapulte/mage réparties sur la carte."""
+    placer_tours(
+        game, ["archer", "catapulte", "mage"], repartir(cases_libres(game), 40)
+    )
+    game.ennemi_manager.num_vague = 29
+    game.ennemi_manager.lancer_vague()
+
+
+def grille_archers_500_rats(game: Game) -> None:
+    """Toutes les cases libres occupées par des archers, contre 500 rats."""
+    placer_tours(game, ["archer"], cases_libres(game))
+    lancer_vague_ennemis(game, 2, 500, 0.1)
+
+
+def mages_10_zone(game: Game) -> None:
+    """10 tours de mage au bord du chemin qui enchaînent les dégâts de zone."""
+    placer_tours(game, ["mage"], repartir(cases_bord_chemin(game), 10))
+    lancer_vague_ennemis(game, 3, 300, 0.1)
+
+
+def nuit_12_feux(game: Game) -> None:
+    """Vague 10 de nuit avec 12 campements (éclairage) et quelques archers."""
+    bord = cases_bord_chemin(game)
+    placer_tours(game, ["campement"], repartir(bord, 12))
+    placer_tours(game, ["archer"], repartir(cases_bord_chemin(game), 8))
+    game.ennemi_manager.num_vague = 9
+    game.ennemi_manager.lancer_vague()
+
+
+SCENARIOS: Dict[str, Callable[[Game], None]] = {
+    "vague_30_40_tours_mixtes": vague_30_40_tours_mixtes,
+    "grille_archers_500_rats": grille_archers_500_rats,
+    "mages_10_zone": mages_10_zone,
+    "nuit_12_feux": nuit_12_feux,
+}
+
+
+# ------------------- EXÉCUTION -------------------
+
+
+def _preparer(nom: str) -> SimulationHeadless:
+    """Crée une partie neuve et la prépare pour le scénario."""
+    game, ecran = creer_partie()
+    SCENARIOS[nom](game)
+    return SimulationHeadless(game, ecran)
+
+
+def mesurer_allocations(nom: str, nb_ticks: int) -> Dict[str, float]:
+    """
+    Mesure les allocations par tick avec tracemalloc.
+
+    Returns:
+        Pic moyen d'octets alloués pendant un tick et variation nette de blocs
+    """
+    simulation = _preparer(nom)
+    tracemalloc.start()
+    pics = []
+    debut_blocs = sys.getallocatedblocks()
+    for _ in range(nb_ticks):
+        if simulation.est_terminee():
+            break
+        courant, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        simulation.tick()
+        _, pic = tracemalloc.get_traced_memory()
+        pics.append(pic - courant)
+    blocs = sys.getallocatedblocks() - debut_blocs
+    tracemalloc.stop()
+    ticks = max(1, len(pics))
+    return {
+        "pic_octets_par_tick": sum(pics) / ticks,
+        "blocs_nets_par_tick": blocs / ticks,
+    }
+
+
+def executer_scenario(nom: str, nb_ticks: int, ticks_allocations: int) -> Dict:
+    """Exécute un scénario et retourne ses mesures."""
+    simulation = _preparer(nom)
+    resultats = simulation.executer(nb_ticks)
+    if ticks_allocations > 0:
+        resultats.update(mesurer_allocations(nom, ticks_allocations))
+    return resultats
+
+
+def informations_machine() -> Dict[str, str]:
+    """Décrit la machine et la version du code pour rendre les résultats comparables."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=RACINE, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "inconnu"
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "plateforme": platform.platform(),
+        "processeur": platform.processor() or platform.machine(),
+        "coeurs": str(os.cpu_count()),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(v) for v in pygame.get_sdl_version()),
+        "pilote_video": os.environ.get("SDL_VIDEODRIVER", ""),
+    }
+
+
+def main() -> None:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Benchmarks par scénario.")
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(SCENARIOS),
+        help="scénario à exécuter (tous par défaut, option répétable)",
+    )
+    parser.add_argument("--ticks", type=int, default=1800, help="ticks par scénario")
+    parser.add_argument(
+        "--ticks-allocations", type=int, default=300,
+        help="ticks mesurés sous tracemalloc (0 pour désactiver)",
+    )
+    parser.add_argument("--sortie", help="fichier JSON de résultats")
+    args = parser.parse_args()
+
+    noms = args.scenario or list(SCENARIOS)
+    rapport = {"machine": informations_machine(), "ticks": args.ticks, "scenarios": {}}
+    for nom in noms:
+        print(f"{nom}...", flush=True)
+        mesures = executer_scenario(nom, args.ticks, args.ticks_allocations)
+        rapport["scenarios"][nom] = mesures
+        print(
+            f"  {mesures['ticks_par_seconde']:.1f} ticks/s, "
+            f"tick {mesures['tick_moyen_ms']:.2f} ms "
+            f"(p99 {mesures['tick_p99_ms']:.2f}), "
+            f"rendu {mesures['rendu_moyen_ms']:.2f} ms"
+        )
+
+    sortie = args.sortie
+    if sortie is None:
+        os.makedirs(DOSSIER_RESULTATS, exist_ok=True)
+        horodatage = datetime.now().strftime("%Y%m%d-%H%M%S")
+        sortie = os.path.join(DOSSIER_RESULTATS, f"scenarios-{horodatage}.json")
+    with open(sortie, "w", encoding="utf-8") as f:
+        json.dump(rapport, f, indent=2)
+    print(f"Résultats : {sortie}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Suivi des allocations mémoire par frame, avec `tracemalloc`.
+
+Mode de diagnostic, inactif par défaut (touche F4 en jeu, `--allocations`
+en simulation sans fenêtre). Une fois activé, il mesure :
+
+- par phase de la boucle (les mêmes que le moniteur de performance), le pic
+  de mémoire au-dessus du niveau de départ de la phase : c'est la place prise
+  par les objets temporaires (listes en compréhension, `Position` créées à la
+  volée, copies de surfaces) ;
+- ligne par ligne, sur une frame échantillon toutes les
+  `INTERVALLE_ECHANTILLONS` frames : les blocs alloués par chaque ligne
+  exécutée, qu'ils soient libérés plus loin dans la frame ou non, et le pic
+  de mémoire de la ligne. Un traceur de lignes (`sys.settrace`) relève
+  `sys.getallocatedblocks()` et le pic de `tracemalloc` entre deux lignes ;
+  les totaux sont rangés par sous-système (ennemi, tour, projectile, ui,
+  boutique, audio) d'après le fichier de la ligne.
+
+Le traceur ralentit beaucoup la frame échantillon, d'où l'intervalle. Ce
+qu'alloue une fonction C (copie de surface, `sorted`...) compte pour la ligne
+Python qui l'appelle ; un objet créé puis libéré sur une même ligne ne compte
+que dans le pic de cette ligne. `tracemalloc` ne voit que les allocations de
+Python : les pixels des surfaces pygame (alloués par SDL) n'apparaissent qu'à
+travers l'objet `Surface` qui les porte.
+"""
+
+import os
+import sys
+import tracemalloc
+from collections import Counter, deque
+from types import FrameType
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# Nombre de frames conservées pour les moyennes (~2 s à 60 FPS)
+TAILLE_FENETRE_ALLOCATIONS: int = 120
+# Nombre de lignes signalées dans le rapport
+NB_SITES_SIGNALES: int = 8
+# Frames entre deux frames échantillons (suivies ligne par ligne)
+INTERVALLE_ECHANTILLONS: int = 30
+
+# Sous-système de chaque fichier (chemins relatifs à src/)
+SOUS_SYSTEMES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "ennemi",
+        ("models/ennemi.py", "managers/ennemi_manager.py", "classes/types_ennemis.py"),
+    ),
+    (
+        "tour",
+        (
+            "models/tour.py",
+            "managers/tour_manager.py",
+            "classes/animation.py",
+            "classes/couverture.py",
+        ),
+    ),
+    ("projectile", ("models/projectile.py",)),
+    (
+        "ui",
+        (
+            "managers/ui_manager.py",
+            "classes/rendu.py",
+            "classes/polices.py",
+            "classes/bouton.py",
+            "classes/pointeur.py",
+            "classes/menu.py",
+        ),
+    ),
+    ("boutique", ("managers/shop_manager.py",)),
+    ("audio", ("managers/audio_manager.py", "classes/cache_audio.py")),
+)
+
+_DOSSIER_SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Fichier du module, tel que vu par le traceur (lignes du suivi ignorées)
+_CE_FICHIER = __file__
+
+# Fichier absolu -> (chemin affiché, sous-système)
+_fichiers: Dict[str, Tuple[str, str]] = {}
+
+
+def sous_systeme(fichier: str) -> Tuple[str, str]:
+    """
+    Retourne le chemin court d'un fichier et son sous-système.
+
+    Returns:
+        (chemin relatif à src/ ou nom du fichier, sous-système) ; les autres
+        fichiers du jeu sont rangés dans « jeu », le reste dans « autre »
+    """
+    connu = _fichiers.get(fichier)
+    if connu is not None:
+        return connu
+    relatif = os.path.relpath(fichier, _DOSSIER_SRC).replace(os.sep, "/")
+    if relatif.startswith(".."):
+        connu = (os.path.basename(fichier), "autre")
+    else:
+        nom = next(
+            (nom for nom, fichiers in SOUS_SYSTEMES if relatif in fichiers), "jeu"
+        )
+        connu = (relatif, nom)
+    _fichiers[fichier] = connu
+    return connu
+
+
+class SuiviAllocations:
+    """Compte les allocations par phase, par sous-système et par ligne."""
+
+    def __init__(
+        self,
+        taille_fenetre: int = TAILLE_FENETRE_ALLOCATIONS,
+        intervalle: int = INTERVALLE_ECHANTILLONS,
+    ) -> None:
+        """
+        Args:
+            taille_fenetre: Nombre de mesures gardées par phase et sous-système
+            intervalle: Frames entre deux frames échantillons (1 : chaque frame)
+        """
+        self.actif = False
+        self.taille_fenetre = taille_fenetre
+        self.intervalle = max(1, intervalle)
+        self._frames_echantillon = 0
+        self._demarre_ici = False
+        self._niveau = 0
+        # Nombre de frames échantillons mesurées
+        self.frames = 0
+        # Pics par phase (octets) et (blocs, octets) par frame et sous-système
+        self._pics: Dict[str, Deque[int]] = {}
+        self._par_frame: Dict[str, Deque[Tuple[float, float]]] = {}
+        # (fichier, ligne, sous-système) -> blocs cumulés, frames où la ligne alloue
+        self._blocs_sites: Counter = Counter()
+        self._frames_sites: Counter = Counter()
+
+        # Frame échantillon en cours : (fichier, ligne) -> blocs, octets
+        self._trace = False
+        self._blocs_frame: Counter = Counter()
+        self._octets_frame: Counter = Counter()
+        # Ligne en cours de mesure (None : hors du code suivi) et son départ
+        self._site: Optional[Tuple[str, int]] = None
+        self._blocs_ligne = 0
+        self._niveau_ligne = 0
+        # Pic de la phase en cours (le traceur remet le pic à zéro à chaque ligne)
+        self._pic_phase = 0
+
+    def demarrer(self) -> None:
+        """Active le suivi (démarre tracemalloc s'il ne tourne pas déjà)."""
+        if self.actif:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._demarre_ici = True
+        self.actif = True
+        # La première frame après l'activation est un échantillon
+        self._frames_echantillon = self.intervalle - 1
+        self.frames = 0
+        self._pics.clear()
+        self._par_frame.clear()
+        self._blocs_sites.clear()
+        self._frames_sites.clear()
+        self.depart()
+
+    def arreter(self) -> None:
+        """Désactive le suivi (les mesures restent consultables)."""
+        if not self.actif:
+            return
+        self._arreter_trace()
+        self.actif = False
+        if self._demarre_ici:
+            tracemalloc.stop()
+            self._demarre_ici = False
+
+    def basculer(self) -> None:
+        """Active ou désactive le suivi."""
+        if self.actif:
+            self.arreter()
+        else:
+            self.demarrer()
+
+    def depart(self) -> None:
+        """Prend le niveau de mémoire courant comme départ de la phase suivante."""
+        if not self.actif:
+            return
+        self._niveau = tracemalloc.get_traced_memory()[0]
+        self._pic_phase = 0
+        tracemalloc.reset_peak()
+
+    def noter(self, phase: str) -> None:
+        """Enregistre le pic de mémoire de la phase qui se termine."""
+        if not self.actif:
+            return
+        courant, pic = tracemalloc.get_traced_memory()
+        pics = self._pics.get(phase)
+        if pics is None:
+            pics = self._pics[phase] = deque(maxlen=self.taille_fenetre)
+        pics.append(max(0, max(pic, self._pic_phase) - self._niveau))
+        self._niveau = courant
+        self._pic_phase = 0
+        tracemalloc.reset_peak()
+
+    def fin_frame(self) -> None:
+        """Clôt la frame échantillon en cours et lance la suivante au besoin."""
+        if not self.actif:
+            return
+        if self._trace:
+            self._arreter_trace()
+            self._enregistrer_frame()
+        self._frames_echantillon += 1
+        if self._frames_echantillon >= self.intervalle:
+            self._frames_echantillon = 0
+            self._demarrer_trace()
+        # Le temps passé ici ne compte pas dans la phase suivante
+        self.depart()
+
+    # ------------------- TRACEUR DE LIGNES -------------------
+
+    def _demarrer_trace(self) -> None:
+        """Suit chaque ligne exécutée jusqu'à la prochaine fin de frame."""
+        if sys.gettrace() is not None:
+            return  # un débogueur ou une mesure de couverture trace déjà
+        self._blocs_frame.clear()
+        self._octets_frame.clear()
+        self._site = None
+        self._trace = True
+        # Les fonctions déjà en cours (boucle de jeu) sont suivies aussi
+        cadre: Optional[FrameType] = sys._getframe(1)
+        while cadre is not None:
+            if cadre.f_code.co_filename != _CE_FICHIER:
+                cadre.f_trace = self._tracer
+            cadre = cadre.f_back
+        sys.settrace(self._tracer)
+        self._ouvrir_ligne()
+
+    def _arreter_trace(self) -> None:
+        if not self._trace:
+            return
+        sys.settrace(None)
+        cadre: Optional[FrameType] = sys._getframe(1)
+        while cadre is not None:
+            cadre.f_trace = None
+            cadre = cadre.f_back
+        self._trace = False
+        self._site = None
+
+    def _tracer(
+        self, cadre: FrameType, evenement: str, _arg: Any
+    ) -> Optional[Callable]:
+        """Fonction de trace : attribue l'écart depuis l'événement précédent."""
+        blocs = sys.getallocatedblocks()
+        pic = tracemalloc.get_traced_memory()[1]
+        self._clore_ligne(blocs, pic)
+        if cadre.f_code.co_filename == _CE_FICHIER:
+            # Méthodes du suivi appelées par la boucle : hors mesure
+            self._site = None
+            self._ouvrir_ligne()
+            return None
+        if evenement == "return":
+            # La suite de la ligne appelante lui revient
+            appelant = cadre.f_back
+            self._site = None
+            if appelant is not None and appelant.f_code.co_filename != _CE_FICHIER:
+                self._site = (appelant.f_code.co_filename, appelant.f_lineno)
+        elif evenement == "call":
+            self._site = None
+        else:
+            self._site = (cadre.f_code.co_filename, cadre.f_lineno)
+        self._ouvrir_ligne()
+        return self._tracer
+
+    def _clore_ligne(self, blocs: int, pic: int) -> None:
+        if pic > self._pic_phase:
+            self._pic_phase = pic
+        site = self._site
+        if site is None:
+            return
+        nouveaux = blocs - self._blocs_ligne
+        if nouveaux > 0:
+            self._blocs_frame[site] += nouveaux
+        octets = pic - self._niveau_ligne
+        if octets > 0:
+            self._octets_frame[site] += octets
+
+    def _ouvrir_ligne(self) -> None:
+        self._niveau_ligne = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        # Lu en dernier : les objets créés ci-dessus ne comptent pas
+        self._blocs_ligne = sys.getallocatedblocks()
+
+    def _enregistrer_frame(self) -> None:
+        """Ajoute la frame échantillon aux totaux par sous-système et par ligne."""
+        totaux = {nom: [0, 0] for nom, _ in SOUS_SYSTEMES}
+        for (fichier, _), octets in self._octets_frame.items():
+            nom = sous_systeme(fichier)[1]
+            totaux.setdefault(nom, [0, 0])[1] += octets
+        for (fichier, ligne), blocs in self._blocs_frame.items():
+            chemin, nom = sous_systeme(fichier)
+            totaux.setdefault(nom, [0, 0])[0] += blocs
+            site = (chemin, ligne, nom)
+            self._blocs_sites[site] += blocs
+            self._frames_sites[site] += 1
+        for nom, (blocs, octets) in totaux.items():
+            mesures = self._par_frame.get(nom)
+            if mesures is None:
+                mesures = self._par_frame[nom] = deque(maxlen=self.taille_fenetre)
+            mesures.append((blocs, octets))
+        self.frames += 1
+        self._blocs_frame.clear()
+        self._octets_frame.clear()
+
+    # ------------------- RÉSULTATS -------------------
+
+    def statistiques_phases(self) -> List[Tuple[str, float, int]]:
+        """
+        Pic de mémoire temporaire de chaque phase.
+
+        Returns:
+            Liste de (phase, pic moyen en octets, pic maximal en octets)
+        """
+        return [
+            (phase, sum(pics) / len(pics), max(pics))
+            for phase, pics in self._pics.items()
+            if pics
+        ]
+
+    def statistiques_sous_systemes(self) -> List[Tuple[str, float, float]]:
+        """
+        Allocations d'une frame, par sous-système (moyenne des échantillons).
+
+        Returns:
+            Liste de (sous-système, blocs alloués par frame, somme des pics des
+            lignes en octets par frame)
+        """
+        resultats = []
+        for nom, mesures in self._par_frame.items():
+            if not mesures:
+                continue
+            n = len(mesures)
+            resultats.append(
+                (nom, sum(m[0] for m in mesures) / n, sum(m[1] for m in mesures) / n)
+            )
+        return resultats
+
+    def sites_principaux(
+        self, nombre: int = NB_SITES_SIGNALES
+    ) -> List[Tuple[str, str, int, float]]:
+        """
+        Lignes qui allouent le plus de blocs par frame depuis l'activation.
+
+        Returns:
+            Liste de (« fichier:ligne », sous-système, frames échantillons où
+            la ligne a alloué, blocs alloués par frame échantillon), par nombre
+            de blocs décroissant
+        """
+        frames = max(1, self.frames)
+        resultats = []
+        for site, blocs in self._blocs_sites.most_common(nombre):
+            chemin, ligne, nom = site
+            resultats.append(
+                (f"{chemin}:{ligne}", nom, self._frames_sites[site], blocs / frames)
+            )
+        return resultats
+
+    def rapport(self) -> Dict[str, object]:
+        """Résumé des mesures, sérialisable en JSON."""
+        return {
+            "frames": self.frames,
+            "phases": {
+                phase: {"pic_moyen_octets": round(moyen), "pic_max_octets": maximum}
+                for phase, moyen, maximum in self.statistiques_phases()
+            },
+            "sous_systemes": {
+                nom: {
+                    "blocs_par_frame": round(blocs, 2),
+                    "octets_par_frame": round(octets, 1),
+                }
+                for nom, blocs, octets in self.statistiques_sous_systemes()
+            },
+            "sites": [
+                {
+                    "site": site,
+                    "sous_systeme": nom,
+                    "frames": frames,
+                    "blocs_par_frame": round(blocs, 2),
+                }
+                for site, nom, frames, blocs in self.sites_principaux()
+            ],
+        }
@@ -3,8 +3,15 @@ from typing import Dict, List, Optional, Tuple
 
 import pygame
 
+from classes.rendu import FileRendu, surface_retournee
 from classes.sprites import charger_image_simple, decouper_sprite
 
+# Frames déjà chargées, partagées entre les animateurs d'un même personnage :
+# (dossier, frames par état, total désiré, directions) -> (frames, sprite par état)
+_frames_partagees: Dict[
+    tuple, Tuple[Dict[Tuple[str, str], List[pygame.Surface]], Dict[str, bool]]
+] = {}
+
 
 def _obtenir_racine_projet() -> str:
     """Retourne le chemin racine du projet."""
@@ -255,13 +262,31 @@ class AnimateurDirectionnel:
         return resultat
 
     def _charger_toutes_animations(self) -> None:
-        """Charge toutes les animations pour toutes les directions."""
+        """
+        Charge toutes les animations pour toutes les directions.
+
+        Les frames sont chargées une fois par personnage et partagées (en
+        lecture seule) par toutes ses tours : elles ont la même texture et se
+        regroupent dans la file de rendu.
+        """
+        cle = (
+            self.chemin_personnage_base,
+            tuple(sorted(self.frames_par_etat.items())),
+            self.total_frames_desire,
+            self.directions,
+        )
+        partage = _frames_partagees.get(cle)
+        if partage is not None:
+            self.frames, self._a_sprite_par_etat = partage
+            return
+
         for direction in self.directions:
             animations = self._charger_pour_direction(direction)
             for etat in self.ordre_etats:
                 self.frames[(direction, etat)] = animations.get(
                     etat, animations.get("Idle", [])
                 )
+        _frames_partagees[cle] = (self.frames, self._a_sprite_par_etat)
 
     def demarrer(
         self, etat: str, direction: Optional[str] = None, flip_x: Optional[bool] = None
@@ -294,6 +319,23 @@ class AnimateurDirectionnel:
         self.direction = direction
         self.flip_x = flip_x if direction in ("S", "DS", "US") else False
 
+    def caler_sur_horloge(self, temps_s: float) -> None:
+        """
+        Place une animation en boucle sur la frame qu'indique l'horloge de jeu.
+
+        Sert aux personnages qui ne sont plus mis à jour (tours en veille) :
+        la frame est déduite du temps au moment du dessin.
+
+        Args:
+            temps_s: Temps de jeu en secondes
+        """
+        if self.etat not in self.etats_en_boucle:
+            return
+        frames = self.frames.get((self.direction, self.etat), [])
+        if frames:
+            duree_frame = self.durees.get(self.etat, 0.1)
+            self.index = int(temps_s / duree_frame) % len(frames)
+
     def mettre_a_jour(self, dt: float) -> bool:
         """
         Met à jour l'animation.
@@ -329,29 +371,39 @@ class AnimateurDirectionnel:
 
         return termine
 
-    def dessiner(self, surface: pygame.Surface, centre_x: int, base_y: int) -> None:
-        """
-        Dessine l'animation sur la surface.
-
-        Args:
-            surface: Surface de destination
-            centre_x: Position X du centre du personnage
-            base_y: Position Y de la base du personnage
-        """
+    def _image(self, centre_x: int, base_y: int):
+        """Frame courante (retournée si besoin) et son coin haut-gauche, ou None."""
         frames = self.frames.get((self.direction, self.etat), [])
         if not frames:
-            return
+            return None
 
         image = frames[self.index]
 
         # Application de l'inversion horizontale si nécessaire
         if self.flip_x:
-            image = pygame.transform.flip(image, True, False)
+            image = surface_retournee(image)
 
         # Positionnement centré en bas
-        rect = image.get_rect()
-        rect.midbottom = (centre_x, base_y)
-        surface.blit(image, rect)
+        return image, (centre_x - image.get_width() // 2, base_y - image.get_height())
+
+    def dessiner(self, surface: pygame.Surface, centre_x: int, base_y: int) -> None:
+        """
+        Dessine l'animation sur la surface.
+
+        Args:
+            surface: Surface de destination
+            centre_x: Position X du centre du personnage
+            base_y: Position Y de la base du personnage
+        """
+        image = self._image(centre_x, base_y)
+        if image is not None:
+            surface.blit(*image)
+
+    def preparer_rendu(self, file: FileRendu, centre_x: int, base_y: int) -> None:
+        """Ajoute la frame courante à une file de rendu (voir `dessiner`)."""
+        image = self._image(centre_x, base_y)
+        if image is not None:
+            file.ajouter(*image)
 
     def meilleure_orientation(
         self, src_x: float, src_y: float, dst_x: float, dst_y: float
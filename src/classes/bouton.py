@@ -1,5 +1,7 @@
 import pygame
 
+from classes.polices import rendre_texte
+
 
 # ------------------- CLASSE BOUTON -------------------
 class Bouton:
@@ -47,7 +49,7 @@ class Bouton:
         pygame.draw.rect(ecran, self.couleurs["contour"], self.rect, 3)
 
         # Dessine le texte centré
-        surface_texte = self.police.render(self.texte, True, self.couleurs["texte"])
+        surface_texte = rendre_texte(self.police, self.texte, self.couleurs["texte"])
         ecran.blit(surface_texte, surface_texte.get_rect(center=self.rect.center))
 
     def gerer_evenement(self, event: pygame.event.Event) -> None:
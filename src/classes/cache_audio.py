@@ -0,0 +1,134 @@
+"""
+Cache disque des bruitages décodés.
+
+Les MP3 de assets/audio/bruitage sont décodés une seule fois par pygame, puis
+leurs échantillons bruts (PCM, au format du mixer) sont écrits dans
+`.cache/audio`. Les lancements suivants relisent directement ce PCM, sans
+décodage. La clé d'un fichier dépend de la date de modification de la source
+et du format du mixer : un MP3 modifié ou un mixer configuré autrement
+invalide l'entrée.
+"""
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+from classes.constants import CACHE_DIR
+
+CACHE_AUDIO_DIR = os.path.join(CACHE_DIR, "audio")
+
+# Nombre de fichiers lus/écrits en parallèle pendant le chargement
+NB_THREADS_AUDIO = 4
+
+# Sons déjà construits pendant la session (réutilisés au redémarrage d'une partie)
+_sons_charges: Dict[Tuple[str, str], pygame.mixer.Sound] = {}
+
+
+def _nom_cache(chemin_source: str, format_mixer: Tuple[int, int, int]) -> str:
+    """Construit le nom du fichier PCM pour une source et un format de mixer."""
+    nom = os.path.basename(chemin_source)
+    mtime = os.stat(chemin_source).st_mtime_ns
+    frequence, taille, canaux = format_mixer
+    return f"{nom}-{mtime}-{frequence}-{taille}-{canaux}.pcm"
+
+
+def _lire(chemin_source: str, chemin_pcm: str) -> Tuple[bool, Optional[bytes]]:
+    """
+    Lit le PCM en cache s'il existe, sinon le fichier source compressé.
+
+    Returns:
+        (est_pcm, contenu) ; contenu vaut None si aucune lecture n'a abouti
+    """
+    try:
+        with open(chemin_pcm, "rb") as f:
+            return True, f.read()
+    except OSError:
+        pass
+    try:
+        with open(chemin_source, "rb") as f:
+            return False, f.read()
+    except OSError:
+        return False, None
+
+
+def _ecrire(chemin_pcm: str, nom_source: str, donnees: bytes) -> None:
+    """Écrit un fichier PCM de façon atomique et supprime les versions périmées."""
+    try:
+        os.makedirs(CACHE_AUDIO_DIR, exist_ok=True)
+        temporaire = chemin_pcm + ".tmp"
+        with open(temporaire, "wb") as f:
+            f.write(donnees)
+        os.replace(temporaire, chemin_pcm)
+
+        # Les entrées de la même source avec une autre clé ne servent plus
+        nom_pcm = os.path.basename(chemin_pcm)
+        for ancien in os.listdir(CACHE_AUDIO_DIR):
+            if ancien.startswith(nom_source + "-") and ancien != nom_pcm:
+                os.remove(os.path.join(CACHE_AUDIO_DIR, ancien))
+    except OSError:
+        # Le cache est facultatif : le son reste utilisable sans lui
+        pass
+
+
+def charger_sons(chemins: Iterable[str]) -> Dict[str, pygame.mixer.Sound]:
+    """
+    Charge une liste de bruitages en passant par le cache PCM.
+
+    Les lectures et écritures disque se font dans un pool de threads ; la
+    construction des `pygame.mixer.Sound` reste sur le thread principal.
+
+    Args:
+        chemins: Chemins des fichiers sources (MP3, WAV, OGG...)
+
+    Returns:
+        Dictionnaire {nom de fichier: Sound} des sons chargés avec succès
+    """
+    format_mixer = pygame.mixer.get_init()
+    if not format_mixer:
+        return {}
+    format_mixer = tuple(format_mixer[:3])
+
+    sons: Dict[str, pygame.mixer.Sound] = {}
+    a_lire = []
+    for chemin in chemins:
+        try:
+            nom_pcm = _nom_cache(chemin, format_mixer)
+        except OSError:
+            continue
+        son = _sons_charges.get((chemin, nom_pcm))
+        if son is not None:
+            sons[os.path.basename(chemin)] = son
+        else:
+            a_lire.append((chemin, nom_pcm))
+
+    if not a_lire:
+        return sons
+
+    with ThreadPoolExecutor(max_workers=NB_THREADS_AUDIO) as pool:
+        lectures = pool.map(
+            lambda c: _lire(c[0], os.path.join(CACHE_AUDIO_DIR, c[1])), a_lire
+        )
+        for (chemin, nom_pcm), (est_pcm, contenu) in zip(a_lire, list(lectures)):
+            if contenu is None:
+                continue
+            try:
+                if est_pcm:
+                    son = pygame.mixer.Sound(buffer=contenu)
+                else:
+                    # Premier chargement : décodage puis mise en cache du PCM
+                    son = pygame.mixer.Sound(file=io.BytesIO(contenu))
+                    pool.submit(
+                        _ecrire,
+                        os.path.join(CACHE_AUDIO_DIR, nom_pcm),
+                        os.path.basename(chemin),
+                        son.get_raw(),
+                    )
+            except Exception:
+                continue
+            _sons_charges[(chemin, nom_pcm)] = son
+            sons[os.path.basename(chemin)] = son
+
+    return sons
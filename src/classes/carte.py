@@ -0,0 +1,186 @@
+"""
+Carte du jeu compilée : tout ce qu'on tire du fichier Tiled, lu une seule fois.
+
+`charger_carte` lit la carte (.tmx via pytmx, ou .tmj exporté en JSON) et en
+tire un `CarteJeu` immuable : image de fond, chemins des ennemis, grille des
+cases interdites, cases du château et points d'apparition. Le résultat est
+gardé en mémoire pour la session et sérialisé (pickle) dans `.cache/` : tant
+que la carte n'est pas modifiée, les lancements suivants ne la relisent pas.
+La partie, les ennemis et les outils sans fenêtre partagent ainsi le même
+objet.
+"""
+
+import json
+import os
+import pickle
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+
+from classes.constants import (
+    CACHE_DIR,
+    CASES_CHATEAU,
+    CASES_RESERVEES,
+    GRID_COLS,
+    GRID_ROWS,
+    MAP_TMX,
+    PROJECT_ROOT,
+    TILE_SIZE,
+)
+from classes.position import Position
+from classes.utils import cases_depuis_chemin
+
+# À incrémenter si le contenu de CarteJeu change
+VERSION_CARTE = 1
+
+Point = Tuple[float, float]
+
+# Cartes déjà chargées pendant la session : fichier -> (mtime, carte)
+_cartes: Dict[str, Tuple[int, "CarteJeu"]] = {}
+
+
+class CarteJeu(NamedTuple):
+    """Données immuables d'une carte, prêtes à l'emploi."""
+
+    source: str
+    fond: str  # image de fond (PNG pré-rendu à côté de la carte)
+    taille_case: int
+    colonnes: int
+    lignes: int
+    chemins: Tuple[Tuple[Point, ...], ...]  # un polygone par objet du calque « path »
+    grille_bannie: bytes  # un bit par case, ligne par ligne
+    cases_chateau: FrozenSet[Tuple[int, int]]
+    points_apparition: Tuple[Point, ...]
+
+    def positions_chemin(self, indice: int = 0) -> List[Position]:
+        """Points d'un chemin, en Positions neuves (modifiables par l'appelant)."""
+        return [Position(x, y) for x, y in self.chemins[indice]]
+
+    def est_bannie(self, case: Tuple[int, int]) -> bool:
+        """Retourne True si on ne peut pas construire sur la case."""
+        x, y = case
+        if not (0 <= x < self.colonnes and 0 <= y < self.lignes):
+            return False
+        i = y * self.colonnes + x
+        return bool(self.grille_bannie[i >> 3] & (1 << (i & 7)))
+
+    def cases_bannies(self) -> set:
+        """Cases interdites, dans un set neuf."""
+        return {
+            (x, y)
+            for y in range(self.lignes)
+            for x in range(self.colonnes)
+            if self.est_bannie((x, y))
+        }
+
+
+def _lire_chemins_tmx(chemin_fichier: str) -> List[List[Point]]:
+    """Lit les polygones du calque « path » d'une carte .tmx avec pytmx."""
+    import pytmx
+
+    carte = pytmx.TiledMap(chemin_fichier)
+    calque = carte.get_layer_by_name("path")
+    return [
+        [(p.x, p.y) for p in objet.points]
+        for objet in calque
+        if getattr(objet, "points", None)
+    ]
+
+
+def _lire_chemins_tmj(chemin_fichier: str) -> List[List[Point]]:
+    """Lit les polygones du calque « path » d'une carte .tmj (JSON)."""
+    with open(chemin_fichier, "r", encoding="utf-8") as f:
+        donnees = json.load(f)
+    calque = next(
+        (
+            c
+            for c in donnees["layers"]
+            if c["type"] == "objectgroup" and c["name"] == "path"
+        ),
+        None,
+    )
+    if calque is None:
+        raise ValueError(f"Calque 'path' introuvable dans {chemin_fichier}")
+    return [
+        [(o["x"] + p["x"], o["y"] + p["y"]) for p in o["polygon"]]
+        for o in calque["objects"]
+        if "polygon" in o
+    ]
+
+
+def compiler_carte(chemin_fichier: str) -> CarteJeu:
+    """
+    Lit un fichier Tiled et construit la carte compilée (sans cache).
+
+    Raises:
+        ValueError: Si la carte n'a pas de chemin
+    """
+    if chemin_fichier.endswith(".tmx"):
+        chemins = _lire_chemins_tmx(chemin_fichier)
+    else:
+        chemins = _lire_chemins_tmj(chemin_fichier)
+    if not chemins or len(chemins[0]) < 2:
+        raise ValueError(f"Aucun chemin (calque 'path') dans {chemin_fichier}")
+
+    colonnes, lignes = GRID_COLS, GRID_ROWS
+    bannies = set(CASES_RESERVEES)
+    for chemin in chemins:
+        positions = [Position(x, y) for x, y in chemin]
+        bannies |= cases_depuis_chemin(positions, TILE_SIZE)
+    grille = bytearray((colonnes * lignes + 7) // 8)
+    for x, y in bannies:
+        if 0 <= x < colonnes and 0 <= y < lignes:
+            i = y * colonnes + x
+            grille[i >> 3] |= 1 << (i & 7)
+
+    return CarteJeu(
+        source=chemin_fichier,
+        fond=os.path.splitext(chemin_fichier)[0] + ".png",
+        taille_case=TILE_SIZE,
+        colonnes=colonnes,
+        lignes=lignes,
+        chemins=tuple(tuple(chemin) for chemin in chemins),
+        grille_bannie=bytes(grille),
+        cases_chateau=frozenset(CASES_CHATEAU),
+        points_apparition=tuple(chemin[0] for chemin in chemins),
+    )
+
+
+def charger_carte(chemin_fichier: str = MAP_TMX) -> CarteJeu:
+    """
+    Retourne la carte compilée, lue une seule fois par session et mise en cache.
+
+    Args:
+        chemin_fichier: Carte Tiled (.tmx ou .tmj)
+    """
+    if not os.path.isabs(chemin_fichier):
+        chemin_fichier = os.path.join(PROJECT_ROOT, chemin_fichier)
+    mtime = os.stat(chemin_fichier).st_mtime_ns
+    en_memoire = _cartes.get(chemin_fichier)
+    if en_memoire is not None and en_memoire[0] == mtime:
+        return en_memoire[1]
+
+    nom = os.path.basename(chemin_fichier).replace(".", "-")
+    fichier_cache = os.path.join(
+        CACHE_DIR, f"carte-{nom}-{mtime}-v{VERSION_CARTE}.pickle"
+    )
+    carte = None
+    try:
+        with open(fichier_cache, "rb") as f:
+            carte = pickle.load(f)
+        if not isinstance(carte, CarteJeu) or carte.source != chemin_fichier:
+            carte = None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+        carte = None
+
+    if carte is None:
+        carte = compiler_carte(chemin_fichier)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temporaire = f"{fichier_cache}.{os.getpid()}.tmp"
+            with open(temporaire, "wb") as f:
+                pickle.dump(carte, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporaire, fichier_cache)
+        except OSError:
+            pass
+
+    _cartes[chemin_fichier] = (mtime, carte)
+    return carte
@@ -14,6 +14,8 @@ AUDIO_DIR = os.path.join(ASSETS_DIR, "audio")
 MONEY_DIR = os.path.join(ASSETS_DIR, "money")
 HEART_DIR = os.path.join(ASSETS_DIR, "heart")
 TOWER_DIR = os.path.join(ASSETS_DIR, "tower")
+# Données générées localement (caches), non versionnées
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache")
 
 # Ecran / grille
 TILE_SIZE: int = 64
@@ -26,6 +28,10 @@ SPELLS_HEIGHT: int = 200
 WINDOW_WIDTH: int = GAME_WIDTH + SHOP_WIDTH  # 1168
 WINDOW_HEIGHT: int = GAME_HEIGHT + SPELLS_HEIGHT
 FPS: int = 60
+# Vitesses de jeu proposées (pas de simulation par frame affichée)
+VITESSES_JEU: Tuple[int, ...] = (1, 2, 4, 8)
+# Priorité minimale des bruitages joués à chaque vitesse (les autres sont sautés)
+PRIORITE_SFX_PAR_VITESSE: Dict[int, int] = {1: 0, 2: 2, 4: 2, 8: 3}
 GAME_NAME: str = "Protect The Castle"
 
 # Couleurs UI (R, G, B)
@@ -49,8 +55,16 @@ HEART_ANIM_INTERVAL_MS: int = 120
 
 # Chemins de fichiers fréquemment utilisés
 MAP_TILESET_TMJ: str = os.path.join(TILESETS_DIR, "carte.tmj")
+MAP_TMX: str = os.path.join(TILESETS_DIR, "carte.tmx")
 MAP_PNG: str = os.path.join(TILESETS_DIR, "carte.png")
 
+# Cases du château : un ennemi qui y entre fait perdre des PV au joueur
+CASES_CHATEAU: Tuple[Tuple[int, int], ...] = ((2, 0), (3, 0))
+# Cases non constructibles hors chemin (x=0..5 sur les deux premières lignes)
+CASES_RESERVEES: Tuple[Tuple[int, int], ...] = tuple(
+    (x, y) for y in (0, 1) for x in range(6)
+)
+
 # Valeurs par défaut / listes partagées
 DEFAULT_TOWER_TYPES = ["archer", "catapulte", "mage", "campement"]
 
@@ -77,6 +91,7 @@ __all__ = [
     "MONEY_DIR",
     "HEART_DIR",
     "TOWER_DIR",
+    "CACHE_DIR",
     "TILE_SIZE",
     "GRID_COLS",
     "GRID_ROWS",
@@ -86,10 +101,15 @@ __all__ = [
     "WINDOW_WIDTH",
     "WINDOW_HEIGHT",
     "FPS",
+    "VITESSES_JEU",
+    "PRIORITE_SFX_PAR_VITESSE",
     "COLORS",
     "COIN_ANIM_INTERVAL_MS",
     "HEART_ANIM_INTERVAL_MS",
     "MAP_TILESET_TMJ",
+    "MAP_TMX",
+    "CASES_CHATEAU",
+    "CASES_RESERVEES",
     "MAP_PNG",
     "DEFAULT_TOWER_TYPES",
     "GAME_NAME",
@@ -0,0 +1,242 @@
+"""
+Couverture du chemin des ennemis par case et par type de tour.
+
+Pour chaque case de la grille et chaque portée de tour, on calcule la
+longueur de chemin à portée d'une tour posée au centre de la case
+(intersection exacte de chaque segment du chemin avec le disque de portée).
+Le temps qu'un ennemi passe à portée s'en déduit en divisant par sa vitesse.
+
+Le calcul est fait une fois par carte puis écrit dans `.cache/` ; la clé
+dépend du fichier de la carte (date de modification), des portées et de la
+grille, si bien qu'une carte ou une portée modifiée invalide l'entrée.
+
+`intervalles_couverture` donne, pour une tour posée, les portions du chemin
+(en distance parcourue depuis le départ) qui sont à sa portée : le
+TourManager s'en sert pour endormir les tours sans ennemi à couvrir.
+"""
+
+import hashlib
+import json
+import math
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from classes.carte import charger_carte
+from classes.constants import CACHE_DIR, PROJECT_ROOT
+from classes.position import Position
+
+# À incrémenter si le format ou le calcul change
+VERSION_COUVERTURE = 1
+
+# Cartes déjà chargées pendant la session : clé du cache -> carte
+_cartes: Dict[str, "CarteCouverture"] = {}
+
+
+def _entree_sortie(
+    a: Position, b: Position, cx: float, cy: float, rayon: float
+) -> Optional[Tuple[float, float]]:
+    """Fractions (0..1) du segment [a, b] où il entre et sort du cercle, ou None."""
+    dx, dy = b.x - a.x, b.y - a.y
+    fx, fy = a.x - cx, a.y - cy
+    aa = dx * dx + dy * dy
+    if aa == 0:
+        return None
+    bb = 2 * (fx * dx + fy * dy)
+    cc = fx * fx + fy * fy - rayon * rayon
+    discriminant = bb * bb - 4 * aa * cc
+    if discriminant <= 0:
+        return None
+    racine = math.sqrt(discriminant)
+    entree = max(0.0, (-bb - racine) / (2 * aa))
+    sortie = min(1.0, (-bb + racine) / (2 * aa))
+    if sortie <= entree:
+        return None
+    return entree, sortie
+
+
+def longueur_dans_cercle(
+    a: Position, b: Position, cx: float, cy: float, rayon: float
+) -> float:
+    """Longueur du segment [a, b] à l'intérieur du cercle de centre (cx, cy)."""
+    fractions = _entree_sortie(a, b, cx, cy, rayon)
+    if fractions is None:
+        return 0.0
+    entree, sortie = fractions
+    return (sortie - entree) * math.hypot(b.x - a.x, b.y - a.y)
+
+
+def longueurs_cumulees(chemin: Sequence[Position]) -> List[float]:
+    """Distance parcourue depuis le départ à chaque point du chemin."""
+    cumul = [0.0]
+    for a, b in zip(chemin, chemin[1:]):
+        cumul.append(cumul[-1] + math.hypot(b.x - a.x, b.y - a.y))
+    return cumul
+
+
+def intervalles_couverture(
+    chemin: Sequence[Position], cx: float, cy: float, rayon: float
+) -> List[Tuple[float, float]]:
+    """
+    Portions du chemin à portée d'une tour, en distance depuis le départ.
+
+    Args:
+        chemin: Points du chemin des ennemis
+        cx: Abscisse de la tour (px)
+        cy: Ordonnée de la tour (px)
+        rayon: Portée de la tour (px)
+
+    Returns:
+        Intervalles (début, fin) triés et fusionnés
+    """
+    cumul = longueurs_cumulees(chemin)
+    intervalles: List[Tuple[float, float]] = []
+    for i, (a, b) in enumerate(zip(chemin, chemin[1:])):
+        fractions = _entree_sortie(a, b, cx, cy, rayon)
+        if fractions is None:
+            continue
+        longueur = cumul[i + 1] - cumul[i]
+        debut = cumul[i] + fractions[0] * longueur
+        fin = cumul[i] + fractions[1] * longueur
+        if intervalles and debut <= intervalles[-1][1]:
+            intervalles[-1] = (intervalles[-1][0], max(fin, intervalles[-1][1]))
+        else:
+            intervalles.append((debut, fin))
+    return intervalles
+
+
+def calculer_longueurs(
+    chemin: Sequence[Position],
+    rayon: float,
+    colonnes: int,
+    lignes: int,
+    taille_case: int,
+) -> List[List[float]]:
+    """
+    Longueur de chemin à portée pour chaque case, indexée [y][x].
+
+    Args:
+        chemin: Points du chemin des ennemis
+        rayon: Portée de la tour (px)
+        colonnes: Nombre de colonnes de la grille
+        lignes: Nombre de lignes de la grille
+        taille_case: Taille d'une case (px)
+    """
+    segments = list(zip(chemin, chemin[1:]))
+    grille = []
+    for y in range(lignes):
+        cy = y * taille_case + taille_case // 2
+        ligne = []
+        for x in range(colonnes):
+            cx = x * taille_case + taille_case // 2
+            ligne.append(
+                sum(longueur_dans_cercle(a, b, cx, cy, rayon) for a, b in segments)
+            )
+        grille.append(ligne)
+    return grille
+
+
+class CarteCouverture:
+    """Longueurs de chemin à portée, par type de tour, pour toute la grille."""
+
+    def __init__(self, longueurs: Dict[str, List[List[float]]]) -> None:
+        """
+        Args:
+            longueurs: {type de tour: grille [y][x] des longueurs en px}
+        """
+        self.longueurs = longueurs
+
+    def longueur(self, case: Tuple[int, int], type_tour: str) -> float:
+        """Longueur de chemin (px) à portée d'une tour de ce type sur la case."""
+        grille = self.longueurs.get(type_tour)
+        if grille is None:
+            return 0.0
+        x, y = case
+        return grille[y][x]
+
+    def temps(self, case: Tuple[int, int], type_tour: str, vitesse: float) -> float:
+        """Temps (s) passé à portée par un ennemi de cette vitesse (px/s)."""
+        if vitesse <= 0:
+            return 0.0
+        return self.longueur(case, type_tour) / vitesse
+
+    def temps_par_vitesse(
+        self, case: Tuple[int, int], type_tour: str, vitesses: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Temps passé à portée pour chaque ennemi {nom: vitesse}."""
+        return {nom: self.temps(case, type_tour, v) for nom, v in vitesses.items()}
+
+
+def _cle_cache(
+    chemin_tmj: str,
+    portees: Dict[str, float],
+    colonnes: int,
+    lignes: int,
+    taille_case: int,
+) -> str:
+    description = json.dumps(
+        [
+            VERSION_COUVERTURE,
+            os.path.basename(chemin_tmj),
+            os.stat(chemin_tmj).st_mtime_ns,
+            sorted(portees.items()),
+            colonnes,
+            lignes,
+            taille_case,
+        ]
+    )
+    return hashlib.sha1(description.encode("utf-8")).hexdigest()[:16]
+
+
+def charger_couverture(
+    chemin_tmj: str,
+    portees: Dict[str, float],
+    colonnes: int,
+    lignes: int,
+    taille_case: int,
+) -> CarteCouverture:
+    """
+    Retourne la couverture de la carte, calculée une seule fois puis mise en cache.
+
+    Args:
+        chemin_tmj: Fichier Tiled de la carte (.tmx ou .tmj)
+        portees: Portée de chaque type de tour (`TourManager.portee_par_type`)
+        colonnes: Nombre de colonnes de la grille
+        lignes: Nombre de lignes de la grille
+        taille_case: Taille d'une case (px)
+    """
+    if not os.path.isabs(chemin_tmj):
+        chemin_tmj = os.path.join(PROJECT_ROOT, chemin_tmj)
+    cle = _cle_cache(chemin_tmj, portees, colonnes, lignes, taille_case)
+    carte = _cartes.get(cle)
+    if carte is not None:
+        return carte
+
+    fichier_cache = os.path.join(CACHE_DIR, f"couverture-{cle}.json")
+    try:
+        with open(fichier_cache, "r", encoding="utf-8") as f:
+            carte = CarteCouverture(json.load(f))
+    except (OSError, ValueError):
+        chemin = charger_carte(chemin_tmj).positions_chemin()
+        carte = CarteCouverture(
+            {
+                type_tour: calculer_longueurs(
+                    chemin, portee, colonnes, lignes, taille_case
+                )
+                for type_tour, portee in portees.items()
+            }
+        )
+        _ecrire_cache(fichier_cache, carte.longueurs)
+    _cartes[cle] = carte
+    return carte
+
+
+def _ecrire_cache(fichier_cache: str, longueurs: Dict[str, List[List[float]]]) -> None:
+    """Écrit le cache sur disque (silencieux si le dossier n'est pas accessible)."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temporaire = f"{fichier_cache}.{os.getpid()}.tmp"
+        with open(temporaire, "w", encoding="utf-8") as f:
+            json.dump(longueurs, f)
+        os.replace(temporaire, fichier_cache)
+    except OSError:
+        pass
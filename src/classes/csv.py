@@ -1,35 +1,62 @@
 import csv
 import os
+from typing import Dict, List, Tuple
 
 from classes.constants import PROJECT_ROOT
-from models.ennemi import Chevalier, Gobelin, Loup, Mage, Ogre, Rat
-
-ENEMY_CLASSES = {
-    1: Loup,
-    2: Rat,
-    3: Gobelin,
-    4: Mage,
-    5: Ogre,
-    6: Chevalier,
-}
-
-
-def creer_liste_ennemis_depuis_csv(numVague=int, chemin_csv="src/data/jeu.csv") -> list:
-    ennemis = []
-    chemin_csv = os.path.join(PROJECT_ROOT, *chemin_csv.split("/"))
-    with open(chemin_csv, newline="", encoding="utf-8") as csvfile:
+from models.ennemi import CLASSES_ENNEMIS
+
+# id de la table des types (data/typeTroupe.txt) -> classe d'ennemi
+ENEMY_CLASSES = CLASSES_ENNEMIS
+
+# Fichier de vagues par défaut (relatif à la racine du projet)
+FICHIER_VAGUES_DEFAUT = "src/data/jeu.csv"
+
+# Vagues déjà lues : chemin absolu -> (date de modification, {vague: [(id, temps)]})
+_vagues_par_fichier: Dict[str, Tuple[float, Dict[int, List[Tuple[int, float]]]]] = {}
+
+
+def resoudre_chemin_vagues(chemin_csv: str) -> str:
+    """Retourne le chemin absolu d'un fichier de vagues (relatif à la racine sinon)."""
+    if os.path.isabs(chemin_csv):
+        return chemin_csv
+    return os.path.join(PROJECT_ROOT, *chemin_csv.split("/"))
+
+
+def charger_vagues(
+    chemin_csv: str = FICHIER_VAGUES_DEFAUT,
+) -> Dict[int, List[Tuple[int, float]]]:
+    """
+    Lit un fichier de vagues `idEnnemi;numVague;temps`, une seule fois.
+
+    Le résultat est gardé en mémoire tant que le fichier n'est pas modifié.
+
+    Args:
+        chemin_csv: Chemin du fichier (absolu, ou relatif à la racine du projet)
+
+    Returns:
+        Dictionnaire {numéro de vague: [(id ennemi, temps d'apparition)]}
+    """
+    chemin = resoudre_chemin_vagues(chemin_csv)
+    mtime = os.path.getmtime(chemin)
+    en_cache = _vagues_par_fichier.get(chemin)
+    if en_cache is not None and en_cache[0] == mtime:
+        return en_cache[1]
+
+    vagues: Dict[int, List[Tuple[int, float]]] = {}
+    with open(chemin, newline="", encoding="utf-8") as csvfile:
         reader = csv.DictReader(csvfile, delimiter=";")
         for row in reader:
             id_ennemi = int(row["idEnnemi"])
+            if id_ennemi not in ENEMY_CLASSES:
+                raise ValueError(f"ID ennemi inconnu : {id_ennemi}")
             vague = int(row["numVague"])
-            temps = float(row["temps"])
+            vagues.setdefault(vague, []).append((id_ennemi, float(row["temps"])))
+
+    _vagues_par_fichier[chemin] = (mtime, vagues)
+    return vagues
 
-            if vague == numVague:
-                cls = ENEMY_CLASSES.get(id_ennemi)
-                if cls is None:
-                    raise ValueError(f"ID ennemi inconnu : {id_ennemi}")
-                ennemi = cls(tempsApparition=temps)
 
-                ennemis.append(ennemi)
+def nombre_vagues(chemin_csv: str = FICHIER_VAGUES_DEFAUT) -> int:
+    """Retourne le numéro de la dernière vague du fichier (0 s'il est vide)."""
+    return max(charger_vagues(chemin_csv), default=0)
 
-    return ennemis
@@ -0,0 +1,38 @@
+"""
+Horloge de simulation partagée par la logique de jeu.
+
+Le temps de jeu n'avance que dans `Game.maj`, du `dt` de chaque frame :
+les apparitions d'ennemis et les durées des sorts ne dépendent donc plus de
+l'horloge murale de pygame. Une partie en pause ne fait pas avancer le temps,
+et une simulation sans fenêtre à pas fixe est reproductible.
+"""
+
+_temps_ms: float = 0.0
+
+
+def temps_ms() -> int:
+    """Retourne le temps de jeu écoulé en millisecondes (équivalent de `get_ticks`)."""
+    return int(_temps_ms)
+
+
+def temps_exact_ms() -> float:
+    """Retourne le temps de jeu sans arrondi (sauvegarde de la partie)."""
+    return _temps_ms
+
+
+def avancer(dt: float) -> None:
+    """Fait avancer le temps de jeu de `dt` secondes."""
+    global _temps_ms
+    _temps_ms += dt * 1000.0
+
+
+def regler(temps_ms: float) -> None:
+    """Place le temps de jeu à `temps_ms` millisecondes (partie restaurée)."""
+    global _temps_ms
+    _temps_ms = float(temps_ms)
+
+
+def reinitialiser() -> None:
+    """Remet le temps de jeu à zéro (nouvelle partie)."""
+    global _temps_ms
+    _temps_ms = 0.0
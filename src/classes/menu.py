@@ -2,7 +2,8 @@
 import os
 import pygame
 
-from classes.constants import COLORS
+from classes.constants import ASSETS_DIR, COLORS
+from classes.polices import obtenir_police, rendre_texte
 from classes.sprites import charger_image_avec_redimensionnement
 
 from .bouton import Bouton
@@ -195,9 +196,9 @@ def dessiner_credits(
         _scroll_y = h + MARGE_DEPART
 
     for i, ligne in enumerate(CREDITS_LIGNES):
-        surf = police.render(ligne, True, COLORS["ui_text"])
         y = _scroll_y + i * ESPACEMENT_LIGNES
         if -ESPACEMENT_LIGNES < y < h + ESPACEMENT_LIGNES:
+            surf = rendre_texte(police, ligne, COLORS["ui_text"])
             ecran.blit(surf, (w // 2 - surf.get_width() // 2, y))
 
     # avancer le défilement
@@ -267,11 +268,11 @@ def dessiner_gameover(ecran: pygame.Surface, boutons: list) -> None:
         ecran.fill((20, 0, 0))
         # Titre fallback
         try:
-            police_titre = pygame.font.Font(None, 96)
+            police_titre = obtenir_police(96)
         except Exception:
             police_titre = None
         if police_titre is not None:
-            titre = police_titre.render("GAME OVER", True, (220, 40, 40))
+            titre = rendre_texte(police_titre, "GAME OVER", (220, 40, 40))
             ecran.blit(titre, (ecran.get_width() // 2 - titre.get_width() // 2, 180))
 
     for b in boutons:
@@ -281,15 +282,26 @@ def creer_boutons_regles(police: pygame.font.Font, action_retour) -> list:
     from .bouton import Bouton
     return [Bouton("Retour", 968, 920, 200, 50, action_retour, police, COULEURS_BOUTON)]
 
+_REGLES_LIGNES = None
+
+
+def _charger_regles() -> list:
+    """Lit assets/regles.txt une seule fois."""
+    global _REGLES_LIGNES
+    if _REGLES_LIGNES is None:
+        chemin = os.path.join(ASSETS_DIR, "regles.txt")
+        with open(chemin, encoding="utf-8") as f:
+            _REGLES_LIGNES = [l.strip() for l in f.readlines()]
+    return _REGLES_LIGNES
+
+
 def afficher_regles(ecran: pygame.Surface, police: pygame.font.Font, largeur: int, boutons: list = None) -> None:
     ecran.fill((30, 30, 30))
-    font = pygame.font.Font(None, 28)
-    chemin = os.path.join("assets", "regles.txt")
-    with open(chemin, encoding="utf-8") as f:
-        lignes = [l.strip() for l in f.readlines()]
+    font = obtenir_police(28)
+    lignes = _charger_regles()
     max_lignes = (ecran.get_height() - 120) // 38
     for i, ligne in enumerate(lignes[:max_lignes]):
-        txt = font.render(ligne, True, (220, 220, 220))
+        txt = rendre_texte(font, ligne, (220, 220, 220))
         ecran.blit(txt, (60, 40 + i * 38))
     if boutons:
         for bouton in boutons:
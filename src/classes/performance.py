@@ -0,0 +1,106 @@
+"""
+Mesure des temps de chaque phase de la boucle de jeu (mise à jour et rendu).
+
+Le moniteur est inactif par défaut : `horloge` et `noter` retournent alors
+immédiatement, sans lire l'horloge ni stocker de mesure. Une fois activé
+(touche F3 en jeu), chaque phase garde une fenêtre glissante de ses
+dernières durées, dont on affiche la moyenne et le 99e centile.
+
+Le moniteur porte aussi le suivi des allocations (`allocations`, touche F4)
+et le gouverneur de qualité (`qualite`), qui se calent sur les mêmes phases.
+Le gouverneur est actif par défaut : les phases sont alors chronométrées même
+sans affichage, mais leurs durées ne sont gardées que si le moniteur est actif.
+"""
+
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, List, Sequence, Tuple
+
+from classes.allocations import SuiviAllocations
+from classes.qualite import GouverneurQualite
+
+# Nombre de mesures conservées par phase (~2 s à 60 FPS)
+TAILLE_FENETRE_PERF: int = 120
+
+
+def centile(valeurs: Sequence[float], fraction: float) -> float:
+    """
+    Retourne le centile demandé d'une série de mesures (0.0 si elle est vide).
+
+    Args:
+        valeurs: Mesures, dans n'importe quel ordre
+        fraction: Centile voulu entre 0 et 1 (0.99 pour le p99)
+    """
+    if not valeurs:
+        return 0.0
+    tri = sorted(valeurs)
+    return tri[min(len(tri) - 1, int(len(tri) * fraction))]
+
+
+class MoniteurPerformance:
+    """Collecte les durées par phase dans des fenêtres glissantes."""
+
+    def __init__(self, taille_fenetre: int = TAILLE_FENETRE_PERF) -> None:
+        self.actif = False
+        self.taille_fenetre = taille_fenetre
+        self._mesures: Dict[str, Deque[float]] = {}
+        # Allocations par phase et par frame (diagnostic, inactif par défaut)
+        self.allocations = SuiviAllocations(taille_fenetre)
+        # Qualité d'affichage selon le coût des frames
+        self.qualite = GouverneurQualite()
+
+    def basculer(self) -> None:
+        """Active ou désactive la collecte (les anciennes mesures sont oubliées)."""
+        self.actif = not self.actif
+        self._mesures.clear()
+
+    def horloge(self) -> float:
+        """Retourne l'instant courant (0.0 si rien n'est chronométré)."""
+        if self.allocations.actif:
+            self.allocations.depart()
+        if not (self.actif or self.qualite.actif):
+            return 0.0
+        return perf_counter()
+
+    def noter(self, phase: str, debut: float) -> float:
+        """
+        Enregistre la durée écoulée depuis `debut` pour une phase.
+
+        Args:
+            phase: Nom de la phase mesurée
+            debut: Instant retourné par `horloge` (ou par le `noter` précédent)
+
+        Returns:
+            L'instant courant, à réutiliser comme début de la phase suivante
+        """
+        if self.allocations.actif:
+            self.allocations.noter(phase)
+        if not (self.actif or self.qualite.actif):
+            return debut
+        maintenant = perf_counter()
+        if self.qualite.actif:
+            self.qualite.noter(phase, maintenant - debut)
+        if not self.actif:
+            return maintenant
+        mesures = self._mesures.get(phase)
+        if mesures is None:
+            mesures = deque(maxlen=self.taille_fenetre)
+            self._mesures[phase] = mesures
+        mesures.append(maintenant - debut)
+        return maintenant
+
+    def statistiques(self) -> List[Tuple[str, float, float]]:
+        """
+        Calcule la moyenne et le 99e centile de chaque phase.
+
+        Returns:
+            Liste de (phase, moyenne en ms, p99 en ms), dans l'ordre de première mesure
+        """
+        resultats = []
+        for phase, mesures in self._mesures.items():
+            if not mesures:
+                continue
+            moyenne = sum(mesures) / len(mesures)
+            p99 = centile(mesures, 0.99)
+            resultats.append((phase, 1000.0 * moyenne, 1000.0 * p99))
+        return resultats
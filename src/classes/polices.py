@@ -0,0 +1,132 @@
+"""
+Registre de polices et cache de rendu de texte partagés par toute l'interface.
+
+Toutes les polices passent par `obtenir_police` (une seule instance par
+couple nom/taille) et tous les textes par `rendre_texte`, qui garde les
+surfaces déjà rendues dans un cache LRU borné en mémoire.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+# Budget mémoire du cache de textes (octets de pixels)
+TAILLE_MAX_CACHE_TEXTE: int = 8 * 1024 * 1024
+
+_polices: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+_cles_polices: Dict[int, Tuple[Optional[str], int]] = {}
+
+
+def obtenir_police(taille: int, nom: Optional[str] = None) -> pygame.font.Font:
+    """
+    Retourne la police partagée pour ce nom et cette taille.
+
+    Args:
+        taille: Taille de la police en points
+        nom: Chemin du fichier de police (None = police par défaut de pygame)
+
+    Returns:
+        Instance de police, créée une seule fois
+    """
+    cle = (nom, int(taille))
+    police = _polices.get(cle)
+    if police is None:
+        police = pygame.font.Font(nom, int(taille))
+        _polices[cle] = police
+        _cles_polices[id(police)] = cle
+    return police
+
+
+def _cle_police(police: pygame.font.Font) -> Tuple[Optional[str], int]:
+    """Retourne la clé (nom, taille) d'une police, en enregistrant les polices externes."""
+    cle = _cles_polices.get(id(police))
+    if cle is None:
+        # Police créée hors du registre : on la garde en vie pour que son id reste unique
+        cle = (f"externe-{id(police)}", police.get_height())
+        _polices[cle] = police
+        _cles_polices[id(police)] = cle
+    return cle
+
+
+class CacheTexte:
+    """Cache LRU des surfaces de texte, borné par la mémoire occupée."""
+
+    def __init__(self, taille_max_octets: int = TAILLE_MAX_CACHE_TEXTE) -> None:
+        self.taille_max_octets = taille_max_octets
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._tailles: Dict[tuple, int] = {}
+        self.octets = 0
+        self.succes = 0
+        self.echecs = 0
+
+    def rendre(
+        self,
+        police: pygame.font.Font,
+        texte: str,
+        couleur: Tuple[int, ...],
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """
+        Retourne la surface du texte, rendue une seule fois tant qu'elle reste en cache.
+
+        La surface retournée est partagée : elle ne doit pas être modifiée.
+        """
+        cle = (_cle_police(police), texte, tuple(couleur), antialias)
+        surface = self._surfaces.get(cle)
+        if surface is not None:
+            self._surfaces.move_to_end(cle)
+            self.succes += 1
+            return surface
+
+        self.echecs += 1
+        surface = police.render(texte, antialias, couleur)
+        taille = surface.get_pitch() * surface.get_height()
+        self._surfaces[cle] = surface
+        self._tailles[cle] = taille
+        self.octets += taille
+
+        # Éviction des textes les moins récemment utilisés
+        while self.octets > self.taille_max_octets and len(self._surfaces) > 1:
+            ancienne_cle, _ = self._surfaces.popitem(last=False)
+            self.octets -= self._tailles.pop(ancienne_cle)
+        return surface
+
+    def vider(self) -> None:
+        """Vide le cache (les compteurs sont conservés)."""
+        self._surfaces.clear()
+        self._tailles.clear()
+        self.octets = 0
+
+    def statistiques(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache pour le réglage de sa taille."""
+        return {
+            "textes_en_cache": len(self._surfaces),
+            "octets": self.octets,
+            "octets_max": self.taille_max_octets,
+            "succes": self.succes,
+            "echecs": self.echecs,
+        }
+
+
+_cache_texte = CacheTexte()
+
+
+def rendre_texte(
+    police: pygame.font.Font,
+    texte: str,
+    couleur: Tuple[int, ...],
+    antialias: bool = True,
+) -> pygame.Surface:
+    """Rend un texte via le cache partagé (équivalent de `police.render`)."""
+    return _cache_texte.rendre(police, texte, couleur, antialias)
+
+
+def statistiques_cache_texte() -> Dict[str, int]:
+    """Retourne les compteurs succès/échecs et l'occupation du cache de textes."""
+    return _cache_texte.statistiques()
+
+
+def vider_cache_texte() -> None:
+    """Vide le cache de textes partagé."""
+    _cache_texte.vider()
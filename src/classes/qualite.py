@@ -0,0 +1,135 @@
+"""
+Qualité d'affichage adaptative, pilotée par le temps de chaque frame.
+
+Le gouverneur additionne les durées des phases de la boucle (les mêmes que le
+moniteur de performance, qui le porte) et compare leur moyenne glissante au
+budget d'une frame. Trop longtemps au-dessus, il descend d'un palier ; assez
+longtemps bien en dessous, il remonte d'un palier. Les paliers sont cumulatifs,
+du moins visible au plus visible :
+
+1. les ennemis cachés (dessinés à l'opacité 70) ne sont plus dessinés ;
+2. seules les barres de vie des ennemis bien entamés restent affichées ;
+3. le voile de nuit n'est recalculé que toutes les quelques frames ;
+4. seules les explosions les plus récentes sont dessinées ;
+5. le nombre de voix des bruitages est réduit.
+
+Seul l'affichage et le son changent : la simulation reste identique.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from classes.constants import FPS
+
+# Part du budget d'une frame laissée aux phases mesurées (le reste : événements,
+# affichage de l'écran)
+BUDGET_FRAME_MS: float = 1000.0 / FPS * 0.8
+# Moyenne glissante : poids de la dernière frame
+LISSAGE: float = 0.1
+# Frames consécutives au-dessus du budget avant de descendre d'un palier
+FRAMES_AVANT_DEGRADATION: int = 15
+# Frames consécutives sous MARGE_RESTAURATION du budget avant de remonter
+FRAMES_AVANT_RESTAURATION: int = 180
+MARGE_RESTAURATION: float = 0.6
+
+# Nom de chaque palier (0 : qualité complète)
+PALIERS: Tuple[str, ...] = (
+    "complète",
+    "sans ennemis cachés",
+    "barres de vie réduites",
+    "nuit simplifiée",
+    "explosions réduites",
+    "voix réduites",
+)
+PALIER_ENNEMIS_CACHES: int = 1
+PALIER_BARRES_VIE: int = 2
+PALIER_NUIT: int = 3
+PALIER_EXPLOSIONS: int = 4
+PALIER_VOIX: int = 5
+
+# Réglages des paliers dégradés
+SEUIL_BARRE_VIE: float = 0.5  # vie restante sous laquelle la barre reste affichée
+INTERVALLE_NUIT: int = 4  # frames entre deux calculs du voile de nuit
+MAX_EXPLOSIONS: int = 6  # explosions dessinées au plus
+VOIX_SFX_REDUITES: int = 6  # voix de bruitages simultanées au plus
+
+
+class GouverneurQualite:
+    """Choisit le palier de qualité d'après le coût des dernières frames."""
+
+    def __init__(self, budget_ms: float = BUDGET_FRAME_MS) -> None:
+        """
+        Args:
+            budget_ms: Temps alloué aux phases mesurées d'une frame (ms)
+        """
+        self.actif = True
+        self.budget_ms = budget_ms
+        self.palier = 0
+        # Appelée avec le nouveau palier à chaque changement
+        self.au_changement: Optional[Callable[[int], None]] = None
+        self.cout_moyen_ms = 0.0
+        self._cout_frame = 0.0
+        self._phases_frame: Dict[str, float] = {}
+        self._moyennes_phases: Dict[str, float] = {}
+        self._depassements = 0
+        self._marges = 0
+
+    def desactiver(self) -> None:
+        """Revient à la qualité complète et ne change plus de palier."""
+        self.actif = False
+        self._cout_frame = 0.0
+        self._phases_frame.clear()
+        self._changer_palier(0)
+
+    def noter(self, phase: str, duree: float) -> None:
+        """Ajoute la durée (s) d'une phase au coût de la frame en cours."""
+        self._cout_frame += duree
+        self._phases_frame[phase] = self._phases_frame.get(phase, 0.0) + duree
+
+    def fin_frame(self) -> None:
+        """Met à jour les moyennes et change de palier si besoin."""
+        if not self.actif:
+            return
+        cout_ms = 1000.0 * self._cout_frame
+        self._cout_frame = 0.0
+        self.cout_moyen_ms += LISSAGE * (cout_ms - self.cout_moyen_ms)
+        for phase, duree in self._phases_frame.items():
+            moyenne = self._moyennes_phases.get(phase, 0.0)
+            self._moyennes_phases[phase] = moyenne + LISSAGE * (1000.0 * duree - moyenne)
+        self._phases_frame.clear()
+
+        if self.cout_moyen_ms > self.budget_ms:
+            self._marges = 0
+            self._depassements += 1
+            if self._depassements >= FRAMES_AVANT_DEGRADATION:
+                self._changer_palier(self.palier + 1)
+        elif self.cout_moyen_ms < self.budget_ms * MARGE_RESTAURATION:
+            self._depassements = 0
+            self._marges += 1
+            if self._marges >= FRAMES_AVANT_RESTAURATION:
+                self._changer_palier(self.palier - 1)
+        else:
+            self._depassements = 0
+            self._marges = 0
+
+    def _changer_palier(self, palier: int) -> None:
+        palier = max(0, min(len(PALIERS) - 1, palier))
+        # Chaque changement a le temps de faire effet avant le suivant
+        self._depassements = 0
+        self._marges = 0
+        if palier == self.palier:
+            return
+        self.palier = palier
+        if self.au_changement is not None:
+            self.au_changement(palier)
+
+    def phase_la_plus_lourde(self) -> Optional[Tuple[str, float]]:
+        """Phase au coût moyen le plus élevé, avec ce coût (ms), ou None."""
+        if not self._moyennes_phases:
+            return None
+        return max(self._moyennes_phases.items(), key=lambda p: p[1])
+
+    def description(self) -> str:
+        """Palier courant, pour l'overlay de performance."""
+        if not self.actif:
+            return "désactivée"
+        return f"{self.palier}/{len(PALIERS) - 1} ({PALIERS[self.palier]})"
@@ -0,0 +1,164 @@
+"""
+Rendu groupé des entités (ennemis, personnages des tours, projectiles, effets).
+
+Chaque couche remplit une `FileRendu` pendant la frame, puis la soumet en un
+seul appel `Surface.blits` au lieu d'un `blit` Python par entité. Les blits
+sont regroupés par texture (tri stable : l'ordre est conservé entre entités
+qui partagent la même surface). Une couche dont l'ordre d'affichage compte
+(ennemis qui se chevauchent sur le chemin) désactive ce tri et regroupe
+elle-même ses entités de façon stable.
+
+Pour que les entités partagent réellement leurs textures, les variantes
+(retournement, transparence, rotation) sont calculées une seule fois et
+gardées en mémoire ; les rotations sont arrondies à `PAS_ROTATION` degrés.
+Les barres de vie sont pré-rendues pour chaque largeur de remplissage (un
+pixel = 2,5 % de vie) et chaque couleur, et se dessinent en un seul blit.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+# Pas des rotations mises en cache (degrés)
+PAS_ROTATION = 3
+
+# Barres de vie : dimensions (px) et couleurs (plus de 50 %, plus de 25 %, sinon)
+LARGEUR_BARRE_VIE = 40
+HAUTEUR_BARRE_VIE = 6
+COULEUR_FOND_BARRE_VIE = (60, 60, 60)
+COULEURS_BARRE_VIE = ((0, 255, 0), (255, 255, 0), (255, 0, 0))
+
+# Variantes déjà calculées (les surfaces sources sont des assets chargés une fois)
+_retournees: Dict[pygame.Surface, pygame.Surface] = {}
+_transparentes: Dict[Tuple[pygame.Surface, int], pygame.Surface] = {}
+_tournees: Dict[Tuple[pygame.Surface, int, float], pygame.Surface] = {}
+# (largeur remplie, indice de couleur) -> barre de vie
+_barres_vie: Dict[Tuple[int, int], pygame.Surface] = {}
+
+Blit = Tuple[pygame.Surface, Tuple[int, int], Optional[pygame.Rect], int]
+
+
+class FileRendu:
+    """File des blits d'une couche, soumise en un seul appel `Surface.blits`."""
+
+    def __init__(self, trier: bool = True) -> None:
+        """
+        Args:
+            trier: Regrouper les blits par texture avant de les soumettre
+        """
+        self.trier = trier
+        self._blits: List[Blit] = []
+
+    def __len__(self) -> int:
+        return len(self._blits)
+
+    def ajouter(
+        self,
+        surface: pygame.Surface,
+        dest: Tuple[int, int],
+        area: Optional[pygame.Rect] = None,
+        flags: int = 0,
+    ) -> None:
+        """Ajoute un blit à la file (mêmes arguments que `Surface.blit`)."""
+        self._blits.append((surface, dest, area, flags))
+
+    def ajouter_centre(self, surface: pygame.Surface, cx: float, cy: float) -> None:
+        """Ajoute un blit centré sur (cx, cy)."""
+        dest = (int(cx) - surface.get_width() // 2, int(cy) - surface.get_height() // 2)
+        self._blits.append((surface, dest, None, 0))
+
+    def soumettre(
+        self, ecran: pygame.Surface, zones: bool = False
+    ) -> Optional[List[pygame.Rect]]:
+        """
+        Dessine toute la file sur l'écran puis la vide.
+
+        Args:
+            ecran: Surface de destination
+            zones: Si True, retourne les rectangles modifiés (déjà découpés
+                à l'écran), pour un affichage partiel (`display.update`)
+
+        Returns:
+            Les rectangles modifiés si `zones`, sinon None
+        """
+        blits = self._blits
+        if not blits:
+            return [] if zones else None
+        if self.trier:
+            # Regrouper par texture (tri stable sur l'identité de la surface)
+            blits.sort(key=lambda b: id(b[0]))
+        rects = ecran.blits(blits, doreturn=zones)
+        blits.clear()
+        return rects
+
+
+def surface_retournee(image: pygame.Surface) -> pygame.Surface:
+    """Retourne l'image inversée horizontalement (calculée une seule fois)."""
+    retournee = _retournees.get(image)
+    if retournee is None:
+        retournee = _retournees[image] = pygame.transform.flip(image, True, False)
+    return retournee
+
+
+def surface_transparente(image: pygame.Surface, alpha: int) -> pygame.Surface:
+    """Retourne une copie de l'image à l'opacité donnée (calculée une seule fois)."""
+    cle = (image, alpha)
+    copie = _transparentes.get(cle)
+    if copie is None:
+        copie = image.copy()
+        copie.set_alpha(alpha)
+        _transparentes[cle] = copie
+    return copie
+
+
+def surface_tournee(
+    image: pygame.Surface, angle: float, echelle: float
+) -> pygame.Surface:
+    """
+    Retourne l'image tournée et mise à l'échelle, l'angle arrondi à PAS_ROTATION.
+
+    Args:
+        image: Image source
+        angle: Angle en degrés (sens anti-horaire, comme `rotozoom`)
+        echelle: Facteur d'échelle
+    """
+    pas = int(round(angle / PAS_ROTATION)) % (360 // PAS_ROTATION)
+    cle = (image, pas, echelle)
+    tournee = _tournees.get(cle)
+    if tournee is None:
+        tournee = pygame.transform.rotozoom(image, pas * PAS_ROTATION, echelle)
+        _tournees[cle] = tournee
+    return tournee
+
+
+def _prerendre_barres_vie() -> None:
+    """Dessine toutes les barres de vie (41 remplissages x 3 couleurs)."""
+    for niveau in range(LARGEUR_BARRE_VIE + 1):
+        for indice, couleur in enumerate(COULEURS_BARRE_VIE):
+            barre = pygame.Surface(
+                (LARGEUR_BARRE_VIE, HAUTEUR_BARRE_VIE), pygame.SRCALPHA
+            )
+            pygame.draw.rect(
+                barre,
+                COULEUR_FOND_BARRE_VIE,
+                (0, 0, LARGEUR_BARRE_VIE, HAUTEUR_BARRE_VIE),
+                border_radius=3,
+            )
+            pygame.draw.rect(
+                barre, couleur, (0, 0, niveau, HAUTEUR_BARRE_VIE), border_radius=3
+            )
+            _barres_vie[(niveau, indice)] = barre
+
+
+def surface_barre_vie(pourcentage: float) -> pygame.Surface:
+    """
+    Retourne la barre de vie pré-rendue pour un pourcentage de vie.
+
+    Args:
+        pourcentage: Vie restante, entre 0 et 1
+    """
+    if not _barres_vie:
+        _prerendre_barres_vie()
+    niveau = min(LARGEUR_BARRE_VIE, max(0, int(LARGEUR_BARRE_VIE * pourcentage)))
+    indice = 0 if pourcentage > 0.5 else (1 if pourcentage > 0.25 else 2)
+    return _barres_vie[(niveau, indice)]
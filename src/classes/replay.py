@@ -0,0 +1,125 @@
+"""
+Enregistrement des parties et relecture déterministe.
+
+Pendant une partie enregistrée, `Game` note chaque action du joueur (pose et
+vente de tours, sorts, lancement de vague) avec le tick et le temps de jeu
+où elle a eu lieu, ainsi que le `dt` et la position du curseur de chaque
+tick (le curseur décide de la visibilité des ennemis, donc du ciblage).
+Avec la graine aléatoire et le fichier de vagues, cela suffit à rejouer la
+partie à l'identique, sans fenêtre à vitesse maximale ou avec rendu.
+
+Le fichier est un JSON compressé par zlib ; le curseur n'est stocké que
+lorsqu'il change.
+"""
+
+import json
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from game import Game
+
+VERSION_REPLAY = 1
+
+# Actions rejouables : nom de la commande -> méthode de Game
+COMMANDES_REPLAY = (
+    "placer_tour",
+    "vendre_tour",
+    "lancer_eclair",
+    "acheter_sort",
+    "lancer_vague",
+)
+
+
+class EnregistreurPartie:
+    """Accumule les ticks et les commandes d'une partie, puis les écrit sur disque."""
+
+    def __init__(self, chemin: str, graine: int, fichier_vagues: str) -> None:
+        """
+        Args:
+            chemin: Fichier de sortie
+            graine: Graine aléatoire de la partie
+            fichier_vagues: Fichier CSV des vagues utilisé par la partie
+        """
+        self.chemin = chemin
+        self.graine = graine
+        self.fichier_vagues = fichier_vagues
+        self.dts: List[float] = []
+        self.curseurs: List[List[int]] = []  # [tick, x, y] à chaque changement
+        self.commandes: List[List[Any]] = []  # [tick, temps_ms, nom, *arguments]
+        self._dernier_curseur: Optional[Tuple[int, int]] = None
+
+    def noter_tick(self, dt: float, curseur: Tuple[int, int]) -> None:
+        """Note le pas de temps et la position du curseur d'un tick."""
+        curseur = (int(curseur[0]), int(curseur[1]))
+        if curseur != self._dernier_curseur:
+            self.curseurs.append([len(self.dts), curseur[0], curseur[1]])
+            self._dernier_curseur = curseur
+        self.dts.append(dt)
+
+    def noter_commande(self, temps_ms: int, nom: str, *arguments: Any) -> None:
+        """Note une action du joueur, appliquée avant le prochain tick."""
+        self.commandes.append([len(self.dts), temps_ms, nom, *arguments])
+
+    def sauvegarder(self) -> None:
+        """Écrit l'enregistrement (JSON compressé)."""
+        donnees = {
+            "version": VERSION_REPLAY,
+            "graine": self.graine,
+            "fichier_vagues": self.fichier_vagues,
+            "dts": self.dts,
+            "curseurs": self.curseurs,
+            "commandes": self.commandes,
+        }
+        brut = json.dumps(donnees, separators=(",", ":")).encode("utf-8")
+        with open(self.chemin, "wb") as f:
+            f.write(zlib.compress(brut, 9))
+
+
+def charger_replay(chemin: str) -> Dict[str, Any]:
+    """
+    Lit un fichier d'enregistrement.
+
+    Raises:
+        ValueError: Si le fichier n'est pas un enregistrement d'une version connue
+    """
+    with open(chemin, "rb") as f:
+        try:
+            donnees = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+        except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Enregistrement illisible : {chemin}") from e
+    if donnees.get("version") != VERSION_REPLAY:
+        raise ValueError(f"Version d'enregistrement non gérée : {donnees.get('version')}")
+    return donnees
+
+
+class LecteurReplay:
+    """Rejoue un enregistrement sur une partie créée avec la même graine."""
+
+    def __init__(self, donnees: Dict[str, Any]) -> None:
+        self.dts: List[float] = donnees["dts"]
+        self._curseurs = {tick: (x, y) for tick, x, y in donnees["curseurs"]}
+        self._commandes: Dict[int, List[List[Any]]] = {}
+        for commande in donnees["commandes"]:
+            self._commandes.setdefault(commande[0], []).append(commande)
+
+    def est_termine(self, game: "Game") -> bool:
+        """Retourne True quand tous les ticks enregistrés ont été rejoués."""
+        return game.nb_ticks >= len(self.dts)
+
+    def preparer_tick(self, game: "Game") -> Optional[float]:
+        """
+        Applique les commandes et le curseur du prochain tick.
+
+        Returns:
+            Le `dt` à passer à `Game.maj`, ou None si l'enregistrement est terminé
+        """
+        tick = game.nb_ticks
+        if tick >= len(self.dts):
+            return None
+        for _, _, nom, *arguments in self._commandes.get(tick, []):
+            if nom in COMMANDES_REPLAY:
+                getattr(game, nom)(*arguments)
+        if tick in self._curseurs:
+            game.curseur = self._curseurs[tick]
+        return self.dts[tick]
@@ -0,0 +1,522 @@
+"""
+Sauvegarde binaire compacte de l'état complet d'une partie.
+
+`capturer` range la partie dans une suite d'enregistrements `struct` de
+taille fixe (petit-boutiste) : en-tête versionné (horloge, joueur, vague),
+prix des tours, sorts, puis les tours (case, délai de tir, état et
+animation), les ennemis apparus (type, avancée sur le chemin, PV), les
+apparitions à venir de la vague, les projectiles et les effets d'explosion.
+Les références entre objets (cible d'une tour ou d'un projectile, pierre
+suivie par un projectile de mage) sont écrites comme des indices dans ces
+listes.
+
+`restaurer` reconstruit les objets dans une partie existante (même carte et
+même fichier de vagues). Une capture ne prend que quelques centaines de
+microsecondes : assez pour des sauvegardes rapides (F5 / F9), un point de
+contrôle à chaque vague ou pour repartir d'un état en simulation.
+"""
+
+import math
+import os
+import struct
+from typing import TYPE_CHECKING, List, Optional
+
+from classes import horloge
+from classes.constants import CACHE_DIR, DEFAULT_TOWER_TYPES
+from classes.position import Position
+from models.ennemi import Ennemi
+from models.projectile import (
+    EffetExplosion,
+    ProjectileFleche,
+    ProjectileMageEnnemi,
+    ProjectilePierre,
+    ProjectileTourMage,
+)
+from models.tour import Campement
+
+if TYPE_CHECKING:
+    from game import Game
+
+# À incrémenter si le format change (les anciennes sauvegardes sont refusées)
+VERSION_SAUVEGARDE = 2
+SIGNATURE = b"GJ25"
+
+# Fichier de la sauvegarde rapide (F5 / F9)
+FICHIER_SAUVEGARDE_RAPIDE = os.path.join(CACHE_DIR, "sauvegarde-rapide.bin")
+
+# signature, version, temps (ms), graine, ticks, argent, PV, vague, début de
+# vague (ms), nuit, fuites, longueur du nom du fichier de vagues
+_ENTETE = struct.Struct("<4sHdIIqqHd?IH")
+# Prix courant de chaque type de tour (ordre de DEFAULT_TOWER_TYPES)
+_PRIX = struct.Struct(f"<{len(DEFAULT_TOWER_TYPES)}q")
+# Vision : niveau ; Fée : niveau, active, début ; Éclair : niveau, case, début
+_SORTS = struct.Struct("<HH?dHhhd")
+# Nombre de tours, d'ennemis, d'apparitions à venir, de projectiles et d'effets
+_NOMBRES = struct.Struct("<IIIII")
+# type, case (x, y), id, prix payé, portée, recharge, temps depuis le dernier
+# tir, état, cible, animation (état, direction, retournée, frame, minuteur)
+_TOUR = struct.Struct("<BBBHqdddBiB2s?Hd")
+# type, apparition, vitesse, segment, distance sur le segment, position,
+# PV, arrivé, visible, animation (état, frame, minuteur, retourné),
+# parade, temps depuis l'attaque, récompense donnée / refusée
+_ENNEMI = struct.Struct("<BddHdddq??BHd?dd??")
+# Apparition à venir : type, temps (s)
+_APPARITION = struct.Struct("<Bd")
+# type, position, vitesse (vx, vy), dégâts, vitesse, rayon, portée max,
+# distance parcourue, détruit, ennemi ciblé, pierre suivie
+_PROJECTILE = struct.Struct("<Bddddqdddd?ii")
+# position, rayon, durée, temps écoulé, actif
+_EFFET = struct.Struct("<ddddd?")
+
+_ETATS_TOUR = ("idle", "preattack", "attack")
+_ETATS_ANIMATION = ("Idle", "Preattack", "Attack")
+_PROJECTILES = (
+    ProjectileFleche,
+    ProjectilePierre,
+    ProjectileTourMage,
+    ProjectileMageEnnemi,
+)
+_AUCUN = -1
+
+
+def _temps(valeur: Optional[float]) -> float:
+    """Instant optionnel -> flottant (NaN pour None)."""
+    return math.nan if valeur is None else valeur
+
+
+def _temps_optionnel(valeur: float) -> Optional[float]:
+    return None if math.isnan(valeur) else valeur
+
+
+def _indice_ennemi(game: "Game", ennemi: Optional[Ennemi]) -> int:
+    """Indice d'un ennemi dans la liste active (-1 s'il n'y est plus)."""
+    if ennemi is None:
+        return _AUCUN
+    indice = ennemi._indice_actif
+    ennemis = game.ennemi_manager.ennemis
+    if 0 <= indice < len(ennemis) and ennemis[indice] is ennemi:
+        return indice
+    return _AUCUN
+
+
+def capturer(game: "Game") -> bytes:
+    """
+    Sérialise l'état de la partie.
+
+    Args:
+        game: Partie à sauvegarder (entre deux frames)
+
+    Returns:
+        La sauvegarde, à passer à `restaurer`
+    """
+    em = game.ennemi_manager
+    tm = game.tour_manager
+    # Les ennemis sortis du jeu pendant la frame quittent la liste active
+    em.nettoyer_ennemis_morts()
+
+    fichier_vagues = em.fichier_vagues.encode("utf-8")
+    morceaux = [
+        _ENTETE.pack(
+            SIGNATURE,
+            VERSION_SAUVEGARDE,
+            horloge.temps_exact_ms(),
+            game.graine,
+            game.nb_ticks,
+            int(game.joueur.argent),
+            int(game.joueur.point_de_vie),
+            em.num_vague,
+            em.debut_vague,
+            em.est_nuit,
+            em.fuites,
+            len(fichier_vagues),
+        ),
+        fichier_vagues,
+        _PRIX.pack(*(tm.prix_par_type[t] for t in DEFAULT_TOWER_TYPES)),
+    ]
+    vision, fee, eclair = game.sorts["vision"], game.sorts["fee"], game.sorts["eclair"]
+    case_eclair = eclair.case_cible or (_AUCUN, _AUCUN)
+    morceaux.append(
+        _SORTS.pack(
+            vision.niveau,
+            fee.niveau,
+            fee.actif,
+            _temps(fee.temps_debut),
+            eclair.niveau,
+            case_eclair[0],
+            case_eclair[1],
+            _temps(eclair.temps_activation),
+        )
+    )
+    a_venir = em._programme[em._prochain :]
+    morceaux.append(
+        _NOMBRES.pack(
+            len(tm.tours),
+            len(em.ennemis),
+            len(a_venir),
+            len(tm.projectiles),
+            len(tm.effets_explosion),
+        )
+    )
+
+    cases = {id(d["instance"]): (c, d) for c, d in tm.positions_occupees.items()}
+    for t in tm.tours:
+        (x, y), donnees = cases[id(t)]
+        delai = t._time_since_last_shot
+        if t.endormie:
+            # Temps passé en veille, crédité au réveil
+            delai += tm._temps_veille - t._debut_veille
+        anim = t._anim
+        if isinstance(t, Campement):
+            frame, minuteur = t.frame_index, t.frame_timer
+        else:
+            frame, minuteur = anim.index, anim.timer
+        morceaux.append(
+            _TOUR.pack(
+                DEFAULT_TOWER_TYPES.index(donnees["type"]),
+                x,
+                y,
+                t.id,
+                int(donnees.get("prix", 0)),
+                t.portee,
+                t.cooldown_s,
+                delai,
+                _ETATS_TOUR.index(t._etat),
+                _indice_ennemi(game, t._cible),
+                _ETATS_ANIMATION.index(anim.etat),
+                anim.direction.encode("ascii"),
+                anim.flip_x,
+                frame,
+                minuteur,
+            )
+        )
+
+    for e in em.ennemis:
+        morceaux.append(
+            _ENNEMI.pack(
+                e.TYPE.id,
+                e.tempsApparition,
+                e.vitesse,
+                e._segment_index,
+                e._dist_on_segment,
+                e.position.x,
+                e.position.y,
+                int(e.pointsDeVie),
+                e._arrive_au_bout,
+                e.visible,
+                e.etat,
+                e.frame_index,
+                e.frame_timer,
+                e.flip,
+                e.block_timer,
+                e._time_since_last_attack,
+                e._recompense_donnee,
+                e._ne_pas_recompenser,
+            )
+        )
+    for id_ennemi, temps in a_venir:
+        morceaux.append(_APPARITION.pack(id_ennemi, temps))
+
+    indices_projectiles = {id(p): i for i, p in enumerate(tm.projectiles)}
+    for p in tm.projectiles:
+        cible_proj = getattr(p, "cible_proj", None)
+        morceaux.append(
+            _PROJECTILE.pack(
+                _PROJECTILES.index(type(p)),
+                p.x,
+                p.y,
+                p.vx,
+                p.vy,
+                p.degats,
+                p.vitesse,
+                p.rayon_collision,
+                _temps(p.portee_max),
+                p._distance_parcourue,
+                p.detruit,
+                _indice_ennemi(game, p.cible),
+                indices_projectiles.get(id(cible_proj), _AUCUN),
+            )
+        )
+
+    for effet in tm.effets_explosion:
+        morceaux.append(
+            _EFFET.pack(
+                effet.x,
+                effet.y,
+                effet.rayon_max,
+                effet.duree,
+                effet.temps_ecoule,
+                effet.actif,
+            )
+        )
+    return b"".join(morceaux)
+
+
+class _Lecteur:
+    """Lit les enregistrements successifs d'une sauvegarde."""
+
+    def __init__(self, donnees: bytes) -> None:
+        self.donnees = memoryview(donnees)
+        self.position = 0
+
+    def lire(self, format_: struct.Struct) -> tuple:
+        valeurs = format_.unpack_from(self.donnees, self.position)
+        self.position += format_.size
+        return valeurs
+
+    def lire_octets(self, taille: int) -> bytes:
+        octets = bytes(self.donnees[self.position : self.position + taille])
+        self.position += taille
+        return octets
+
+
+def restaurer(game: "Game", donnees: bytes) -> None:
+    """
+    Remet la partie dans l'état d'une sauvegarde.
+
+    Args:
+        game: Partie à restaurer (même carte et même fichier de vagues)
+        donnees: Sauvegarde produite par `capturer`
+
+    Raises:
+        ValueError: Si la sauvegarde est invalide, d'une autre version ou d'un
+            autre fichier de vagues
+    """
+    try:
+        _restaurer(game, _Lecteur(donnees))
+    except (struct.error, IndexError, KeyError) as erreur:
+        raise ValueError(f"Sauvegarde illisible : {erreur}") from erreur
+
+
+def _restaurer(game: "Game", lecteur: _Lecteur) -> None:
+    em = game.ennemi_manager
+    tm = game.tour_manager
+    (
+        signature,
+        version,
+        temps_ms,
+        graine,
+        nb_ticks,
+        argent,
+        point_de_vie,
+        num_vague,
+        debut_vague,
+        est_nuit,
+        fuites,
+        longueur_fichier,
+    ) = lecteur.lire(_ENTETE)
+    if signature != SIGNATURE or version != VERSION_SAUVEGARDE:
+        raise ValueError(f"Sauvegarde incompatible (version {version})")
+    fichier_vagues = lecteur.lire_octets(longueur_fichier).decode("utf-8")
+    if fichier_vagues != em.fichier_vagues:
+        raise ValueError(f"Sauvegarde d'un autre fichier de vagues : {fichier_vagues}")
+
+    horloge.regler(temps_ms)
+    game.graine = graine
+    game.nb_ticks = nb_ticks
+    game.joueur.argent = argent
+    game.joueur.point_de_vie = point_de_vie
+    em.num_vague = num_vague
+    em.debut_vague = debut_vague
+    em.est_nuit = est_nuit
+    em.fuites = fuites
+    for type_tour, prix in zip(DEFAULT_TOWER_TYPES, lecteur.lire(_PRIX)):
+        tm.prix_par_type[type_tour] = prix
+
+    vision, fee, eclair = game.sorts["vision"], game.sorts["fee"], game.sorts["eclair"]
+    (
+        vision.niveau,
+        fee.niveau,
+        fee.actif,
+        debut_fee,
+        eclair.niveau,
+        case_x,
+        case_y,
+        debut_eclair,
+    ) = lecteur.lire(_SORTS)
+    fee.temps_debut = _temps_optionnel(debut_fee)
+    eclair.case_cible = None if case_x == _AUCUN else (case_x, case_y)
+    eclair.temps_activation = _temps_optionnel(debut_eclair)
+    game.eclair_selectionne = False
+
+    nb_tours, nb_ennemis, nb_a_venir, nb_projectiles, nb_effets = lecteur.lire(
+        _NOMBRES
+    )
+
+    tm.reset()
+    cibles_tours: List[tuple] = []
+    taille = game.taille_case
+    for _ in range(nb_tours):
+        (
+            type_indice,
+            x,
+            y,
+            tour_id,
+            prix,
+            portee,
+            recharge,
+            delai,
+            etat,
+            cible,
+            etat_anim,
+            direction,
+            flip_x,
+            frame,
+            minuteur,
+        ) = lecteur.lire(_TOUR)
+        type_tour = DEFAULT_TOWER_TYPES[type_indice]
+        position = Position(x * taille + taille // 2, y * taille + taille // 2)
+        t = tm.creer_tour(type_tour, position, tour_id)
+        t.portee = portee
+        t.cooldown_s = recharge
+        t._time_since_last_shot = delai
+        t._etat = _ETATS_TOUR[etat]
+        t._anim.demarrer(
+            _ETATS_ANIMATION[etat_anim], direction.rstrip(b"\0").decode("ascii"), flip_x
+        )
+        if isinstance(t, Campement):
+            t.frame_index, t.frame_timer = frame, minuteur
+        else:
+            t._anim.index, t._anim.timer = frame, minuteur
+        if t._etat != "idle":
+            t._au_tir = tm.au_tir
+        tm.ajouter_tour(t)
+        tm.positions_occupees[(x, y)] = {
+            "type": type_tour,
+            "frame": 0,
+            "instance": t,
+            "prix": prix,
+            "type_selectionne": type_tour,
+        }
+        cibles_tours.append((t, cible))
+
+    # Comme dans une partie neuve : ordre de dessin et temps d'images en attente
+    # repartent de zéro (la capture a lieu après un pas affiché)
+    em._ordre_suivant = 0
+    em._dt_images = 0.0
+    ennemis: List[Ennemi] = []
+    for _ in range(nb_ennemis):
+        (
+            type_id,
+            apparition,
+            vitesse,
+            segment,
+            distance,
+            px,
+            py,
+            points_de_vie,
+            arrive,
+            visible,
+            etat,
+            frame,
+            minuteur,
+            flip,
+            parade,
+            depuis_attaque,
+            recompense_donnee,
+            sans_recompense,
+        ) = lecteur.lire(_ENNEMI)
+        e = em.creer_ennemi(type_id, apparition)
+        e.vitesse = vitesse
+        e._segment_index = segment
+        e._dist_on_segment = distance
+        e.position.x, e.position.y = px, py
+        e.pointsDeVie = points_de_vie
+        e._arrive_au_bout = arrive
+        e.visible = visible
+        e.etat, e.frame_index, e.frame_timer, e.flip = etat, frame, minuteur, flip
+        e.block_timer = parade
+        e._time_since_last_attack = depuis_attaque
+        e._recompense_donnee = recompense_donnee
+        e._ne_pas_recompenser = sans_recompense
+        ennemis.append(e)
+    programme = [lecteur.lire(_APPARITION) for _ in range(nb_a_venir)]
+    em.activer_ennemis(ennemis, programme)
+
+    for t, cible in cibles_tours:
+        t._cible = None if cible == _AUCUN else ennemis[cible]
+
+    images = {
+        ProjectileFleche: tm.image_fleche,
+        ProjectilePierre: tm.image_pierre,
+        ProjectileTourMage: tm.image_orbe_mage,
+        ProjectileMageEnnemi: tm.image_projectileMageEnnemi,
+    }
+    projectiles: List = []
+    for _ in range(nb_projectiles):
+        (
+            type_indice,
+            px,
+            py,
+            vx,
+            vy,
+            degats,
+            vitesse,
+            rayon,
+            portee_max,
+            parcouru,
+            detruit,
+            cible,
+            cible_proj,
+        ) = lecteur.lire(_PROJECTILE)
+        classe = _PROJECTILES[type_indice]
+        origine = Position(px, py)
+        if classe is ProjectilePierre:
+            p = ProjectilePierre(origine, origine, game_ref=game)
+        elif classe is ProjectileMageEnnemi:
+            suivie = projectiles[cible_proj] if cible_proj != _AUCUN else None
+            p = ProjectileMageEnnemi(origine, suivie or _PierreDetruite(px, py))
+            p.cible_proj = suivie
+            # Pierre déjà retirée : le projectile disparaît à la frame suivante
+            p.detruit = detruit or suivie is None
+        else:
+            p = classe(origine, origine)
+        p.vx, p.vy = vx, vy
+        p.degats = degats
+        p.vitesse = vitesse
+        p.rayon_collision = rayon
+        p.portee_max = _temps_optionnel(portee_max)
+        p._distance_parcourue = parcouru
+        p.detruit = p.detruit or detruit
+        p.cible = None if cible == _AUCUN else ennemis[cible]
+        p.image_base = images[classe]
+        projectiles.append(p)
+    tm.projectiles = projectiles
+
+    effets: List[EffetExplosion] = []
+    for _ in range(nb_effets):
+        x, y, rayon, duree, ecoule, actif = lecteur.lire(_EFFET)
+        effet = EffetExplosion(x, y, rayon, duree)
+        effet.temps_ecoule = ecoule
+        effet.actif = actif
+        effets.append(effet)
+    tm.effets_explosion = effets
+
+
+class _PierreDetruite:
+    """Pierre fictive pour un projectile de mage dont la cible a disparu."""
+
+    detruit = True
+
+    def __init__(self, x: float, y: float) -> None:
+        self.x, self.y = x, y
+
+
+def sauvegarder_fichier(game: "Game", chemin: str = FICHIER_SAUVEGARDE_RAPIDE) -> None:
+    """Écrit la sauvegarde de la partie dans un fichier."""
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    temporaire = f"{chemin}.{os.getpid()}.tmp"
+    with open(temporaire, "wb") as f:
+        f.write(capturer(game))
+    os.replace(temporaire, chemin)
+
+
+def charger_fichier(game: "Game", chemin: str = FICHIER_SAUVEGARDE_RAPIDE) -> None:
+    """
+    Restaure la partie depuis un fichier de sauvegarde.
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+        ValueError: Si la sauvegarde est invalide
+    """
+    with open(chemin, "rb") as f:
+        restaurer(game, f.read())
@@ -0,0 +1,90 @@
+"""
+Table des types d'ennemis (`src/data/typeTroupe.txt`).
+
+Chaque ligne décrit un type : identifiant utilisé dans les fichiers de vagues,
+dossier des sprites, animation de marche, échelle, vitesse, PV, dégâts,
+récompense et capacités spéciales. Les classes d'ennemis (`models.ennemi`) et
+`ENEMY_CLASSES` sont construites à partir de cette table.
+
+Capacités spéciales (colonne `special`, séparées par des virgules) :
+- `attaque` : lance des projectiles sur les pierres des catapultes (mage)
+- `blocage` : pare les flèches (10 % des dégâts) avec les feuilles `*_Block.png`
+"""
+
+import csv
+import os
+from fractions import Fraction
+from typing import Dict, FrozenSet, NamedTuple
+
+from classes.constants import PROJECT_ROOT
+
+FICHIER_TYPES_ENNEMIS = os.path.join(PROJECT_ROOT, "src", "data", "typeTroupe.txt")
+
+# États d'animation (entiers) : direction + BLOCAGE si l'ennemi pare
+BAS, HAUT, COTE = 0, 1, 2
+BLOCAGE = 3
+NB_ETATS = 6
+# Préfixe des feuilles de sprites pour chaque direction
+PREFIXES_DIRECTION = ("D", "U", "S")
+
+
+class TypeEnnemi(NamedTuple):
+    """Une ligne de la table des types d'ennemis."""
+
+    id: int
+    nom: str
+    dossier: str  # sous-dossier de assets/enemy
+    animation: str  # feuille de marche : {D,U,S}_{animation}.png
+    nb_frames: int
+    echelle: float
+    vitesse: float  # px/s
+    points_de_vie: int
+    degats: int
+    argent: int
+    special: FrozenSet[str]
+
+    @property
+    def attaque(self) -> bool:
+        return "attaque" in self.special
+
+    @property
+    def blocage(self) -> bool:
+        return "blocage" in self.special
+
+
+def charger_types_ennemis(
+    chemin: str = FICHIER_TYPES_ENNEMIS,
+) -> Dict[int, TypeEnnemi]:
+    """
+    Lit la table des types d'ennemis.
+
+    Args:
+        chemin: Fichier `id;type;dossier;...` (séparateur « ; »)
+
+    Returns:
+        Dictionnaire {id: TypeEnnemi}, dans l'ordre du fichier
+    """
+    types: Dict[int, TypeEnnemi] = {}
+    with open(chemin, newline="", encoding="utf-8") as f:
+        for ligne in csv.DictReader(f, delimiter=";"):
+            type_ennemi = TypeEnnemi(
+                id=int(ligne["id"]),
+                nom=ligne["type"],
+                dossier=ligne["dossier"],
+                animation=ligne["animation"],
+                nb_frames=int(ligne["nb_frames"]),
+                # Fraction accepte « 2/3 » comme « 1.6 »
+                echelle=float(Fraction(ligne["echelle"])),
+                vitesse=float(ligne["vitesse"]),
+                points_de_vie=int(ligne["pointsDeVie"]),
+                degats=int(ligne["degats"]),
+                argent=int(ligne["argent"]),
+                special=frozenset(s for s in ligne["special"].split(",") if s),
+            )
+            if type_ennemi.id in types:
+                raise ValueError(f"ID ennemi en double : {type_ennemi.id}")
+            types[type_ennemi.id] = type_ennemi
+    return types
+
+
+TYPES_ENNEMIS: Dict[int, TypeEnnemi] = charger_types_ennemis()
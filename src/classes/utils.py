@@ -1,4 +1,5 @@
 import json
+import math
 import os
 from math import hypot
 from typing import List
@@ -12,12 +13,29 @@ def distance_positions(a: Position, b: Position) -> float:
     return hypot(a.x - b.x, a.y - b.y)
 
 
+# Points des chemins déjà lus : (fichier, calque) -> (mtime, [(x, y), ...])
+_chemins_tiled: dict = {}
+
+
 def charger_chemin_tiled(tmj_path: str, layer_name: str = "path") -> List[Position]:
     """
     Charge les points d'un polygon depuis un calque d'objets dans un fichier .tmj.
+
+    Le fichier n'est relu que s'il a changé (chaque ennemi charge son chemin) ;
+    les Positions retournées sont neuves à chaque appel.
     """
     if not os.path.isabs(tmj_path):
         tmj_path = os.path.join(PROJECT_ROOT, tmj_path)
+    mtime = os.stat(tmj_path).st_mtime_ns
+    cle = (tmj_path, layer_name)
+    en_cache = _chemins_tiled.get(cle)
+    if en_cache is None or en_cache[0] != mtime:
+        en_cache = (mtime, _lire_chemin_tiled(tmj_path, layer_name))
+        _chemins_tiled[cle] = en_cache
+    return [Position(x, y) for x, y in en_cache[1]]
+
+
+def _lire_chemin_tiled(tmj_path: str, layer_name: str) -> List[tuple]:
     with open(tmj_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
@@ -38,86 +56,178 @@ def charger_chemin_tiled(tmj_path: str, layer_name: str = "path") -> List[Positi
         raise ValueError(f"Aucun polygon trouvé dans le calque '{layer_name}'.")
 
     ox, oy = obj["x"], obj["y"]
-    return [Position(ox + p["x"], oy + p["y"]) for p in obj["polygon"]]
+    return [(ox + p["x"], oy + p["y"]) for p in obj["polygon"]]
 
 
 def cases_depuis_chemin(
-    chemin_positions: list[Position], taille_case: int
+    chemin_positions: list[Position], taille_case: int, epaisseur: float = 0.0
 ) -> set[tuple[int, int]]:
     """
     Calcule les cases de grille traversées par un chemin polygonal.
-    
-    Cette fonction utilise l'algorithme de ligne de Bresenham pour déterminer
-    toutes les cases de grille qui sont traversées par un chemin défini par
-    une série de points. C'est utilisé pour marquer les cases "interdites"
-    où on ne peut pas placer de tours.
-    
+
+    Chaque segment (polygone fermé : le dernier point est relié au premier) est
+    parcouru case par case à la manière d'Amanatides et Woo : on passe à la
+    case voisine en x ou en y selon la prochaine frontière atteinte, sans
+    tracer le segment pixel par pixel. Sur les chemins horizontaux et
+    verticaux de la carte, le résultat est celui de l'ancien tracé de
+    Bresenham ; sur un segment oblique, les cases dont seul un coin est
+    traversé sont désormais gardées. C'est utilisé pour marquer les cases
+    "interdites" où on ne peut pas placer de tours.
+
     Args:
         chemin_positions: Liste des points du chemin (Position)
         taille_case: Taille d'une case en pixels (ex: 64)
-        
+        epaisseur: Largeur du chemin en pixels ; 0 = ligne sans épaisseur.
+            Sinon, toute case à moins de epaisseur / 2 d'un segment est gardée.
+
     Returns:
         Set des coordonnées (x, y) des cases traversées
-        
+
     Exemple:
         chemin = [Position(0, 0), Position(128, 64)]
         cases = cases_depuis_chemin(chemin, 64)
-        # Retourne {(0, 0), (1, 0), (2, 1)} pour un chemin diagonal
+        # Retourne {(0, 0), (1, 0), (1, 1), (2, 1)} pour un chemin diagonal
     """
     cases_traversees: set[tuple[int, int]] = set()
-    
+
     # Vérification des paramètres
     if not chemin_positions or taille_case <= 0:
         return cases_traversees
 
-    # Traiter chaque segment du chemin
-    for i in range(len(chemin_positions)):
+    nb_points = len(chemin_positions)
+    for i in range(nb_points):
         p1 = chemin_positions[i]
-        p2 = chemin_positions[(i + 1) % len(chemin_positions)]  # Boucle sur le dernier point
-
-        # Convertir les positions en coordonnées entières
+        p2 = chemin_positions[(i + 1) % nb_points]  # Boucle sur le dernier point
+        # Coordonnées entières, comme l'ancien tracé au pixel près
         x1, y1 = int(p1.x), int(p1.y)
         x2, y2 = int(p2.x), int(p2.y)
-
-        # ALGORITHME DE LIGNE DE BRESENHAM
-        # Cet algorithme trace une ligne pixel par pixel entre deux points
-        # et détermine quelles cases de grille sont traversées
-        
-        # Calculer les différences et directions
-        dx = abs(x2 - x1)  # Distance horizontale absolue
-        dy = abs(y2 - y1)  # Distance verticale absolue
-        x_step = 1 if x1 < x2 else -1  # Direction horizontale (+1 ou -1)
-        y_step = 1 if y1 < y2 else -1  # Direction verticale (+1 ou -1)
-
-        # Point de départ
-        x, y = x1, y1
-        cases_traversees.add((x // taille_case, y // taille_case))
-
-        # Tracer la ligne selon l'orientation dominante
-        if dx > dy:
-            # Ligne principalement horizontale
-            error = dx / 2  # Erreur accumulée pour décider du déplacement vertical
-            while x != x2:
-                error -= dy
-                if error < 0:
-                    y += y_step  # Déplacement vertical
-                    error += dx  # Réinitialiser l'erreur
-                x += x_step  # Déplacement horizontal
-                cases_traversees.add((x // taille_case, y // taille_case))
+        if epaisseur > 0:
+            _cases_segment_epais(
+                x1, y1, x2, y2, taille_case, epaisseur / 2, cases_traversees
+            )
         else:
-            # Ligne principalement verticale
-            error = dy / 2  # Erreur accumulée pour décider du déplacement horizontal
-            while y != y2:
-                error -= dx
-                if error < 0:
-                    x += x_step  # Déplacement horizontal
-                    error += dy  # Réinitialiser l'erreur
-                y += y_step  # Déplacement vertical
-                cases_traversees.add((x // taille_case, y // taille_case))
+            _cases_segment(x1, y1, x2, y2, taille_case, cases_traversees)
 
     return cases_traversees
 
 
+def _cases_segment(
+    x1: int, y1: int, x2: int, y2: int, taille_case: int, cases: set
+) -> None:
+    """Ajoute à `cases` les cases traversées par le segment (parcours de grille)."""
+    cx, cy = x1 // taille_case, y1 // taille_case
+    fin_x, fin_y = x2 // taille_case, y2 // taille_case
+    cases.add((cx, cy))
+
+    dx, dy = x2 - x1, y2 - y1
+    pas_x = (dx > 0) - (dx < 0)
+    pas_y = (dy > 0) - (dy < 0)
+    # Paramètre t (0 → 1 le long du segment) de la prochaine frontière en x / en y
+    # Les pixels sont des points entiers : la frontière suivante à droite est
+    # (cx + 1) * taille_case, à gauche cx * taille_case - 1.
+    if dx:
+        bord_x = (cx + 1) * taille_case if pas_x > 0 else cx * taille_case - 1
+        t_x, delta_x = (bord_x - x1) / dx, taille_case / abs(dx)
+    else:
+        t_x = delta_x = math.inf
+    if dy:
+        bord_y = (cy + 1) * taille_case if pas_y > 0 else cy * taille_case - 1
+        t_y, delta_y = (bord_y - y1) / dy, taille_case / abs(dy)
+    else:
+        t_y = delta_y = math.inf
+
+    for _ in range(abs(fin_x - cx) + abs(fin_y - cy)):
+        if cx == fin_x and cy == fin_y:
+            break
+        if t_x < t_y:
+            cx += pas_x
+            t_x += delta_x
+        elif t_y < t_x:
+            cy += pas_y
+            t_y += delta_y
+        else:
+            # Coin de case : passage en diagonale
+            cx += pas_x
+            cy += pas_y
+            t_x += delta_x
+            t_y += delta_y
+        cases.add((cx, cy))
+
+
+def _cases_segment_epais(
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+    taille_case: int,
+    demi_epaisseur: float,
+    cases: set,
+) -> None:
+    """Ajoute les cases à moins de `demi_epaisseur` pixels du segment."""
+    min_x = int((min(x1, x2) - demi_epaisseur) // taille_case)
+    max_x = int((max(x1, x2) + demi_epaisseur) // taille_case)
+    min_y = int((min(y1, y2) - demi_epaisseur) // taille_case)
+    max_y = int((max(y1, y2) + demi_epaisseur) // taille_case)
+    for cy in range(min_y, max_y + 1):
+        for cx in range(min_x, max_x + 1):
+            rect = (cx * taille_case, cy * taille_case, taille_case)
+            if _distance_segment_case(x1, y1, x2, y2, rect) <= demi_epaisseur:
+                cases.add((cx, cy))
+
+
+def _distance_segment_case(
+    x1: float, y1: float, x2: float, y2: float, rect: tuple
+) -> float:
+    """Distance entre un segment et une case (x, y, taille) ; 0 s'ils se touchent."""
+    gauche, haut, taille = rect
+    droite, bas = gauche + taille, haut + taille
+
+    def distance_point_case(px: float, py: float) -> float:
+        return hypot(
+            max(gauche - px, 0.0, px - droite), max(haut - py, 0.0, py - bas)
+        )
+
+    def distance_point_segment(px: float, py: float) -> float:
+        dx, dy = x2 - x1, y2 - y1
+        longueur2 = dx * dx + dy * dy
+        t = 0.0
+        if longueur2:
+            t = min(1.0, max(0.0, ((px - x1) * dx + (py - y1) * dy) / longueur2))
+        return hypot(x1 + t * dx - px, y1 + t * dy - py)
+
+    # Le segment coupe la case : on le découpe sur la case (Liang-Barsky)
+    t_min, t_max = 0.0, 1.0
+    for p, q in (
+        (x1 - x2, x1 - gauche),
+        (x2 - x1, droite - x1),
+        (y1 - y2, y1 - haut),
+        (y2 - y1, bas - y1),
+    ):
+        if p == 0:
+            if q < 0:
+                break
+        else:
+            t = q / p
+            if p < 0:
+                t_min = max(t_min, t)
+            else:
+                t_max = min(t_max, t)
+    else:
+        if t_min <= t_max:
+            return 0.0
+
+    # Sinon la distance est atteinte en une extrémité du segment ou un coin
+    return min(
+        distance_point_case(x1, y1),
+        distance_point_case(x2, y2),
+        *(
+            distance_point_segment(coin_x, coin_y)
+            for coin_x in (gauche, droite)
+            for coin_y in (haut, bas)
+        ),
+    )
+
+
 def position_dans_grille(
     pos: tuple[int, int], largeur_ecran: int, hauteur_ecran: int
 ) -> bool:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import random
 
 import pygame
 
+from classes import horloge
 from classes.bouton import Bouton
 from classes.constants import (
     DEFAULT_TOWER_TYPES,
@@ -10,20 +12,26 @@ from classes.constants import (
     GAME_WIDTH,
     GRID_COLS,
     GRID_ROWS,
-    MAP_PNG,
-    MAP_TILESET_TMJ,
+    PRIORITE_SFX_PAR_VITESSE,
     TILE_SIZE,
+    VITESSES_JEU,
 )
+from classes.carte import charger_carte
+from classes.couverture import charger_couverture
+from classes.csv import FICHIER_VAGUES_DEFAUT
+from classes.performance import MoniteurPerformance
 from classes.pointeur import Pointeur
+from classes.qualite import PALIER_VOIX, VOIX_SFX_REDUITES
+from classes.polices import obtenir_police
 from classes.position import Position
+from classes.replay import EnregistreurPartie, LecteurReplay
+from classes.sauvegarde import capturer, charger_fichier, sauvegarder_fichier
 from classes.sprites import (
-    charger_image_assets,
+    charger_image_simple,
     charger_sprites_tour_assets,
 )
 from classes.utils import (
     case_depuis_pos,
-    cases_depuis_chemin,
-    charger_chemin_tiled,
     distance_positions,
     position_dans_grille,
 )
@@ -32,7 +40,7 @@ from managers.ennemi_manager import EnnemiManager
 from managers.shop_manager import ShopManager
 from managers.tour_manager import TourManager
 from managers.ui_manager import UIManager
-from models.ennemi import Mage
+from models.ennemi import Ennemi
 from models.joueur import Joueur
 from models.sort import SortEclair, SortFee, SortVision
 
@@ -41,18 +49,36 @@ from models.sort import SortEclair, SortFee, SortVision
 
 class Game:
 
-    def __init__(self, police: pygame.font.Font, est_muet: bool = False):
+    def __init__(
+        self,
+        police: pygame.font.Font,
+        est_muet: bool = False,
+        fichier_vagues: str | None = None,
+        graine: int | None = None,
+    ):
         self.joueur = Joueur(argent=45, point_de_vie=100)
 
+        # Nouvelle partie : le temps de jeu repart de zéro
+        horloge.reinitialiser()
+
+        # Carte compilée (chemin, cases interdites, château), partagée par les managers
+        self.carte_jeu = charger_carte()
+
+        # Graine aléatoire, enregistrée avec les replays
+        self.graine = random.randrange(2**32) if graine is None else graine
+        random.seed(self.graine)
+
         # Gestion des vagues
         # Manager des ennemis
-        self.ennemi_manager = EnnemiManager(self)
+        self.ennemi_manager = EnnemiManager(
+            self, fichier_vagues or FICHIER_VAGUES_DEFAUT
+        )
 
         # Manager des tours
         self.tour_manager = TourManager(self)
 
         self.police = police
-        self.police_tour = pygame.font.Font(None, 44)
+        self.police_tour = obtenir_police(44)
         # self.est_muet = est_muet
         # self._sons_cache: dict[str, pygame.mixer.Sound] = {}
         self.couleurs = {
@@ -100,18 +126,22 @@ class Game:
             "contour": (220, 180, 60),  # doré
             "texte": (240, 220, 180),  # beige
         }
-        police_medievale = pygame.font.Font(None, 38)
+        police_medievale = obtenir_police(38)
         self.bouton_vague = Bouton(
             "Lancer la vague",
             self.shop_manager.rect_boutique.x + 20,
             self.hauteur_ecran - 70,
             self.shop_manager.largeur_boutique - 40,
             50,
-            self.ennemi_manager.lancer_vague,
+            self.lancer_vague,
             police_medievale,
             medieval_couleurs,
         )
 
+        # Vitesse du jeu : pas de simulation par frame affichée (x1 à x8)
+        self.vitesse = 1
+        self.boutons_vitesse = self._creer_boutons_vitesse(medieval_couleurs)
+
         self.type_selectionne: str | None = None
 
         self.couleur_boutique_bg = (30, 30, 30)
@@ -127,24 +157,44 @@ class Game:
         # Carte / chemin
         self.clock = pygame.time.Clock()
         self.carte = self._charger_carte()
-        self.tmj_path = MAP_TILESET_TMJ
-        chemin_positions = charger_chemin_tiled(self.tmj_path, layer_name="path")
-        self.cases_bannies = cases_depuis_chemin(chemin_positions, self.taille_case)
-        # Bannir aussi les 6 cases des deux premières lignes (x=0..5, y=0..1)
-        for y in (0, 1):
-            for x in range(0, 6):
-                if 0 <= x < self.colonnes and 0 <= y < self.lignes:
-                    self.cases_bannies.add((x, y))
+        self.tmj_path = self.carte_jeu.source
+        # Cases du chemin + 6 cases des deux premières lignes (x=0..5, y=0..1)
+        self.cases_bannies = self.carte_jeu.cases_bannies()
+
+        # Longueur de chemin à portée de chaque case, par type de tour
+        self.couverture = charger_couverture(
+            self.tmj_path,
+            self.tour_manager.portee_par_type,
+            self.colonnes,
+            self.lignes,
+            self.taille_case,
+        )
 
         # Pointeur
         self.pointeur = Pointeur()
 
+        # Mesure des temps par phase (affichage F3)
+        self.perf = MoniteurPerformance()
+        # Qualité d'affichage adaptative : le son suit le palier courant
+        self.perf.qualite.au_changement = self._appliquer_qualite
+
+        # Position du curseur imposée (simulation sans fenêtre) ; None = souris réelle
+        self.curseur: tuple[int, int] | None = None
+
+        # Enregistrement / relecture des actions du joueur
+        self.nb_ticks = 0
+        self.enregistreur: EnregistreurPartie | None = None
+        self.lecteur: LecteurReplay | None = None
+
+        # Sauvegarde de la partie au lancement de chaque vague : {vague: données}
+        self.points_de_controle: dict[int, bytes] = {}
+
     # ---------- Chargements ----------
     def _charger_carte(self):
         """Charge la carte en utilisant la fonction utilitaire."""
-        img = charger_image_assets(MAP_PNG.split("/")[-1], "tilesets")
+        img = charger_image_simple(self.carte_jeu.fond)
         if img is None:
-            raise FileNotFoundError(f"Carte non trouvée: {MAP_PNG}")
+            raise FileNotFoundError(f"Carte non trouvée: {self.carte_jeu.fond}")
         return img
 
     def _charger_tours(self):
@@ -154,41 +204,87 @@ class Game:
             assets[tower_type] = charger_sprites_tour_assets(tower_type)
         return assets
 
+    def _creer_boutons_vitesse(self, couleurs: dict) -> list[Bouton]:
+        """Crée les boutons de vitesse, en ligne au-dessus du numéro de vague."""
+        nb = len(VITESSES_JEU)
+        ecart = 10
+        largeur = (self.bouton_vague.rect.w - ecart * (nb - 1)) // nb
+        y = self.bouton_vague.rect.y - 36 - 50
+        police = obtenir_police(30)
+        return [
+            Bouton(
+                f"x{vitesse}",
+                self.bouton_vague.rect.x + i * (largeur + ecart),
+                y,
+                largeur,
+                40,
+                lambda vitesse=vitesse: self.regler_vitesse(vitesse),
+                police,
+                couleurs,
+            )
+            for i, vitesse in enumerate(VITESSES_JEU)
+        ]
+
     def _dessiner_personnages_tours(self, ecran):
         self.tour_manager.dessiner_personnages_tours(ecran)
 
     # ---------- Update / boucle ----------
-    def maj(self, dt: float):
+    def maj(self, dt: float, visuel: bool = True):
+        """
+        Avance la simulation d'un pas.
+
+        Args:
+            dt: Pas de temps (s)
+            visuel: False si le pas ne sera pas affiché (jeu accéléré) : le
+                travail purement visuel (images des ennemis, explosions) est
+                reporté au prochain pas affiché
+        """
+        if self.enregistreur is not None:
+            self.enregistreur.noter_tick(dt, self.position_souris())
+        self.nb_ticks += 1
+        horloge.avancer(dt)
+        perf = self.perf
+        t = perf.horloge()
+
         # Mise à jour du manager d'ennemis et des vagues
         self.ennemi_manager.mettre_a_jour_vague()
-        self.ennemi_manager.mettre_a_jour_ennemis(dt)
+        t = perf.noter("maj vague", t)
+        self.ennemi_manager.mettre_a_jour_ennemis(dt, visuel)
+        t = perf.noter("maj ennemis", t)
 
         # Appliquer les effets des sorts
         for sort in self.sorts.values():
             sort.appliquer_effet(self)
+        t = perf.noter("maj sorts", t)
 
         # Mettre à jour la visibilité des ennemis (après les sorts)
         for ennemi in self.ennemi_manager.get_ennemis_actifs():
             if hasattr(ennemi, "majVisible"):
                 ennemi.majVisible(self)
+        t = perf.noter("maj visibilite", t)
 
         # Mise à jour des tours (acquisition cible + tir)
         self.tour_manager.mettre_a_jour_tours(
             dt, self.ennemi_manager.get_ennemis_actifs()
         )
+        t = perf.noter("maj tours", t)
 
         # Mise à jour des projectiles + collisions
         self.tour_manager.mettre_a_jour_projectiles(
-            dt, self.ennemi_manager.get_ennemis_actifs()
+            dt, self.ennemi_manager.get_ennemis_actifs(), visuel
         )
+        t = perf.noter("maj projectiles", t)
 
         # Nettoyage ennemis
         self.ennemi_manager.nettoyer_ennemis_morts()
+        t = perf.noter("maj nettoyage", t)
 
         # Gérer la fin de vague (récompenses, nuit, etc.)
         self.ennemi_manager.gerer_fin_vague()
+        perf.noter("maj fin vague", t)
+        perf.allocations.fin_frame()
 
-    def get_closest_mage(self, pos: Position) -> None | Mage:
+    def get_closest_mage(self, pos: Position) -> None | Ennemi:
         """Retourne le mage le plus proche de la position pos."""
         mages = [
             e for e in self.ennemi_manager.get_mages_actifs() if e.ready_to_attack()
@@ -219,12 +315,101 @@ class Game:
             return
 
         dt = self.clock.tick(60) / 1000.0
+        nb_pas = self.vitesse
+        if self.lecteur is not None:
+            # Relecture : actions, curseur et pas de temps enregistrés
+            dt = self.lecteur.preparer_tick(self)
+            if dt is None:
+                return
+            nb_pas = 1
 
         # Délégation complète du rendu à l'UIManager
         self.ui_manager.dessiner_interface_jeu(ecran, dt)
 
         # self.pointeur.draw(ecran, self)  # Désactivé pour enlever le filtre bleu
+        # Jeu accéléré : plusieurs pas de même durée par frame, seul le dernier
+        # est affiché (la frame suivante)
+        for _ in range(nb_pas - 1):
+            self.maj(dt, visuel=False)
+            if self.joueur.point_de_vie <= 0:
+                return
         self.maj(dt)
+        self.perf.qualite.fin_frame()
+
+    def _appliquer_qualite(self, palier: int) -> None:
+        """Ajuste le nombre de voix des bruitages au palier de qualité."""
+        audio = self.audio_manager
+        if palier >= PALIER_VOIX:
+            audio.max_voix_sfx = min(audio.NB_CANAUX_SFX, VOIX_SFX_REDUITES)
+        else:
+            audio.max_voix_sfx = audio.NB_CANAUX_SFX
+
+    def regler_vitesse(self, vitesse: int) -> None:
+        """Règle le nombre de pas de simulation par frame (une des VITESSES_JEU)."""
+        if vitesse not in VITESSES_JEU:
+            return
+        self.vitesse = vitesse
+        # Aux vitesses élevées, seuls les bruitages importants sont joués
+        self.audio_manager.priorite_min_sfx = PRIORITE_SFX_PAR_VITESSE[vitesse]
+
+    # ---------- Actions du joueur (enregistrées pour la relecture) ----------
+    def _noter_commande(self, nom: str, *arguments) -> None:
+        if self.enregistreur is not None:
+            self.enregistreur.noter_commande(horloge.temps_ms(), nom, *arguments)
+
+    def placer_tour(self, case: tuple[int, int], type_tour: str) -> bool:
+        """Pose une tour si la case le permet (True si la tour a été posée)."""
+        case = tuple(case)
+        if not self.tour_manager.peut_placer_tour(case, type_tour, self.cases_bannies):
+            return False
+        if not self.tour_manager.placer_tour(case, type_tour):
+            return False
+        self._noter_commande("placer_tour", case, type_tour)
+        return True
+
+    def vendre_tour(self, case: tuple[int, int]) -> bool:
+        """Vend la tour posée sur la case. Retourne True si une tour a été vendue."""
+        case = tuple(case)
+        if case not in self.tour_manager.positions_occupees:
+            return False
+        self.tour_manager.vendre_tour(case)
+        self._noter_commande("vendre_tour", case)
+        return True
+
+    def lancer_eclair(self, case: tuple[int, int]) -> bool:
+        """Lance l'éclair sur une case et débite son prix (True si réussi)."""
+        if not self.sorts["eclair"].activer_sur_case(case[0], case[1]):
+            return False
+        # Son d'éclair (respecte muet)
+        self.jouer_sfx("loud-thunder.mp3")
+        # Débiter le prix
+        self.joueur.argent -= self.sorts["eclair"].prix
+        self._noter_commande("lancer_eclair", tuple(case))
+        return True
+
+    def acheter_sort(self, cle: str) -> bool:
+        """Achète ou améliore un sort de la boutique (True si l'achat a eu lieu)."""
+        if not self.sorts[cle].acheter(self.joueur):
+            return False
+        self._noter_commande("acheter_sort", cle)
+        return True
+
+    def lancer_vague(self) -> None:
+        """Lance la vague suivante."""
+        self.points_de_controle[self.ennemi_manager.num_vague + 1] = capturer(self)
+        self.ennemi_manager.lancer_vague()
+        self._noter_commande("lancer_vague")
+
+    def terminer_enregistrement(self) -> None:
+        """Écrit l'enregistrement de la partie sur disque, s'il y en a un."""
+        if self.enregistreur is not None:
+            self.enregistreur.sauvegarder()
+
+    def position_souris(self) -> tuple[int, int]:
+        """Retourne la position du curseur (imposée en simulation, sinon la souris)."""
+        if self.curseur is not None:
+            return self.curseur
+        return pygame.mouse.get_pos()
 
     def jouer_sfx(self, fichier: str, volume: float = 1.0) -> None:
         """Joue un son ponctuel via l'AudioManager."""
@@ -237,6 +422,10 @@ class Game:
 
     # ---------- Evénements ----------
     def gerer_evenement(self, event: pygame.event.Event) -> str | None:
+        # En relecture, les actions viennent de l'enregistrement
+        if self.lecteur is not None and event.type == pygame.MOUSEBUTTONDOWN:
+            return None
+
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             # Annuler la sélection d'éclair si elle est active
             if hasattr(self, "eclair_selectionne") and self.eclair_selectionne:
@@ -244,6 +433,28 @@ class Game:
                 return None
             return "PAUSE"
 
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.perf.basculer()
+            return None
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self.perf.allocations.basculer()
+            return None
+
+        # Sauvegarde rapide (F5) et chargement (F9), hors relecture
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+            if self.lecteur is None:
+                sauvegarder_fichier(self)
+            return None
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+            if self.lecteur is None and self.enregistreur is None:
+                try:
+                    charger_fichier(self)
+                except (OSError, ValueError) as erreur:
+                    print(f"Chargement impossible : {erreur}")
+            return None
+
         if event.type == pygame.MOUSEMOTION:
             pos = pygame.mouse.get_pos()
             if position_dans_grille(pos, self.largeur_ecran, self.hauteur_ecran):
@@ -272,11 +483,7 @@ class Game:
                         ]:
                             return None
                         # Activer l'éclair sur cette case
-                        if self.sorts["eclair"].activer_sur_case(x_case, y_case):
-                            # Son d'éclair (respecte muet)
-                            self.jouer_sfx("loud-thunder.mp3")
-                            # Débiter le prix
-                            self.joueur.argent -= self.sorts["eclair"].prix
+                        if self.lancer_eclair(case):
                             # Désélectionner l'éclair
                             self.eclair_selectionne = False
                         return None
@@ -284,6 +491,10 @@ class Game:
             if self.shop_manager.gerer_clic_boutique_sorts(pos):
                 return None
             # Clic dans la boutique des tours
+            for bouton in self.boutons_vitesse:
+                if bouton.rect.collidepoint(pos):
+                    bouton.action()
+                    return None
             if (
                 self.bouton_vague.rect.collidepoint(pos)
                 and self.ennemi_manager.vague_terminee()
@@ -302,14 +513,10 @@ class Game:
                 case = case_depuis_pos(
                     pos, self.taille_case, self.colonnes, self.lignes
                 )
-                if case and self.tour_manager.peut_placer_tour(
-                    case, self.type_selectionne, self.cases_bannies
-                ):
-                    if self.tour_manager.placer_tour(case, self.type_selectionne):
-                        self.type_selectionne = None
-                        self.tour_manager.tour_selectionnee = (
-                            None  # désélectionne la range
-                        )
+                if case and self.placer_tour(case, self.type_selectionne):
+                    self.type_selectionne = None
+                    # désélectionne la range
+                    self.tour_manager.tour_selectionnee = None
                 return None
 
             # --- Ajout : sélection/désélection d'une tour placée pour afficher la range ---
@@ -331,8 +538,8 @@ class Game:
                 case = case_depuis_pos(
                     pos, self.taille_case, self.colonnes, self.lignes
                 )
-                if case and case in self.tour_manager.positions_occupees:
-                    self.tour_manager.vendre_tour(case)
-                    self.tour_manager.tour_selectionnee = None  # désélectionne la range
+                if case and self.vendre_tour(case):
+                    # désélectionne la range
+                    self.tour_manager.tour_selectionnee = None
 
         return None
@@ -0,0 +1,288 @@
+"""
+Exécution du jeu sans fenêtre, à pas de temps fixe.
+
+Sert de base aux benchmarks et aux outils de simulation : la partie tourne
+avec les pilotes SDL « dummy » (ni fenêtre ni carte son), le temps de jeu
+avance d'un `dt` constant par tick et le curseur peut suivre automatiquement
+l'ennemi le plus avancé pour exercer la visibilité de nuit.
+
+Utilisation en ligne de commande, depuis la racine du projet :
+
+    python src/headless.py --ticks 3600 --vagues 3 --tour archer:6,3
+"""
+
+import argparse
+import json
+import os
+import sys
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from classes.constants import FPS, WINDOW_HEIGHT, WINDOW_WIDTH  # noqa: E402
+from classes.performance import centile  # noqa: E402
+from classes.polices import obtenir_police  # noqa: E402
+from classes.replay import LecteurReplay, charger_replay  # noqa: E402
+from game import Game  # noqa: E402
+
+
+def creer_partie(
+    est_muet: bool = True,
+    fichier_vagues: Optional[str] = None,
+    graine: Optional[int] = None,
+) -> Tuple[Game, pygame.Surface]:
+    """
+    Crée une partie et l'écran (virtuel) sur lequel la dessiner.
+
+    Args:
+        est_muet: Coupe le son de la partie (conseillé pour les mesures)
+        fichier_vagues: Fichier CSV des vagues (None = src/data/jeu.csv)
+        graine: Graine aléatoire (None = tirée au hasard)
+
+    Returns:
+        (partie, écran)
+    """
+    pygame.init()
+    ecran = pygame.display.get_surface()
+    if ecran is None:
+        ecran = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    game = Game(
+        obtenir_police(50),
+        est_muet=est_muet,
+        fichier_vagues=fichier_vagues,
+        graine=graine,
+    )
+    return game, ecran
+
+
+def cases_libres(game: Game) -> List[Tuple[int, int]]:
+    """Retourne les cases constructibles, de haut en bas puis de gauche à droite."""
+    return [
+        (x, y)
+        for y in range(game.lignes)
+        for x in range(game.colonnes)
+        if (x, y) not in game.cases_bannies
+        and (x, y) not in game.tour_manager.positions_occupees
+    ]
+
+
+def cases_bord_chemin(game: Game) -> List[Tuple[int, int]]:
+    """Retourne les cases constructibles voisines du chemin."""
+    return [
+        (x, y)
+        for x, y in cases_libres(game)
+        if any(
+            (x + dx, y + dy) in game.cases_bannies
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+        )
+    ]
+
+
+def repartir(cases: List[Tuple[int, int]], nombre: int) -> List[Tuple[int, int]]:
+    """Choisit `nombre` cases régulièrement espacées dans la liste."""
+    if nombre >= len(cases):
+        return list(cases)
+    pas = len(cases) / nombre
+    return [cases[int(i * pas)] for i in range(nombre)]
+
+
+class SimulationHeadless:
+    """Fait tourner une partie tick par tick et mesure le temps de chaque tick."""
+
+    def __init__(
+        self,
+        game: Game,
+        ecran: Optional[pygame.Surface] = None,
+        dt: float = 1.0 / FPS,
+        rendu: bool = True,
+        curseur_auto: bool = True,
+        vagues: int = 0,
+        lecteur: Optional[LecteurReplay] = None,
+    ) -> None:
+        """
+        Args:
+            game: Partie à simuler
+            ecran: Surface de rendu (obligatoire si `rendu` est vrai)
+            dt: Pas de temps fixe d'un tick, en secondes
+            rendu: Dessine l'interface à chaque tick (mesuré séparément)
+            curseur_auto: Place le curseur sur l'ennemi le plus avancé
+            vagues: Nombre de vagues à lancer automatiquement, l'une après l'autre
+            lecteur: Enregistrement à rejouer (impose dt, curseur et actions)
+        """
+        self.game = game
+        self.ecran = ecran
+        self.dt = dt
+        self.rendu = rendu and ecran is not None
+        self.lecteur = lecteur
+        self.curseur_auto = curseur_auto and lecteur is None
+        self.vagues_restantes = vagues if lecteur is None else 0
+        self.ticks = 0
+        self.temps_maj: List[float] = []
+        self.temps_rendu: List[float] = []
+        # Qualité complète et constante : les mesures de rendu restent comparables
+        game.perf.qualite.desactiver()
+
+    def _suivre_ennemi_le_plus_avance(self) -> None:
+        """Place le curseur sur l'ennemi apparu le plus proche du château."""
+        em = self.game.ennemi_manager
+        meilleur = None
+        distance_min = float("inf")
+        for ennemi in em.get_ennemis_actifs():
+            distance = ennemi.get_distance_restante()
+            if distance < distance_min:
+                meilleur, distance_min = ennemi, distance
+        if meilleur is not None:
+            self.game.curseur = (int(meilleur.position.x), int(meilleur.position.y))
+        else:
+            self.game.curseur = (-1, -1)
+
+    def est_terminee(self) -> bool:
+        """Retourne True si la partie est perdue ou gagnée (ou le replay fini)."""
+        if self.lecteur is not None:
+            return self.lecteur.est_termine(self.game)
+        return (
+            self.game.joueur.point_de_vie <= 0
+            or self.game.ennemi_manager.est_victoire()
+        )
+
+    def tick(self) -> None:
+        """Avance la partie d'un pas de temps (rendu puis mise à jour, comme en jeu)."""
+        dt = self.dt
+        if self.lecteur is not None:
+            dt = self.lecteur.preparer_tick(self.game)
+            if dt is None:
+                return
+
+        if self.vagues_restantes > 0 and self.game.ennemi_manager.vague_terminee():
+            self.vagues_restantes -= 1
+            self.game.lancer_vague()
+
+        if self.curseur_auto:
+            self._suivre_ennemi_le_plus_avance()
+
+        if self.rendu:
+            debut = perf_counter()
+            self.game.ui_manager.dessiner_interface_jeu(self.ecran, dt)
+            self.temps_rendu.append(perf_counter() - debut)
+
+        debut = perf_counter()
+        self.game.maj(dt)
+        self.temps_maj.append(perf_counter() - debut)
+        self.ticks += 1
+
+    def executer(self, nb_ticks: int) -> Dict[str, float]:
+        """
+        Exécute jusqu'à `nb_ticks` ticks (moins si la partie se termine avant).
+
+        Returns:
+            Résultats de la simulation (voir `resultats`)
+        """
+        for _ in range(nb_ticks):
+            if self.est_terminee():
+                break
+            self.tick()
+        return self.resultats()
+
+    def resultats(self) -> Dict[str, float]:
+        """Retourne les mesures agrégées et l'état final de la partie."""
+        if self.temps_rendu:
+            temps_ticks = [m + r for m, r in zip(self.temps_maj, self.temps_rendu)]
+        else:
+            temps_ticks = list(self.temps_maj)
+        total = sum(temps_ticks)
+        return {
+            "ticks": self.ticks,
+            "ticks_par_seconde": self.ticks / total if total > 0 else 0.0,
+            "tick_moyen_ms": 1000.0 * total / self.ticks if self.ticks else 0.0,
+            "tick_p99_ms": 1000.0 * centile(temps_ticks, 0.99),
+            "maj_moyenne_ms": 1000.0 * sum(self.temps_maj) / max(1, self.ticks),
+            "maj_p99_ms": 1000.0 * centile(self.temps_maj, 0.99),
+            "rendu_moyen_ms": 1000.0 * sum(self.temps_rendu) / max(1, self.ticks),
+            "rendu_p99_ms": 1000.0 * centile(self.temps_rendu, 0.99),
+            "vague": self.game.ennemi_manager.num_vague,
+            "point_de_vie": self.game.joueur.point_de_vie,
+            "argent": self.game.joueur.argent,
+            "ennemis_restants": len(self.game.ennemi_manager.ennemis)
+            + self.game.ennemi_manager.apparitions_restantes(),
+        }
+
+
+def _lire_tour(texte: str) -> Tuple[str, Tuple[int, int]]:
+    """Convertit « type:x,y » en (type, case)."""
+    try:
+        type_tour, case = texte.split(":")
+        x, y = case.split(",")
+        return type_tour, (int(x), int(y))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tour invalide : {texte!r} (attendu type:x,y)")
+
+
+def _afficher(simulation: SimulationHeadless, nb_ticks: int, allocations: bool) -> None:
+    """Exécute la simulation et affiche ses résultats en JSON."""
+    suivi = simulation.game.perf.allocations
+    if allocations:
+        suivi.demarrer()
+    resultats = simulation.executer(nb_ticks)
+    if allocations:
+        suivi.arreter()
+        resultats["allocations"] = suivi.rapport()
+    print(json.dumps(resultats, indent=2, ensure_ascii=False))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Simulation du jeu sans fenêtre.")
+    parser.add_argument("--ticks", type=int, default=3600, help="ticks maximum")
+    parser.add_argument("--vagues", type=int, default=1, help="vagues à enchaîner")
+    parser.add_argument("--argent", type=int, default=None, help="argent de départ")
+    parser.add_argument(
+        "--tour", type=_lire_tour, action="append", default=[],
+        help="tour à placer avant la première vague, au format type:x,y",
+    )
+    parser.add_argument("--sans-rendu", action="store_true", help="ne dessine rien")
+    parser.add_argument(
+        "--allocations", action="store_true",
+        help="suit les allocations par frame (tracemalloc) et les ajoute au résultat",
+    )
+    parser.add_argument(
+        "--waves-file", help="fichier CSV des vagues à la place de src/data/jeu.csv"
+    )
+    parser.add_argument(
+        "--replay", metavar="FICHIER",
+        help="rejoue une partie enregistrée avec main.py --record, à vitesse maximale",
+    )
+    args = parser.parse_args(argv)
+
+    fichier_vagues = os.path.abspath(args.waves_file) if args.waves_file else None
+    if args.replay:
+        replay = charger_replay(args.replay)
+        game, ecran = creer_partie(
+            fichier_vagues=replay["fichier_vagues"], graine=replay["graine"]
+        )
+        simulation = SimulationHeadless(
+            game, ecran, rendu=not args.sans_rendu, lecteur=LecteurReplay(replay)
+        )
+        _afficher(simulation, len(replay["dts"]), args.allocations)
+        return
+
+    game, ecran = creer_partie(fichier_vagues=fichier_vagues)
+    if args.argent is not None:
+        game.joueur.argent = args.argent
+    for type_tour, case in args.tour:
+        if not game.tour_manager.peut_placer_tour(case, type_tour, game.cases_bannies):
+            print(f"Placement impossible : {type_tour} en {case}", file=sys.stderr)
+            continue
+        game.placer_tour(case, type_tour)
+
+    simulation = SimulationHeadless(
+        game, ecran, rendu=not args.sans_rendu, vagues=args.vagues
+    )
+    _afficher(simulation, args.ticks, args.allocations)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,36 @@
+import argparse
+import os
 import sys
 
 import pygame
 
 from classes.constants import FPS, WINDOW_HEIGHT, WINDOW_WIDTH
+from classes.polices import obtenir_police
+from classes.replay import EnregistreurPartie, LecteurReplay, charger_replay
 from game import Game
-from managers.state_manager import StateManager
+from managers.state_manager import GameState, StateManager
 
 
 def main() -> None:
     """Fonction principale du jeu."""
+    parser = argparse.ArgumentParser(description="Protect The Castle")
+    parser.add_argument(
+        "--waves-file",
+        help="fichier CSV des vagues (idEnnemi;numVague;temps) à la place de jeu.csv",
+    )
+    parser.add_argument(
+        "--record", metavar="FICHIER", help="enregistre les actions de la partie"
+    )
+    parser.add_argument(
+        "--replay", metavar="FICHIER", help="rejoue une partie enregistrée"
+    )
+    args = parser.parse_args()
+    fichier_vagues = os.path.abspath(args.waves_file) if args.waves_file else None
+
+    replay = charger_replay(args.replay) if args.replay else None
+    if replay is not None:
+        fichier_vagues = replay["fichier_vagues"]
+
     # ------------------- INITIALISATION -------------------
     pygame.init()
 
@@ -17,18 +39,31 @@ def main() -> None:
     pygame.display.set_caption("Protect The Castle")
 
     # Configuration de la police et de l'horloge
-    police = pygame.font.Font(None, 50)
+    police = obtenir_police(50)
     clock = pygame.time.Clock()
 
     # ------------------- INITIALISATION DU JEU -------------------
     # Création de l'instance de jeu
-    game = Game(police, est_muet=False)
+    game = Game(
+        police,
+        est_muet=False,
+        fichier_vagues=fichier_vagues,
+        graine=replay["graine"] if replay is not None else None,
+    )
+    if args.record:
+        game.enregistreur = EnregistreurPartie(
+            args.record, game.graine, game.ennemi_manager.fichier_vagues
+        )
+    if replay is not None:
+        game.lecteur = LecteurReplay(replay)
 
     # Démarrer la musique de fond
     game.audio_manager.demarrer_musique_de_fond()
 
     # Création du gestionnaire d'états
     state_manager = StateManager(police, game)
+    if replay is not None:
+        state_manager.change_state(GameState.JEU)
 
     # ------------------- BOUCLE PRINCIPALE -------------------
     running = True
@@ -51,6 +86,7 @@ def main() -> None:
         clock.tick(FPS)
 
     # Nettoyage
+    state_manager.game.terminer_enregistrement()
     pygame.quit()
     sys.exit()
 
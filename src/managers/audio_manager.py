@@ -1,9 +1,10 @@
 import os
 import random
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pygame
 
+from classes.cache_audio import charger_sons
 from classes.constants import AUDIO_DIR
 
 if TYPE_CHECKING:
@@ -13,13 +14,40 @@ if TYPE_CHECKING:
 class AudioManager:
     """Manager pour gérer tous les aspects audio du jeu."""
 
+    # Nombre de canaux réservés aux bruitages (pool de voix géré par le manager)
+    NB_CANAUX_SFX = 16
+
+    # Paramètres par son : (voix simultanées max, intervalle minimal en ms, priorité)
+    PARAMETRES_SFX: Dict[str, Tuple[int, int, int]] = {
+        "arrow.mp3": (3, 60, 1),
+        "arrow-hit-metal.mp3": (2, 80, 1),
+        "fire-magic.mp3": (3, 80, 1),
+        "explosion-pierre.mp3": (3, 80, 2),
+        "catapult.mp3": (3, 120, 2),
+        "camp-fire.mp3": (2, 200, 2),
+        "wind-magic.mp3": (2, 100, 2),
+        "magic-spell.mp3": (1, 0, 3),
+        "loud-thunder.mp3": (2, 0, 3),
+    }
+    PARAMETRES_SFX_DEFAUT: Tuple[int, int, int] = (2, 60, 1)
+
     def __init__(self, game: "Game"):
         self.game = game
         self.est_muet = False
         self._sons_cache: Dict[str, pygame.mixer.Sound] = {}
+        self._chemins_existants: Dict[str, bool] = {}
         self.derniere_piste = None  # piste jouée précédemment
         self.volume_musique = 1.0
 
+        # Pool de voix : état de chaque canal réservé
+        self._canaux: List[pygame.mixer.Channel] = []
+        self._canal_son: List[Optional[str]] = []
+        self._canal_priorite: List[int] = []
+        self._dernier_declenchement: Dict[str, int] = {}
+        self.max_voix_sfx = self.NB_CANAUX_SFX
+        # Bruitages de priorité inférieure ignorés (jeu accéléré)
+        self.priorite_min_sfx = 0
+
         # Initialisation du mixer pygame
         self._initialiser_mixer()
 
@@ -27,6 +55,9 @@ class AudioManager:
         self.MUSIQUE_FINIE = pygame.USEREVENT + 1
         pygame.mixer.music.set_endevent(self.MUSIQUE_FINIE)
 
+        # Tous les bruitages sont chargés au démarrage
+        self.precharger_sons_communs()
+
     def _initialiser_mixer(self) -> None:
         """Initialise le mixer pygame pour la gestion audio."""
         try:
@@ -35,6 +66,33 @@ class AudioManager:
         except Exception:
             # Si pas de périphérique audio dispo, on continue sans mixer
             self.mixer_disponible = False
+            return
+        self._initialiser_canaux()
+
+    def _initialiser_canaux(self) -> None:
+        """
+        Réserve les canaux du pool de voix, hors allocation automatique de pygame.
+
+        En cas d'échec, le pool reste vide et jouer_sfx laisse pygame choisir
+        un canal libre (sans limite de voix ni priorités).
+        """
+        try:
+            if pygame.mixer.get_num_channels() < self.NB_CANAUX_SFX:
+                pygame.mixer.set_num_channels(self.NB_CANAUX_SFX)
+            pygame.mixer.set_reserved(self.NB_CANAUX_SFX)
+            self._canaux = [pygame.mixer.Channel(i) for i in range(self.NB_CANAUX_SFX)]
+        except Exception:
+            self._canaux = []
+        self._canal_son = [None] * len(self._canaux)
+        self._canal_priorite = [0] * len(self._canaux)
+
+    def _chemin_existe(self, chemin: str) -> bool:
+        """Vérifie l'existence d'un fichier une seule fois (résultat mis en cache)."""
+        existe = self._chemins_existants.get(chemin)
+        if existe is None:
+            existe = os.path.exists(chemin)
+            self._chemins_existants[chemin] = existe
+        return existe
 
     def set_muet(self, muet: bool) -> None:
         """Active ou désactive le mode muet."""
@@ -42,23 +100,88 @@ class AudioManager:
         # Met à jour le volume de la musique en cours
         self.set_volume_musique(self.volume_musique)
 
+    def _choisir_canal(self, fichier: str, priorite: int) -> Optional[int]:
+        """
+        Choisit le canal du pool où jouer un son.
+
+        Respecte la limite de voix du son et la limite globale ; si aucun canal
+        n'est libre, vole celui du son de plus basse priorité (s'il est moins
+        prioritaire que le nouveau).
+
+        Returns:
+            Index du canal, ou None si le son doit être ignoré
+        """
+        max_voix = self.PARAMETRES_SFX.get(fichier, self.PARAMETRES_SFX_DEFAUT)[0]
+        voix_du_son = 0
+        voix_occupees = 0
+        libre = None
+        victime = None
+        for i, canal in enumerate(self._canaux):
+            if not canal.get_busy():
+                self._canal_son[i] = None
+                if libre is None:
+                    libre = i
+                continue
+            voix_occupees += 1
+            if self._canal_son[i] == fichier:
+                voix_du_son += 1
+            priorite_canal = self._canal_priorite[i]
+            if victime is None or priorite_canal < self._canal_priorite[victime]:
+                victime = i
+
+        if voix_du_son >= max_voix:
+            return None
+        if libre is not None and voix_occupees < self.max_voix_sfx:
+            return libre
+        if victime is not None and self._canal_priorite[victime] < priorite:
+            self._canaux[victime].stop()
+            return victime
+        return None
+
     def jouer_sfx(self, fichier: str, volume: float = 1.0) -> None:
         """Joue un son ponctuel depuis assets/audio/bruitage en respectant l'état muet."""
         try:
             if self.est_muet or not self.mixer_disponible:
                 return
 
-            chemin = os.path.join(AUDIO_DIR, "bruitage", fichier)
-            if not os.path.exists(chemin):
+            parametres = self.PARAMETRES_SFX.get(fichier, self.PARAMETRES_SFX_DEFAUT)
+            priorite = parametres[2]
+            if priorite < self.priorite_min_sfx:
                 return
 
-            # Utiliser le cache pour éviter de recharger les sons
-            if fichier not in self._sons_cache:
-                self._sons_cache[fichier] = pygame.mixer.Sound(chemin)
+            son = self._sons_cache.get(fichier)
+            if son is None:
+                self.precharger_son(fichier)
+                son = self._sons_cache.get(fichier)
+                if son is None:
+                    return
+
+            # Intervalle minimal entre deux déclenchements du même son
+            intervalle = parametres[1]
+            maintenant = pygame.time.get_ticks()
+            dernier = self._dernier_declenchement.get(fichier)
+            if dernier is not None and maintenant - dernier < intervalle:
+                return
 
-            son = self._sons_cache[fichier]
-            son.set_volume(volume)
-            son.play()
+            if not self._canaux:
+                # Pool de voix indisponible : allocation automatique de pygame
+                canal = son.play()
+                if canal is not None:
+                    canal.set_volume(volume)
+                    self._dernier_declenchement[fichier] = maintenant
+                return
+
+            index = self._choisir_canal(fichier, priorite)
+            if index is None:
+                return
+
+            # Le volume est porté par le canal : le Sound partagé reste intact
+            canal = self._canaux[index]
+            canal.play(son)
+            canal.set_volume(volume)
+            self._canal_son[index] = fichier
+            self._canal_priorite[index] = priorite
+            self._dernier_declenchement[fichier] = maintenant
 
         except Exception:
             # On ignore silencieusement les erreurs audio (pas de périphérique, etc.)
@@ -71,7 +194,7 @@ class AudioManager:
                 return
 
             chemin = os.path.join(AUDIO_DIR, fichier)
-            if not os.path.exists(chemin):
+            if not self._chemin_existe(chemin):
                 return
 
             pygame.mixer.music.load(chemin)
@@ -105,28 +228,36 @@ class AudioManager:
                 return
 
             chemin = os.path.join(AUDIO_DIR, "bruitage", fichier)
-            if os.path.exists(chemin) and fichier not in self._sons_cache:
+            if fichier not in self._sons_cache and self._chemin_existe(chemin):
                 self._sons_cache[fichier] = pygame.mixer.Sound(chemin)
 
         except Exception:
             pass
 
     def precharger_sons_communs(self) -> None:
-        """Précharge les sons les plus utilisés pour améliorer les performances."""
-        sons_communs = [
-            "arrow.mp3",
-            "arrow-hit-metal.mp3",
-            "catapult.mp3",
-            "fire-magic.mp3",
-            "explosion-pierre.mp3",
-            "loud-thunder.mp3",
-            "magic-spell.mp3",
-            "wind-magic.mp3",
-            "camp-fire.mp3",
-        ]
+        """
+        Précharge tous les bruitages de assets/audio/bruitage.
+
+        Passe par le cache PCM disque : seuls les sons absents du cache (ou
+        modifiés depuis) sont décodés, les autres sont relus en parallèle.
+        """
+        if not self.mixer_disponible:
+            return
+        dossier = os.path.join(AUDIO_DIR, "bruitage")
+        try:
+            fichiers = sorted(os.listdir(dossier))
+        except OSError:
+            fichiers = list(self.PARAMETRES_SFX)
 
-        for son in sons_communs:
-            self.precharger_son(son)
+        chemins = [
+            os.path.join(dossier, f) for f in fichiers if f not in self._sons_cache
+        ]
+        try:
+            self._sons_cache.update(charger_sons(chemins))
+        except Exception:
+            # Repli : chargement direct, son par son
+            for son in fichiers:
+                self.precharger_son(son)
 
     def vider_cache(self) -> None:
         """Vide le cache des sons pour libérer la mémoire."""
@@ -136,6 +267,7 @@ class AudioManager:
         """Retourne des statistiques sur l'utilisation audio."""
         return {
             "sons_en_cache": len(self._sons_cache),
+            "voix_actives": sum(1 for c in self._canaux if c.get_busy()),
             "mixer_disponible": self.mixer_disponible,
             "mode_muet": self.est_muet,
         }
@@ -158,7 +290,7 @@ class AudioManager:
         pistes_existantes = []
         for piste in pistes_candidates:
             chemin = os.path.join(AUDIO_DIR, piste)
-            if os.path.exists(chemin):
+            if self._chemin_existe(chemin):
                 pistes_existantes.append(piste)
 
         if not pistes_existantes:
@@ -1,111 +1,186 @@
-import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import pygame
 
-from classes.constants import PROJECT_ROOT, RECOMPENSES_PAR_VAGUE
-from classes.csv import creer_liste_ennemis_depuis_csv
-from models.ennemi import Ennemi
+from classes import horloge
+from classes.constants import RECOMPENSES_PAR_VAGUE
+from classes.csv import FICHIER_VAGUES_DEFAUT, charger_vagues, nombre_vagues
+from classes.qualite import PALIER_BARRES_VIE, PALIER_ENNEMIS_CACHES, SEUIL_BARRE_VIE
+from classes.rendu import LARGEUR_BARRE_VIE, FileRendu, surface_barre_vie
+from models.ennemi import CLASSES_ENNEMIS, Ennemi, animer_ennemis
 
 if TYPE_CHECKING:
     from game import Game
 
 
+def _cle_type(ennemi: Ennemi) -> tuple[int, int]:
+    """Clé de rendu : regroupement par type, puis ordre d'apparition."""
+    return ennemi.TYPE.id, ennemi._ordre
+
+
 class EnnemiManager:
     """Manager pour gérer tous les aspects liés aux ennemis."""
 
-    def __init__(self, game: "Game"):
+    def __init__(self, game: "Game", fichier_vagues: str = FICHIER_VAGUES_DEFAUT):
         self.game = game
+        # Fichier CSV des vagues (idEnnemi;numVague;temps)
+        self.fichier_vagues = fichier_vagues
+        self._max_vague: Optional[int] = None
+        # Ennemis actifs (ni morts, ni arrivés au bout), tenue à jour au fil de
+        # l'eau : chaque ennemi connaît son indice (`_indice_actif`) et signale
+        # sa sortie ; il est alors retiré par permutation avec le dernier. La
+        # liste n'est donc pas dans l'ordre d'apparition : le rendu trie sur
+        # le rang donné à chaque ennemi créé (`_ordre`).
         self.ennemis: list[Ennemi] = []
+        self._ordre_suivant = 0
+        # Ennemis sortis depuis le dernier retrait (retirés hors des boucles)
+        self._retires: list[Ennemi] = []
+        # Apparitions de la vague (id ennemi, temps en s), triées par temps :
+        # les ennemis ne sont créés qu'à leur apparition. `_prochain` est
+        # l'indice de la prochaine apparition.
+        self._programme: list[tuple[int, float]] = []
+        self._prochain = 0
+        # Réserve d'ennemis sortis du jeu, par id de type, réutilisés aux
+        # apparitions suivantes (voir `Ennemi.recycler`)
+        self._libres: dict[int, list[Ennemi]] = {}
         self.num_vague = 0
         self.debut_vague = 0
+        # Récompenses de fin de vague (copie modifiable, outils d'équilibrage)
+        self.recompenses_par_vague = dict(RECOMPENSES_PAR_VAGUE)
+        # Nombre d'ennemis arrivés au château depuis le début de la partie
+        self.fuites = 0
+        # Temps pas encore appliqué aux images des ennemis (pas non affichés)
+        self._dt_images = 0.0
 
         # Gestion de l'état jour/nuit
         self.est_nuit = False
 
-    def lancer_vague(self) -> None:
-        """Démarre une nouvelle vague d'ennemis, chargée depuis un CSV."""
+        # File des sprites d'ennemis, soumise en un seul blit par frame. Pas de
+        # tri par surface (la frame change à chaque pas : les ennemis qui se
+        # chevauchent clignoteraient) ; ils sont regroupés par type au dessin.
+        self.file_rendu = FileRendu(trier=False)
+
+    def lancer_vague(self, programme: Optional[list[tuple[int, float]]] = None) -> None:
+        """
+        Démarre une nouvelle vague d'ennemis, chargée depuis un CSV.
+
+        Seul le programme des apparitions est lu : chaque ennemi est créé (ou
+        repris dans la réserve) au moment où il apparaît.
+
+        Args:
+            programme: Apparitions (id ennemi, temps en s) imposées (scénarios
+                de test), à la place du CSV
+        """
         self.num_vague += 1
-        self.debut_vague = pygame.time.get_ticks()
+        self.debut_vague = horloge.temps_ms()
 
         # Active l'effet de nuit pendant la vague
         self.est_nuit = True
 
-        # Génère la liste d'ennemis depuis le CSV
-        self.ennemis = creer_liste_ennemis_depuis_csv(self.num_vague)
-
-        # Initialiser les callbacks d'arrivée au château pour tous les ennemis
+        if programme is None:
+            programme = charger_vagues(self.fichier_vagues).get(self.num_vague, [])
+        self.activer_ennemis([], programme)
+
+    def activer_ennemis(
+        self, ennemis: list[Ennemi], programme: Sequence[tuple[int, float]] = ()
+    ) -> None:
+        """
+        Remplace les ennemis actifs et les apparitions à venir (nouvelle vague,
+        partie restaurée). Les ennemis remplacés retournent dans la réserve.
+
+        Args:
+            ennemis: Ennemis déjà apparus (créés par `creer_ennemi`)
+            programme: Apparitions à venir (id ennemi, temps en s)
+        """
+        gardes = {id(ennemi) for ennemi in ennemis}
         for ennemi in self.ennemis:
-            try:
-                setattr(ennemi, "_on_reach_castle", None)
-            except (AttributeError, TypeError) as e:
-                # Log l'erreur pour debug mais continue l'exécution
-                print(f"Erreur lors de l'initialisation de l'ennemi {type(ennemi).__name__}: {e}")
-                pass
+            if id(ennemi) not in gardes:
+                self._liberer(ennemi)
+        self.ennemis = ennemis
+        self._retires.clear()
+        for indice, ennemi in enumerate(self.ennemis):
+            ennemi._indice_actif = indice
+        self._programme = sorted(programme, key=lambda apparition: apparition[1])
+        self._prochain = 0
+
+    def creer_ennemi(self, id_ennemi: int, temps_apparition: float) -> Ennemi:
+        """
+        Retourne un ennemi neuf du type demandé, repris dans la réserve si possible.
+
+        Args:
+            id_ennemi: id du type (data/typeTroupe.txt)
+            temps_apparition: Temps d'apparition dans la vague (s)
+        """
+        libres = self._libres.get(id_ennemi)
+        if libres:
+            ennemi = libres.pop()
+            ennemi.recycler(temps_apparition)
+        else:
+            ennemi = CLASSES_ENNEMIS[id_ennemi](
+                tempsApparition=temps_apparition, tmj_path=self.game.carte_jeu.source
+            )
+            ennemi._on_retrait = self._retires.append
+        ennemi._ordre = self._ordre_suivant
+        self._ordre_suivant += 1
+        return ennemi
+
+    def _liberer(self, ennemi: Ennemi) -> None:
+        """Range un ennemi sorti du jeu dans la réserve de son type."""
+        self._libres.setdefault(ennemi.TYPE.id, []).append(ennemi)
+
+    def apparitions_restantes(self) -> int:
+        """Nombre d'ennemis de la vague qui ne sont pas encore apparus."""
+        return len(self._programme) - self._prochain
 
     def mettre_a_jour_vague(self) -> None:
         """Fait apparaître les ennemis au moment de leur temps d'apparition."""
-        if not self.ennemis:
+        programme = self._programme
+        if self._prochain >= len(programme):
             return
-        now = pygame.time.get_ticks()
+        now = horloge.temps_ms()
         elapsed_s = round((now - self.debut_vague) / 1000, 1)
-        # Faire apparaître les ennemis selon leur temps d'apparition
-        for ennemi in self.ennemis:
-            try:
-                # Vérifier si l'ennemi doit apparaître maintenant
-                if (
-                    hasattr(ennemi, "tempsApparition")
-                    and elapsed_s >= ennemi.tempsApparition
-                    and not getattr(ennemi, "estApparu", lambda x: False)(self.debut_vague)
-                ):
-                    # Marquer l'ennemi comme apparu
-                    ennemi.estApparu = lambda x: True
-            except (AttributeError, TypeError) as e:
-                # Log l'erreur pour debug mais continue l'exécution
-                print(f"Erreur lors de l'apparition de l'ennemi {type(ennemi).__name__}: {e}")
-                pass
-
-    def mettre_a_jour_ennemis(self, dt: float) -> None:
-        """Met à jour tous les ennemis actifs."""
-        # Déplacement des ennemis actifs
+        ennemis = self.ennemis
+        while self._prochain < len(programme):
+            id_ennemi, temps = programme[self._prochain]
+            if temps > elapsed_s:
+                break
+            self._prochain += 1
+            ennemi = self.creer_ennemi(id_ennemi, temps)
+            ennemi._indice_actif = len(ennemis)
+            ennemis.append(ennemi)
+
+    def mettre_a_jour_ennemis(self, dt: float, visuel: bool = True) -> None:
+        """
+        Met à jour tous les ennemis actifs.
+
+        Args:
+            dt: Pas de temps (s)
+            visuel: False pour un pas qui ne sera pas affiché (jeu accéléré) :
+                les images ne sont avancées qu'au prochain pas affiché
+        """
+        # Déplacement des ennemis actifs (tous apparus : ils sont créés à leur
+        # apparition)
         for ennemi in self.ennemis:
-            try:
-                # Vérifier si l'ennemi est apparu avant de le déplacer
-                if not hasattr(ennemi, "estApparu") or ennemi.estApparu(self.debut_vague):
-                    ennemi.seDeplacer(dt)
-                    ennemi.update_animation(dt)
-            except (AttributeError, TypeError) as e:
-                # Fallback : essayer de déplacer l'ennemi même en cas d'erreur
-                print(f"Erreur lors du déplacement de l'ennemi {type(ennemi).__name__}: {e}")
-                if hasattr(ennemi, "seDeplacer"):
-                    try:
-                        ennemi.seDeplacer(dt)
-                    except Exception:
-                        pass  # Ignorer les erreurs de fallback
+            ennemi.seDeplacer(dt)
+
+        # Animation : un passage par type d'ennemi
+        self._dt_images += dt
+        if visuel:
+            animer_ennemis(self.ennemis, dt, self._dt_images)
+            self._dt_images = 0.0
+        else:
+            animer_ennemis(self.ennemis, dt, 0.0)
 
         # Perte de PV si un ennemi touche certaines cases "château"
+        cases_chateau = self.game.carte_jeu.cases_chateau
+        joueur = self.game.joueur
         for e in self.ennemis:
-            try:
-                pos_px = (int(e.position.x), int(e.position.y))
-                case = self._case_depuis_pos(pos_px)
-                if case in {(2, 0), (3, 0)}:
-                    deg = getattr(e, "degats", 1)
-                    self.game.joueur.point_de_vie = max(
-                        0, int(self.game.joueur.point_de_vie) - int(deg)
-                    )
-                    try:
-                        setattr(e, "_ne_pas_recompenser", True)
-                    except Exception:
-                        pass
-                    if hasattr(e, "perdreVie"):
-                        e.perdreVie(getattr(e, "pointsDeVie", 1))
-                    else:
-                        try:
-                            e.pointsDeVie = 0
-                        except Exception:
-                            pass
-            except Exception:
-                continue
+            case = self._case_depuis_pos((int(e.position.x), int(e.position.y)))
+            if case in cases_chateau:
+                self.fuites += 1
+                joueur.point_de_vie = max(0, int(joueur.point_de_vie) - int(e.degats))
+                e._ne_pas_recompenser = True
+                e.perdreVie(e.pointsDeVie)
 
     def _ennemi_atteint_chateau(self, ennemi: Ennemi, pos_px: tuple = None) -> bool:
         """Vérifie si un ennemi a atteint le château."""
@@ -142,65 +217,30 @@ class EnnemiManager:
             pass
 
     def dessiner_ennemis(self, ecran: pygame.Surface) -> None:
-        """Dessine tous les ennemis actifs."""
-        for e in self.ennemis:
-            # Compat : certains ennemis peuvent avoir des états (apparu/mort/arrivé)
-            try:
-                doit_dessiner = (
-                    (not hasattr(e, "estApparu") or e.estApparu(self.debut_vague))
-                    and not getattr(e, "estMort", lambda: False)()
-                    and not getattr(e, "a_atteint_le_bout", lambda: False)()
-                )
-
-                if doit_dessiner:
-                    e.draw(ecran)
-
-                    # Dessiner la barre de vie si l'ennemi a perdu des PV
-                    if (
-                        hasattr(e, "pointsDeVie")
-                        and hasattr(e, "pointsDeVieMax")
-                        and e.pointsDeVie < e.pointsDeVieMax
-                    ):
-                        # Position de la barre : juste au-dessus de l'ennemi
-                        px = int(e.position.x)
-                        py = int(e.position.y)
-
-                        # Dimensions de la barre
-                        largeur_max = 40
-                        hauteur = 6
-
-                        # Calculer le pourcentage de vie
-                        pourcentage_vie = e.pointsDeVie / e.pointsDeVieMax
-                        largeur_actuelle = int(largeur_max * pourcentage_vie)
-
-                        x_barre = px - largeur_max // 2
-                        y_barre = py - 40  # Espace entre le haut du sprite et l'ennemi
-
-                        # Fond gris
-                        pygame.draw.rect(
-                            ecran,
-                            (60, 60, 60),
-                            (x_barre, y_barre, largeur_max, hauteur),
-                            border_radius=3,
-                        )
-
-                        # Barre de vie verte
-                        couleur_vie = (
-                            (0, 255, 0)
-                            if pourcentage_vie > 0.5
-                            else (
-                                (255, 255, 0) if pourcentage_vie > 0.25 else (255, 0, 0)
-                            )
-                        )
-                        pygame.draw.rect(
-                            ecran,
-                            couleur_vie,
-                            (x_barre, y_barre, largeur_actuelle, hauteur),
-                            border_radius=3,
-                        )
-
-            except Exception:
-                pass
+        """Dessine tous les ennemis actifs et leurs barres de vie, en un seul blit."""
+        file = self.file_rendu
+        blesses = []
+        palier = self.game.perf.qualite.palier
+        sans_caches = palier >= PALIER_ENNEMIS_CACHES
+        # Vie restante sous laquelle la barre est affichée
+        seuil_barre = SEUIL_BARRE_VIE if palier >= PALIER_BARRES_VIE else 1.0
+        # Regroupés par type (même feuille de sprites), dans l'ordre d'apparition
+        for e in sorted(self.ennemis, key=_cle_type):
+            if e.estMort() or e.a_atteint_le_bout() or (sans_caches and not e.visible):
+                continue
+            e.preparer_rendu(file)
+            # Barre de vie si l'ennemi a perdu des PV
+            if e.pointsDeVie < e.pointsDeVieMax * seuil_barre:
+                blesses.append(e)
+
+        # Barres de vie pré-rendues, au-dessus de tous les sprites (même blit)
+        for e in blesses:
+            barre = surface_barre_vie(e.pointsDeVie / e.pointsDeVieMax)
+            # Juste au-dessus de l'ennemi
+            x_barre = int(e.position.x) - LARGEUR_BARRE_VIE // 2
+            y_barre = int(e.position.y) - 40
+            file.ajouter(barre, (x_barre, y_barre))
+        file.soumettre(ecran)
 
     def gerer_collisions_projectiles(self, projectiles: list) -> None:
         """Gère les collisions entre projectiles et ennemis."""
@@ -212,7 +252,7 @@ class EnnemiManager:
             ):
                 # Collision projectiles tours -> ennemis
                 for e in self.ennemis:
-                    if hasattr(e, "estMort") and e.estMort():
+                    if e.estMort():
                         continue
 
                     if hasattr(pr, "aTouche") and pr.aTouche(e):
@@ -235,62 +275,64 @@ class EnnemiManager:
 
                         # Gestion des récompenses pour tous les ennemis morts
                         for ennemi in self.ennemis:
-                            try:
-                                if (
-                                    ennemi.estMort()
-                                    and not getattr(ennemi, "_recompense_donnee", False)
-                                    and not getattr(
-                                        ennemi, "_ne_pas_recompenser", False
-                                    )
-                                ):
-                                    self.game.joueur.argent += int(
-                                        getattr(ennemi, "argent", 0)
-                                    )
-                                    setattr(ennemi, "_recompense_donnee", True)
-                            except Exception:
-                                pass
+                            if (
+                                ennemi.estMort()
+                                and not ennemi._recompense_donnee
+                                and not ennemi._ne_pas_recompenser
+                            ):
+                                self.game.joueur.argent += int(ennemi.argent)
+                                ennemi._recompense_donnee = True
                         break
 
+    def _retirer(self, ennemi: Ennemi) -> None:
+        """
+        Retire un ennemi de la liste active en O(1) (permutation avec le dernier)
+        et le range dans la réserve.
+        """
+        indice = ennemi._indice_actif
+        ennemis = self.ennemis
+        if not (0 <= indice < len(ennemis)) or ennemis[indice] is not ennemi:
+            return  # déjà retiré, ou ennemi d'une vague précédente
+        dernier = ennemis.pop()
+        if dernier is not ennemi:
+            ennemis[indice] = dernier
+            dernier._indice_actif = indice
+        ennemi._indice_actif = -1
+        self._liberer(ennemi)
+
     def nettoyer_ennemis_morts(self) -> None:
-        """Supprime les ennemis morts de la liste et donne de l'argent pour les ennemis morts."""
-        for e in self.ennemis:
-            if getattr(e, "estMort", lambda: False)() and not getattr(e, "_recompense_donnee", False):
-                self.game.joueur.argent += int(getattr(e, "argent", 0))
-                setattr(e, "_recompense_donnee", True)
-
-        self.ennemis = [
-            e
-            for e in self.ennemis
-            if not (
-                getattr(e, "estMort", lambda: False)()
-                or getattr(e, "a_atteint_le_bout", lambda: False)()
-            )
-        ]
+        """Retire les ennemis sortis du jeu ; les ennemis morts rapportent leur or."""
+        if not self._retires:
+            return
+        for e in self._retires:
+            if e.estMort() and not e._recompense_donnee:
+                self.game.joueur.argent += int(e.argent)
+                e._recompense_donnee = True
+            self._retirer(e)
+        self._retires.clear()
 
     def get_ennemis_actifs(self) -> list[Ennemi]:
-        """Retourne la liste des ennemis actifs (non morts)."""
-        return [e for e in self.ennemis if not getattr(e, "estMort", lambda: False)()]
+        """
+        Retourne les ennemis actifs (non morts).
 
-    def get_mages_actifs(self) -> list[Ennemi]:
-        """Retourne la liste des mages actifs."""
-        from models.ennemi import Mage
+        C'est la liste tenue par le manager, pas une copie : ne pas la modifier.
+        Un ennemi tué pendant qu'on la parcourt n'en est retiré qu'à l'appel
+        suivant (les appelants testent `estMort`).
+        """
+        self.nettoyer_ennemis_morts()
+        return self.ennemis
 
-        return [
-            e
-            for e in self.ennemis
-            if isinstance(e, Mage)
-            and not e.estMort()
-            and (not hasattr(e, "estApparu") or e.estApparu(self.debut_vague))
-        ]
+    def get_mages_actifs(self) -> list[Ennemi]:
+        """Retourne la liste des mages actifs (ennemis de type `attaque`)."""
+        return [e for e in self.ennemis if e.TYPE.attaque and not e.estMort()]
 
     def vague_terminee(self) -> bool:
-        """Retourne True si tous les ennemis sont morts ou arrivés au bout."""
-        if not self.ennemis:
-            return True
+        """Retourne True si tous les ennemis sont apparus puis morts ou arrivés."""
+        if self._prochain < len(self._programme):
+            return False
+        self.nettoyer_ennemis_morts()
         for e in self.ennemis:
-            est_mort = getattr(e, "estMort", lambda: False)()
-            au_bout = getattr(e, "a_atteint_le_bout", lambda: False)()
-            if not est_mort and not au_bout:
+            if not e.estMort() and not e.a_atteint_le_bout():
                 return False
         return True
 
@@ -298,7 +340,7 @@ class EnnemiManager:
         """Gère la fin de vague : désactive la nuit et donne les récompenses."""
         if self.vague_terminee() and self.est_nuit:
             self.est_nuit = False
-            recompense = RECOMPENSES_PAR_VAGUE.get(self.num_vague, 0)
+            recompense = self.recompenses_par_vague.get(self.num_vague, 0)
             self.game.joueur.argent += recompense
 
     def est_victoire(self) -> bool:
@@ -311,24 +353,13 @@ class EnnemiManager:
 
     def get_max_vague_csv(self) -> int:
         """Retourne le nombre maximum de vagues disponibles dans le CSV."""
-        import csv
-
-        max_vague = 0
-        try:
-            with open(
-                os.path.join(PROJECT_ROOT, "src", "data", "jeu.csv"), newline=""
-            ) as f:
-                reader = csv.DictReader(f, delimiter=";")
-                for row in reader:
-                    try:
-                        num = int(row.get("numVague", 0))
-                        if num > max_vague:
-                            max_vague = num
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-        return max_vague
+        # Lu une seule fois : appelé à chaque frame par est_victoire
+        if self._max_vague is None:
+            try:
+                self._max_vague = nombre_vagues(self.fichier_vagues)
+            except Exception:
+                self._max_vague = 0
+        return self._max_vague
 
     def _case_depuis_pos(self, pos):
         """Calcule la case de grille à partir d'une position en pixels."""
@@ -341,5 +372,10 @@ class EnnemiManager:
     def reset(self) -> None:
         """Remet le manager à zéro."""
         self.ennemis = []
+        self._retires.clear()
+        self._programme = []
+        self._prochain = 0
+        self._dt_images = 0.0
+        self._ordre_suivant = 0
         self.num_vague = 0
         self.debut_vague = 0
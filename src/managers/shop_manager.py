@@ -9,7 +9,9 @@ from classes.constants import (
     MONEY_DIR,
     SHOP_WIDTH,
     SPELLS_HEIGHT,
+    VITESSES_JEU,
 )
+from classes.polices import rendre_texte
 from classes.sprites import charger_animation_ui, charger_spritesheet_ui
 
 if TYPE_CHECKING:
@@ -61,6 +63,21 @@ class ShopManager:
         self.couleur_boutique_sorts_bg = self.couleur_boutique_bg
         self.couleur_boutique_sorts_border = self.couleur_boutique_border
 
+        # Pièces des prix (20x20), redimensionnées une seule fois
+        self.coin_frames_prix = self._charger_pieces_prix()
+
+        # Panneaux pré-rendus : re-rendus uniquement quand leur clé change
+        self._rects_sorts_ecran = self._rects_sorts()
+        self._cache_boutique_tours: pygame.Surface | None = None
+        self._cache_boutique_sorts: pygame.Surface | None = None
+        self._cle_boutique_tours: tuple | None = None
+        self._cle_boutique_sorts: tuple | None = None
+        # Positions (écran) des sprites animés composés par-dessus les panneaux
+        self._pos_piece_solde = (0, 0)
+        self._pos_coeur = (0, 0)
+        self._pieces_boutique_tours: list[tuple[int, int]] = []
+        self._pieces_boutique_sorts: list[tuple[int, int]] = []
+
     def _charger_piece(self):
         """Charge l'animation des pièces depuis MonedaD.png (spritesheet)."""
         coinImg = os.path.join(MONEY_DIR, "MonedaD.png")
@@ -70,9 +87,19 @@ class ShopManager:
             frames = [pygame.transform.smoothscale(f, (24, 24)) for f in frames]
         return frames
 
+    def _charger_pieces_prix(self):
+        """Prépare les pièces 20x20 affichées à côté des prix (une seule fois)."""
+        if self.coin_frames:
+            return [pygame.transform.smoothscale(f, (20, 20)) for f in self.coin_frames]
+        # Fallback : pièce statique dessinée
+        coin_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.circle(coin_surf, (220, 200, 40), (10, 10), 10)
+        return [coin_surf]
+
     def _charger_coeurs(self):
-        """Charge toutes les images de coeur en utilisant la fonction utilitaire."""
-        return charger_animation_ui("heart", scale=1.0)
+        """Charge toutes les images de coeur, redimensionnées une fois en 24x24."""
+        frames = charger_animation_ui("heart", scale=1.0)
+        return [pygame.transform.smoothscale(f, (24, 24)) for f in frames]
 
     def _creer_boutons_boutique(self):
         """Crée les boutons de la boutique des tours."""
@@ -86,135 +113,157 @@ class ShopManager:
             y += espace_y
         return boutons
 
-    def dessiner_boutique_tours(self, ecran: pygame.Surface) -> None:
-        """Dessine la boutique des tours."""
-        pygame.draw.rect(ecran, self.couleur_boutique_bg, self.rect_boutique)
-        pygame.draw.rect(ecran, self.couleur_boutique_border, self.rect_boutique, 2)
-        titre = self.game.police.render("Boutique", True, self.couleur_texte)
-        ecran.blit(
-            titre,
-            (
-                self.rect_boutique.x + (self.largeur_boutique - titre.get_width()) // 2,
-                20,
-            ),
-        )
-
-        # Monnaie - chiffre puis icône (icône à droite)
-        txt_solde = self.game.police.render(
-            f"{self.game.joueur.argent}", True, self.couleur_texte
-        )
-        ecran.blit(txt_solde, (self.rect_boutique.x + 20, 56))
-
-        if self.coin_frames:
-            coin = self.coin_frames[self.coin_frame_idx % len(self.coin_frames)]
-            # Positionner l'icône à droite du texte
-            coin_x = self.rect_boutique.x + 20 + txt_solde.get_width() + 5
-            ecran.blit(coin, (coin_x, 60))
-            now = pygame.time.get_ticks()
-            if now - self.last_coin_ticks >= self.COIN_ANIM_INTERVAL:
-                self.coin_frame_idx = (self.coin_frame_idx + 1) % len(self.coin_frames)
-                self.last_coin_ticks = now
-
-        # Points de vie - chiffre puis icône (icône à droite)
-        txt_pv = self.game.police.render(
-            f"{self.game.joueur.point_de_vie}", True, self.couleur_texte
+    def _rects_sorts(self) -> list[pygame.Rect]:
+        """Retourne les rectangles (écran) des sorts, dans l'ordre de game.sorts."""
+        return [
+            pygame.Rect(
+                self.rect_boutique_sorts.x + 20 + i * 320,
+                self.rect_boutique_sorts.y + 60,
+                300,
+                80,
+            )
+            for i in range(len(self.game.sorts))
+        ]
+
+    def _avancer_animations(self) -> None:
+        """Fait avancer les animations de la pièce et du coeur."""
+        now = pygame.time.get_ticks()
+        if self.coin_frames and now - self.last_coin_ticks >= self.COIN_ANIM_INTERVAL:
+            self.coin_frame_idx = (self.coin_frame_idx + 1) % len(self.coin_frames)
+            self.last_coin_ticks = now
+        if self.heart_frames and now - self.last_heart_ticks >= self.HEART_ANIM_INTERVAL:
+            self.heart_frame_idx = (self.heart_frame_idx + 1) % len(self.heart_frames)
+            self.last_heart_ticks = now
+
+    def invalider_cache(self) -> None:
+        """Force le re-rendu des deux panneaux au prochain affichage."""
+        self._cle_boutique_tours = None
+        self._cle_boutique_sorts = None
+
+    # ---------- Boutique des tours ----------
+    def _cle_boutique_tours_courante(self) -> tuple:
+        """Regroupe tout ce dont dépend le rendu statique du panneau des tours."""
+        souris = pygame.mouse.get_pos()
+        survol = -1
+        if self.rect_boutique.collidepoint(souris):
+            for i, item in enumerate(self.shop_items):
+                if item["rect"].collidepoint(souris):
+                    survol = i
+                    break
+        prix = self.game.tour_manager.prix_par_type
+        return (
+            self.game.joueur.argent,
+            self.game.joueur.point_de_vie,
+            tuple(prix.get(item["type"], 0) for item in self.shop_items),
+            self.game.type_selectionne,
+            survol,
+            self.game.ennemi_manager.num_vague,
         )
-        # Positionner le texte des PV à droite de la monnaie
-        pv_x = self.rect_boutique.x + 140
-        ecran.blit(txt_pv, (pv_x, 56))
 
-        if self.heart_frames:
-            coeur = self.heart_frames[self.heart_frame_idx % len(self.heart_frames)]
-            coeur_s = pygame.transform.smoothscale(coeur, (24, 24))
-            # Positionner l'icône à droite du texte
-            coeur_x = pv_x + txt_pv.get_width() + 5
-            ecran.blit(coeur_s, (coeur_x, 60))
-            now = pygame.time.get_ticks()
-            if now - self.last_heart_ticks >= self.HEART_ANIM_INTERVAL:
-                self.heart_frame_idx = (self.heart_frame_idx + 1) % len(
-                    self.heart_frames
-                )
-                self.last_heart_ticks = now
-        else:
+    def _rendre_boutique_tours(self, cle: tuple) -> None:
+        """Re-rend le panneau des tours dans sa surface en cache."""
+        argent, point_de_vie, prix_items, type_selectionne, survol, num_vague = cle
+        ox, oy = self.rect_boutique.topleft
+        surface = self._cache_boutique_tours
+        if surface is None:
+            surface = pygame.Surface(self.rect_boutique.size)
+            self._cache_boutique_tours = surface
+        rect_local = surface.get_rect()
+        police = self.game.police
+
+        surface.fill(self.couleur_boutique_bg)
+        pygame.draw.rect(surface, self.couleur_boutique_border, rect_local, 2)
+        titre = rendre_texte(police, "Boutique", self.couleur_texte)
+        surface.blit(titre, ((self.largeur_boutique - titre.get_width()) // 2, 20 - oy))
+
+        # Monnaie - chiffre puis icône (icône animée, dessinée par-dessus)
+        txt_solde = rendre_texte(police, f"{argent}", self.couleur_texte)
+        surface.blit(txt_solde, (20, 56 - oy))
+        self._pos_piece_solde = (ox + 20 + txt_solde.get_width() + 5, 60)
+
+        # Points de vie - chiffre puis icône (icône animée, dessinée par-dessus)
+        txt_pv = rendre_texte(police, f"{point_de_vie}", self.couleur_texte)
+        surface.blit(txt_pv, (140, 56 - oy))
+        coeur_x = ox + 140 + txt_pv.get_width() + 5
+        self._pos_coeur = (coeur_x, 60)
+        if not self.heart_frames:
             # Petit fallback visuel si aucun asset
-            coeur_x = pv_x + txt_pv.get_width() + 5
-            pygame.draw.circle(ecran, (220, 50, 50), (coeur_x + 12, 72), 12)
+            pygame.draw.circle(surface, (220, 50, 50), (coeur_x - ox + 12, 72 - oy), 12)
 
         # Boutons tours
-        for item in self.shop_items:
-            rect = item["rect"]
+        self._pieces_boutique_tours = []
+        coin_w, coin_h = self.coin_frames_prix[0].get_size()
+        for i, (item, prix_val) in enumerate(zip(self.shop_items, prix_items)):
+            rect = item["rect"].move(-ox, -oy)
             t = item["type"]
-            hover = rect.collidepoint(pygame.mouse.get_pos())
             # Fond hover si sélectionné
-            if self.game.type_selectionne == t or hover:
+            if type_selectionne == t or survol == i:
                 couleur_fond_boutton = self.couleur_bouton_hover
             else:
                 couleur_fond_boutton = self.couleur_bouton_bg
+            pygame.draw.rect(surface, couleur_fond_boutton, rect, border_radius=6)
             pygame.draw.rect(
-                ecran,
-                couleur_fond_boutton,
-                rect,
-                border_radius=6,
-            )
-            pygame.draw.rect(
-                ecran, self.couleur_boutique_border, rect, 2, border_radius=6
+                surface, self.couleur_boutique_border, rect, 2, border_radius=6
             )
 
-            # label centré verticalement
-            label = self.game.police_tour.render(
-                t.capitalize(), True, self.couleur_texte
-            )
-            label_y = rect.y + (rect.h - label.get_height()) // 2
-
             # icône (si disponible) centrée verticalement
             icon = None
             if t in self.game.tower_assets:
                 icon = self.game.tower_assets[t].get("icon")
             if icon:
                 icon_y = rect.y + (rect.h - icon.get_height()) // 2
-                ecran.blit(icon, (rect.x + 10, icon_y))
+                surface.blit(icon, (rect.x + 10, icon_y))
 
-            # position du label (après icône)
-            label_x = rect.x + 70
-            ecran.blit(label, (label_x, label_y))
+            # label centré verticalement, après l'icône
+            label = rendre_texte(
+                self.game.police_tour, t.capitalize(), self.couleur_texte
+            )
+            label_y = rect.y + (rect.h - label.get_height()) // 2
+            surface.blit(label, (rect.x + 70, label_y))
 
             # prix : aligné à droite et centré verticalement, couleur selon solvabilité
-            prix_val = self.game.tour_manager.prix_par_type.get(t, 0)
-            can_buy = self.game.joueur.argent >= prix_val
+            can_buy = argent >= prix_val
             prix_color = (240, 240, 240) if can_buy else (220, 80, 80)
-            prix = self.game.police.render(f"{prix_val}", True, prix_color)
-
-            # icône de pièce
-            coin_w, coin_h = 20, 20
-            if self.coin_frames:
-                coin_frame = self.coin_frames[
-                    self.coin_frame_idx % len(self.coin_frames)
-                ]
-                try:
-                    coin_surf = pygame.transform.smoothscale(
-                        coin_frame, (coin_w, coin_h)
-                    )
-                except Exception:
-                    coin_surf = coin_frame
-            else:
-                coin_surf = pygame.Surface((coin_w, coin_h), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    coin_surf, (220, 200, 40), (coin_w // 2, coin_h // 2), coin_w // 2
-                )
-
-            # aligne prix au bord droit du bouton, coin à sa gauche
+            prix = rendre_texte(police, f"{prix_val}", prix_color)
             gap = 6
             prix_x = rect.right - 10 - prix.get_width()
-            coin_x = prix_x - gap - coin_surf.get_width()
-
-            # centrage vertical
             prix_y = rect.y + (rect.h - prix.get_height()) // 2
-            coin_y = rect.y + (rect.h - coin_surf.get_height()) // 2
+            surface.blit(prix, (prix_x, prix_y))
+
+            # icône de pièce à gauche du prix (animée, dessinée par-dessus)
+            coin_x = prix_x - gap - coin_w
+            coin_y = rect.y + (rect.h - coin_h) // 2
+            self._pieces_boutique_tours.append((coin_x + ox, coin_y + oy))
 
-            # dessin: icône puis prix (prix à droite)
-            if coin_surf:
-                ecran.blit(coin_surf, (coin_x, coin_y))
-            ecran.blit(prix, (prix_x, prix_y))
+        # Numéro de vague au-dessus du bouton de vague
+        bouton = self.game.bouton_vague
+        label_vague = rendre_texte(police, f"Vague n° {num_vague}", self.couleur_texte)
+        label_x = bouton.rect.x + (bouton.rect.w - label_vague.get_width()) // 2
+        surface.blit(label_vague, (label_x - ox, bouton.rect.y - 36 - oy))
+
+    def dessiner_boutique_tours(self, ecran: pygame.Surface) -> None:
+        """Dessine la boutique des tours (panneau en cache + sprites animés)."""
+        cle = self._cle_boutique_tours_courante()
+        if cle != self._cle_boutique_tours:
+            self._rendre_boutique_tours(cle)
+            self._cle_boutique_tours = cle
+        ecran.blit(self._cache_boutique_tours, self.rect_boutique)
+
+        # Sprites animés composés par-dessus le panneau
+        self._avancer_animations()
+        if self.coin_frames:
+            ecran.blit(
+                self.coin_frames[self.coin_frame_idx % len(self.coin_frames)],
+                self._pos_piece_solde,
+            )
+        if self.heart_frames:
+            ecran.blit(
+                self.heart_frames[self.heart_frame_idx % len(self.heart_frames)],
+                self._pos_coeur,
+            )
+        piece = self.coin_frames_prix[self.coin_frame_idx % len(self.coin_frames_prix)]
+        for pos in self._pieces_boutique_tours:
+            ecran.blit(piece, pos)
 
         # Bouton de vague
         bouton_actif = self.game.ennemi_manager.vague_terminee()
@@ -229,163 +278,139 @@ class ShopManager:
             self.game.bouton_vague.dessiner(ecran)
             self.game.bouton_vague.couleurs = old_couleurs
 
-        # Affiche le numéro de vague au-dessus du bouton
-        try:
-            label_vague = self.game.police.render(
-                f"Vague n° {self.game.ennemi_manager.num_vague}",
-                True,
-                self.couleur_texte,
-            )
-            label_x = (
-                self.game.bouton_vague.rect.x
-                + (self.game.bouton_vague.rect.w - label_vague.get_width()) // 2
-            )
-            label_y = self.game.bouton_vague.rect.y - 36
-            ecran.blit(label_vague, (label_x, label_y))
-        except Exception:
-            pass
-
-    def dessiner_boutique_sorts(self, ecran: pygame.Surface) -> None:
-        """Dessine la boutique de sorts en bas de l'écran."""
-        pygame.draw.rect(
-            ecran, self.couleur_boutique_sorts_bg, self.rect_boutique_sorts
-        )
-        pygame.draw.rect(
-            ecran, self.couleur_boutique_sorts_border, self.rect_boutique_sorts, 2
-        )
-
-        # Titre de la boutique de sorts
-        titre = self.game.police.render("Boutique de sorts", True, self.couleur_texte)
-        ecran.blit(
-            titre,
-            (
-                self.rect_boutique_sorts.x
-                + (self.rect_boutique_sorts.width - titre.get_width()) // 2,
-                self.rect_boutique_sorts.y + 20,
-            ),
-        )
-
-        # Affichage des sorts disponibles
-        y_offset = 60
-        x_offset = 20
-
+        # Boutons de vitesse : la vitesse courante est mise en évidence
+        for bouton, vitesse in zip(self.game.boutons_vitesse, VITESSES_JEU):
+            if vitesse != self.game.vitesse:
+                bouton.dessiner(ecran)
+                continue
+            old_couleurs = bouton.couleurs.copy()
+            bouton.couleurs["fond_normal"] = bouton.couleurs["fond_survol"]
+            bouton.couleurs["contour"] = (255, 230, 120)
+            bouton.dessiner(ecran)
+            bouton.couleurs = old_couleurs
+
+    # ---------- Boutique des sorts ----------
+    def _etats_sorts(self) -> tuple:
+        """Retourne, pour chaque sort, ce qui influence son affichage."""
+        etats = []
         for sort_key, sort in self.game.sorts.items():
-            # Rectangle pour le sort (même style que la boutique)
-            sort_rect = pygame.Rect(
-                self.rect_boutique_sorts.x + x_offset,
-                self.rect_boutique_sorts.y + y_offset,
-                300,
-                80,
-            )
-
             # Vérifier si le sort est au niveau maximum
             is_max_level = (
                 hasattr(sort, "est_au_niveau_maximum") and sort.est_au_niveau_maximum()
             )
-
             # Pour le sort de la fée, vérifier s'il est déjà actif
             is_fee_active = (
                 sort_key == "fee" and hasattr(sort, "est_actif") and sort.est_actif()
             )
-
             # Pour l'éclair, vérifier s'il est sélectionné
             is_eclair_selected = (
                 sort_key == "eclair"
                 and hasattr(self.game, "eclair_selectionne")
                 and self.game.eclair_selectionne
             )
+            etats.append(
+                (
+                    sort.nom_complet,
+                    sort.prix,
+                    sort.peut_etre_achete(self.game.joueur.argent),
+                    is_max_level,
+                    is_fee_active,
+                    is_eclair_selected,
+                )
+            )
+        return tuple(etats)
+
+    def _cle_boutique_sorts_courante(self) -> tuple:
+        """Regroupe tout ce dont dépend le rendu statique du panneau des sorts."""
+        souris = pygame.mouse.get_pos()
+        survol = -1
+        if self.rect_boutique_sorts.collidepoint(souris):
+            for i, rect in enumerate(self._rects_sorts_ecran):
+                if rect.collidepoint(souris):
+                    survol = i
+                    break
+        return (survol, self._etats_sorts())
+
+    def _rendre_boutique_sorts(self, cle: tuple) -> None:
+        """Re-rend le panneau des sorts dans sa surface en cache."""
+        survol, etats = cle
+        ox, oy = self.rect_boutique_sorts.topleft
+        surface = self._cache_boutique_sorts
+        if surface is None:
+            surface = pygame.Surface(self.rect_boutique_sorts.size)
+            self._cache_boutique_sorts = surface
+        rect_local = surface.get_rect()
+        police = self.game.police
+
+        surface.fill(self.couleur_boutique_sorts_bg)
+        pygame.draw.rect(surface, self.couleur_boutique_sorts_border, rect_local, 2)
 
-            # Effet de survol (comme dans la boutique)
-            hover = sort_rect.collidepoint(pygame.mouse.get_pos())
-            can_buy = (
-                sort.peut_etre_achete(self.game.joueur.argent)
-                and not is_max_level
-                and not is_fee_active
-                and not is_eclair_selected
+        # Titre de la boutique de sorts
+        titre = rendre_texte(police, "Boutique de sorts", self.couleur_texte)
+        surface.blit(titre, ((rect_local.width - titre.get_width()) // 2, 20))
+
+        # Affichage des sorts disponibles
+        self._pieces_boutique_sorts = []
+        coin_w = self.coin_frames_prix[0].get_width()
+        for i, (rect_ecran, etat) in enumerate(zip(self._rects_sorts_ecran, etats)):
+            nom, prix_val, achetable, is_max_level, is_fee_active, is_eclair_selected = (
+                etat
             )
+            sort_rect = rect_ecran.move(-ox, -oy)
+            indisponible = is_max_level or is_fee_active or is_eclair_selected
+            can_buy = achetable and not indisponible
 
-            if hover and can_buy:
+            # Effet de survol (comme dans la boutique)
+            if survol == i and can_buy:
                 couleur_fond = self.couleur_bouton_hover
             else:
                 couleur_fond = self.couleur_bouton_bg
 
             # Dessin avec bordures arrondies (comme la boutique)
-            pygame.draw.rect(ecran, couleur_fond, sort_rect, border_radius=6)
+            pygame.draw.rect(surface, couleur_fond, sort_rect, border_radius=6)
             pygame.draw.rect(
-                ecran, self.couleur_boutique_sorts_border, sort_rect, 2, border_radius=6
+                surface, self.couleur_boutique_sorts_border, sort_rect, 2, border_radius=6
             )
 
-            # Nom du sort avec niveau (style boutique)
-            if is_max_level or is_fee_active or is_eclair_selected:
-                # Grisé quand au niveau maximum, quand la fée est active, ou quand l'éclair est sélectionné
-                nom_sort = self.game.police.render(
-                    sort.nom_complet, True, (120, 120, 120)
-                )
-            else:
-                nom_sort = self.game.police.render(
-                    sort.nom_complet, True, self.couleur_texte
-                )
-            ecran.blit(nom_sort, (sort_rect.x + 10, sort_rect.y + 10))
+            # Nom du sort, grisé quand au niveau maximum, quand la fée est active,
+            # ou quand l'éclair est sélectionné
+            couleur_nom = (120, 120, 120) if indisponible else self.couleur_texte
+            nom_sort = rendre_texte(police, nom, couleur_nom)
+            surface.blit(nom_sort, (sort_rect.x + 10, sort_rect.y + 10))
 
-            # Prix et icône seulement si pas au niveau maximum, pas actif, et pas sélectionné
-            if not is_max_level and not is_fee_active and not is_eclair_selected:
-                # Prix avec couleur selon solvabilité (comme la boutique)
+            if not indisponible:
+                # Prix avec couleur selon solvabilité, pièce animée à droite
                 prix_color = self.couleur_texte if can_buy else (220, 80, 80)
-                prix_text = self.game.police.render(f"{sort.prix}", True, prix_color)
-
-                # Icône de pièce (comme la boutique)
-                coin_w, coin_h = 20, 20
-                if self.coin_frames:
-                    coin_frame = self.coin_frames[
-                        self.coin_frame_idx % len(self.coin_frames)
-                    ]
-                    try:
-                        coin_surf = pygame.transform.smoothscale(
-                            coin_frame, (coin_w, coin_h)
-                        )
-                    except Exception:
-                        coin_surf = coin_frame
-                else:
-                    coin_surf = pygame.Surface((coin_w, coin_h), pygame.SRCALPHA)
-                    pygame.draw.circle(
-                        coin_surf,
-                        (220, 200, 40),
-                        (coin_w // 2, coin_h // 2),
-                        coin_w // 2,
-                    )
-
-                # Positionnement du prix et de l'icône (comme la boutique)
+                prix_text = rendre_texte(police, f"{prix_val}", prix_color)
                 gap = 6
-                coin_x = sort_rect.right - 10 - coin_surf.get_width()
+                coin_x = sort_rect.right - 10 - coin_w
                 prix_x = coin_x - gap - prix_text.get_width()
-                prix_y = sort_rect.y + 40
-                coin_y = sort_rect.y + 40
-
-                ecran.blit(prix_text, (prix_x, prix_y))
-                if coin_surf:
-                    ecran.blit(coin_surf, (coin_x, coin_y))
-            elif is_max_level:
-                # Afficher "MAX" à la place du prix
-                max_text = self.game.police.render("MAX", True, (100, 200, 100))
-                max_x = sort_rect.right - 10 - max_text.get_width()
-                max_y = sort_rect.y + 40
-                ecran.blit(max_text, (max_x, max_y))
-            elif is_fee_active:
-                # Afficher "ACTIF" pour la fée
-                actif_text = self.game.police.render("ACTIF", True, (100, 200, 100))
-                actif_x = sort_rect.right - 10 - actif_text.get_width()
-                actif_y = sort_rect.y + 40
-                ecran.blit(actif_text, (actif_x, actif_y))
-            elif is_eclair_selected:
-                # Afficher "SÉLECTIONNÉ" pour l'éclair
-                selected_text = self.game.police.render(
-                    "SÉLECTIONNÉ", True, (255, 200, 0)
-                )
-                selected_x = sort_rect.right - 10 - selected_text.get_width()
-                selected_y = sort_rect.y + 40
-                ecran.blit(selected_text, (selected_x, selected_y))
+                surface.blit(prix_text, (prix_x, sort_rect.y + 40))
+                self._pieces_boutique_sorts.append((coin_x + ox, sort_rect.y + 40 + oy))
+            else:
+                if is_max_level:
+                    # Afficher "MAX" à la place du prix
+                    texte = rendre_texte(police, "MAX", (100, 200, 100))
+                elif is_fee_active:
+                    # Afficher "ACTIF" pour la fée
+                    texte = rendre_texte(police, "ACTIF", (100, 200, 100))
+                else:
+                    # Afficher "SÉLECTIONNÉ" pour l'éclair
+                    texte = rendre_texte(police, "SÉLECTIONNÉ", (255, 200, 0))
+                texte_x = sort_rect.right - 10 - texte.get_width()
+                surface.blit(texte, (texte_x, sort_rect.y + 40))
 
-            x_offset += 320  # Espacement entre les sorts
+    def dessiner_boutique_sorts(self, ecran: pygame.Surface) -> None:
+        """Dessine la boutique de sorts en bas de l'écran."""
+        cle = self._cle_boutique_sorts_courante()
+        if cle != self._cle_boutique_sorts:
+            self._rendre_boutique_sorts(cle)
+            self._cle_boutique_sorts = cle
+        ecran.blit(self._cache_boutique_sorts, self.rect_boutique_sorts)
+
+        piece = self.coin_frames_prix[self.coin_frame_idx % len(self.coin_frames_prix)]
+        for pos in self._pieces_boutique_sorts:
+            ecran.blit(piece, pos)
 
     def gerer_clic_boutique_tours(self, pos: Tuple[int, int]) -> bool:
         """Gère les clics dans la boutique des tours. Retourne True si un clic a été traité."""
@@ -414,14 +439,9 @@ class ShopManager:
         if not self.rect_boutique_sorts.collidepoint(pos):
             return False
 
-        x_offset = 20
-        for sort_key, sort in self.game.sorts.items():
-            sort_rect = pygame.Rect(
-                self.rect_boutique_sorts.x + x_offset,
-                self.rect_boutique_sorts.y + 60,
-                300,
-                80,
-            )
+        for (sort_key, sort), sort_rect in zip(
+            self.game.sorts.items(), self._rects_sorts_ecran
+        ):
             if sort_rect.collidepoint(pos):
                 # Vérifier si le sort n'est pas au niveau maximum
                 is_max_level = (
@@ -447,10 +467,9 @@ class ShopManager:
                         self.game.eclair_selectionne = True
                         self.game.type_selectionne = None  # Désélectionner les tours
                 elif not is_max_level and not is_fee_active:
-                    achat_ok = sort.acheter(self.game.joueur)
+                    achat_ok = self.game.acheter_sort(sort_key)
                     if achat_ok and sort_key == "fee":
                         # Son d'activation de la fée
                         self.game.jouer_sfx("magic-spell.mp3")
                 return True
-            x_offset += 320
         return False
@@ -4,6 +4,8 @@ from typing import Any, Callable, Dict, Optional
 import pygame
 from classes.menu import afficher_regles
 from classes.constants import WINDOW_WIDTH
+from classes.polices import rendre_texte
+from classes.replay import EnregistreurPartie
 from classes.menu import (
     creer_boutons_credits,
     creer_boutons_menu,
@@ -252,7 +254,7 @@ class StateManager:
         except ImportError:
             # Fallback si la fonction n'existe pas
             screen.fill((0, 0, 0))
-            txt = self.police.render("Game Over", True, (255, 0, 0))
+            txt = rendre_texte(self.police, "Game Over", (255, 0, 0))
             screen.blit(txt, (screen.get_width() // 2 - txt.get_width() // 2, 200))
             for button in self.get_buttons():
                 button.dessiner(screen)
@@ -296,12 +298,26 @@ class StateManager:
         # Recréer le jeu
         from game import Game
 
-        self.game = Game(self.police, est_muet=self.game.audio_manager.est_muet)
+        ancien = self.game
+        # La partie terminée est écrite ; la nouvelle est enregistrée au même endroit
+        ancien.terminer_enregistrement()
+        self.game = Game(
+            self.police,
+            est_muet=ancien.audio_manager.est_muet,
+            fichier_vagues=ancien.ennemi_manager.fichier_vagues,
+        )
+        if ancien.enregistreur is not None:
+            self.game.enregistreur = EnregistreurPartie(
+                ancien.enregistreur.chemin,
+                self.game.graine,
+                self.game.ennemi_manager.fichier_vagues,
+            )
         self.game.audio_manager.demarrer_musique_de_fond()
         self.change_state(GameState.JEU)
 
     def _quitter_jeu(self) -> None:
         """Quitte le jeu."""
+        self.game.terminer_enregistrement()
         pygame.quit()
         import sys
 
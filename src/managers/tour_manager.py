@@ -1,11 +1,12 @@
 import math
-import os
 from typing import TYPE_CHECKING, List, Tuple
 
 import pygame
 
-from classes.constants import ASSETS_DIR
+from classes.couverture import intervalles_couverture, longueurs_cumulees
 from classes.position import Position
+from classes.qualite import MAX_EXPLOSIONS, PALIER_EXPLOSIONS
+from classes.rendu import FileRendu
 from classes.utils import distance_positions
 from models.projectile import (
     EffetExplosion,
@@ -21,15 +22,43 @@ from models.tour import Tour
 if TYPE_CHECKING:
     from game import Game
 
+# Longueur des tronçons du chemin pour la veille des tours (px)
+LONGUEUR_TRONCON = 32.0
+# Marge ajoutée aux portions couvertes (arrondis des distances, px)
+MARGE_COUVERTURE = 1.0
+
 
 class TourManager:
     """Manager pour gérer tous les aspects liés aux tours."""
 
+    # Évolution du prix d'une tour à chaque achat / vente de ce type :
+    # type -> (opération "+" ou "*", hausse à l'achat, baisse à la vente, prix min)
+    EVOLUTION_PRIX: dict[str, tuple[str, float, float, int]] = {
+        "archer": ("+", 2, 2, 5),
+        "catapulte": ("+", 5, 5, 10),
+        "mage": ("*", 1.5, 0.6666, 0),
+        "campement": ("*", 1.5, 0.6666, 0),
+    }
+
     def __init__(self, game: "Game"):
         self.game = game
         self.tours: List[Tour] = []
         self.projectiles: List = []
         self.effets_explosion: List[EffetExplosion] = []
+        # Temps pas encore appliqué aux explosions (pas non affichés)
+        self._dt_effets = 0.0
+        # Veille des tours : chemin de la carte (source, longueurs cumulées),
+        # index tronçon -> tours, tours éveillées / en train de tirer
+        self._chemin_veille: tuple[str, list[float]] | None = None
+        self._reveil_par_troncon: dict[int, List[Tour]] | None = None
+        self._rang_tours: dict[Tour, int] = {}
+        self._eveillees: set[Tour] = set()
+        self._actives: set[Tour] = set()
+        self._temps_veille = 0.0
+        # Une file de rendu par couche, soumise en un seul blit par frame
+        self.file_personnages = FileRendu()
+        self.file_projectiles = FileRendu()
+        self.file_explosions = FileRendu()
 
         # Gestion des positions occupées par les tours
         self.positions_occupees: dict[tuple[int, int], dict] = {}
@@ -53,6 +82,9 @@ class TourManager:
             "campement": getattr(Campement, "PORTEE"),
         }
 
+        # Copie modifiable (outils d'équilibrage)
+        self.evolution_prix = dict(self.EVOLUTION_PRIX)
+
         # Images de base des projectiles (chargées via une fonction générique)
         self.image_fleche = self._charger_image_projectile(
             ProjectileFleche.CHEMIN_IMAGE
@@ -67,6 +99,11 @@ class TourManager:
             ProjectileMageEnnemi.CHEMIN_IMAGE
         )
 
+        # Séquence de l'explosion des orbes de mage, pré-rendue au chargement
+        EffetExplosion.prerendre(
+            ProjectileTourMage.RAYON_ZONE_EFFET, ProjectileTourMage.DUREE_EXPLOSION
+        )
+
     def _charger_image_projectile(self, chemin_relatif: str):
         """Charge une image de projectile en utilisant la fonction utilitaire."""
         from classes.sprites import charger_image_projectile
@@ -76,11 +113,13 @@ class TourManager:
     def ajouter_tour(self, tour: Tour) -> None:
         """Ajoute une tour à la liste des tours."""
         self.tours.append(tour)
+        self._reveil_par_troncon = None
 
     def retirer_tour(self, tour: Tour) -> None:
         """Retire une tour de la liste des tours."""
         if tour in self.tours:
             self.tours.remove(tour)
+            self._reveil_par_troncon = None
 
     def retirer_tour_par_position(self, position: Position) -> None:
         """Retire une tour à une position donnée."""
@@ -92,6 +131,7 @@ class TourManager:
                 and int(t.position.y) == int(position.y)
             )
         ]
+        self._reveil_par_troncon = None
 
     def get_tours_feu_de_camp(self) -> List[Campement]:
         """Retourne toutes les tours de type Campement."""
@@ -104,65 +144,165 @@ class TourManager:
                 return True
         return False
 
-    def mettre_a_jour_tours(self, dt: float, ennemis_actifs: List) -> None:
-        """Met à jour toutes les tours (acquisition cible + tir)."""
-        for t in self.tours:
+    def _troncons_tour(self, tour: Tour) -> Tuple[int, ...]:
+        """Tronçons du chemin (indices) qui passent à portée de la tour."""
+        cle = (tour.portee, tour.position.x, tour.position.y)
+        if tour.troncons_couverts is None or tour.troncons_couverts[:3] != cle:
+            chemin = self.game.carte_jeu.positions_chemin()
+            indices = set()
+            for debut, fin in intervalles_couverture(
+                chemin, tour.position.x, tour.position.y, tour.portee
+            ):
+                premier = max(0, int((debut - MARGE_COUVERTURE) // LONGUEUR_TRONCON))
+                dernier = int((fin + MARGE_COUVERTURE) // LONGUEUR_TRONCON)
+                indices.update(range(premier, dernier + 1))
+            tour.troncons_couverts = cle + (tuple(sorted(indices)),)
+        return tour.troncons_couverts[3]
+
+    def _indexer_veille(self) -> None:
+        """Reconstruit l'index tronçon -> tours (après un ajout ou un retrait)."""
+        reveil: dict[int, List[Tour]] = {}
+        rangs: dict[Tour, int] = {}
+        for rang, t in enumerate(self.tours):
+            rangs[t] = rang
             if isinstance(t, Campement):
+                # Le feu de camp ne tire pas : il est toujours animé
+                self._actives.add(t)
                 continue
+            for i in self._troncons_tour(t):
+                reveil.setdefault(i, []).append(t)
+        self._reveil_par_troncon = reveil
+        self._rang_tours = rangs
+        # Les tours en veille le restent (leur crédit de délai de tir court
+        # toujours) ; les nouvelles s'endorment au prochain pas si rien n'est
+        # à portée
+        self._eveillees = {t for t in rangs if not t.endormie}
+        self._actives &= self._eveillees
+
+    def _troncons_occupes(self, ennemis: List) -> set[int] | None:
+        """
+        Tronçons du chemin où se trouve au moins un ennemi ciblable.
+
+        Returns:
+            Indices des tronçons occupés, ou None si un ennemi suit un autre
+            chemin que celui de la carte (les tours restent alors éveillées)
+        """
+        carte = self.game.carte_jeu
+        if self._chemin_veille is None or self._chemin_veille[0] != carte.source:
+            self._chemin_veille = (
+                carte.source,
+                longueurs_cumulees(carte.positions_chemin()),
+            )
+        source, cumul = self._chemin_veille
+        occupes = set()
+        for e in ennemis:
+            # Les tours ignorent les ennemis morts ou invisibles
+            if e.estMort() or not e.visible:
+                continue
+            if getattr(e, "source_chemin", None) != source:
+                return None
+            occupes.add(int(e.progression(cumul) // LONGUEUR_TRONCON))
+        return occupes
+
+    def _tours_eveillees(self, ennemis: List) -> List[Tour]:
+        """
+        Tours à mettre à jour ce pas-ci, dans l'ordre de `self.tours`.
+
+        Une tour est réveillée si un ennemi occupe un de ses tronçons ou si
+        elle est en train de viser / tirer ; les autres sont mises en veille.
+        """
+        if self._reveil_par_troncon is None:
+            self._indexer_veille()
+        occupes = self._troncons_occupes(ennemis)
+        if occupes is None:
+            eveillees = set(self._rang_tours)
+        else:
+            eveillees = set(self._actives)
+            for i in occupes:
+                eveillees.update(self._reveil_par_troncon.get(i, ()))
+
+        temps = self._temps_veille
+        for t in self._eveillees - eveillees:
+            t.endormir(temps)
+        for t in eveillees - self._eveillees:
+            t.reveiller(temps)
+        self._eveillees = eveillees
+        return sorted(eveillees, key=self._rang_tours.__getitem__)
 
-            def au_tir(tour: Tour, cible):
-                if isinstance(tour, Archer) and self.image_fleche is not None:
-                    p = ProjectileFleche(
-                        origine=tour.position, cible_pos=cible.position.copy()
-                    )
-                    p.cible = cible  # suivi de la cible (comme une flèche)
-                    p.image_base = self.image_fleche
-                    self.projectiles.append(p)
-                    # Joue le son de flèche
-                    self.game.jouer_sfx("arrow.mp3", volume=0.1)
-
-                elif isinstance(tour, Catapulte) and self.image_pierre is not None:
-                    p = ProjectilePierre(
-                        origine=tour.position,
-                        cible_pos=cible.position.copy(),
-                        game_ref=self.game,
-                    )
-                    p.cible = cible
-                    p.image_base = self.image_pierre
-                    self.projectiles.append(p)
-                    # Joue le son de catapulte
-                    self.game.jouer_sfx("catapult.mp3", volume=0.3)
-
-                    # Déclenche la réaction du mage le plus proche pour intercepter la pierre
-                    mage = self.game.get_closest_mage(p.position)
-                    if (
-                        mage is not None
-                        and getattr(self, "image_projectileMageEnnemi", None)
-                        is not None
-                    ):
-                        mage.react_to_projectile()
-                        pm = ProjectileMageEnnemi(
-                            origine=mage.position.copy(), cible_proj=p, vitesse=700.0
-                        )
-                        pm.image_base = self.image_projectileMageEnnemi
-                        self.projectiles.append(pm)
-
-                elif isinstance(tour, TourMage) and self.image_orbe_mage is not None:
-                    # LOGIQUE SIMPLE identique à l'archer (pas d'interception ici)
-                    p = ProjectileTourMage(
-                        origine=tour.position, cible_pos=cible.position.copy()
-                    )
-                    p.cible = cible
-                    p.image_base = self.image_orbe_mage
-                    self.projectiles.append(p)
-                    # Joue le son du mage
-                    self.game.jouer_sfx("fire-magic.mp3", volume=0.2)
-
+    def mettre_a_jour_tours(self, dt: float, ennemis_actifs: List) -> None:
+        """
+        Met à jour les tours éveillées (acquisition cible + tir).
+
+        Une tour au repos sans ennemi sur ses tronçons est en veille : elle ne
+        coûte rien tant qu'aucun ennemi n'entre dans sa couverture.
+        """
+        self._temps_veille += dt
+        for t in self._tours_eveillees(ennemis_actifs):
             if hasattr(t, "maj"):
-                t.maj(dt, ennemis_actifs, au_tir=au_tir)
+                t.maj(dt, ennemis_actifs, au_tir=self.au_tir)
+            if t.est_au_repos and not isinstance(t, Campement):
+                self._actives.discard(t)
+            else:
+                self._actives.add(t)
+
+    def au_tir(self, tour: Tour, cible) -> None:
+        """Crée le projectile d'une tour qui tire sur `cible` (rappel de `Tour.maj`)."""
+        if isinstance(tour, Archer) and self.image_fleche is not None:
+            p = ProjectileFleche(origine=tour.position, cible_pos=cible.position.copy())
+            p.cible = cible  # suivi de la cible (comme une flèche)
+            p.image_base = self.image_fleche
+            self.projectiles.append(p)
+            # Joue le son de flèche
+            self.game.jouer_sfx("arrow.mp3", volume=0.1)
+
+        elif isinstance(tour, Catapulte) and self.image_pierre is not None:
+            p = ProjectilePierre(
+                origine=tour.position,
+                cible_pos=cible.position.copy(),
+                game_ref=self.game,
+            )
+            p.cible = cible
+            p.image_base = self.image_pierre
+            self.projectiles.append(p)
+            # Joue le son de catapulte
+            self.game.jouer_sfx("catapult.mp3", volume=0.3)
+
+            # Déclenche la réaction du mage le plus proche pour intercepter la pierre
+            mage = self.game.get_closest_mage(p.position)
+            if (
+                mage is not None
+                and getattr(self, "image_projectileMageEnnemi", None) is not None
+            ):
+                mage.react_to_projectile()
+                pm = ProjectileMageEnnemi(
+                    origine=mage.position.copy(), cible_proj=p, vitesse=700.0
+                )
+                pm.image_base = self.image_projectileMageEnnemi
+                self.projectiles.append(pm)
 
-    def mettre_a_jour_projectiles(self, dt: float, ennemis_actifs: List) -> None:
-        """Met à jour tous les projectiles et gère les collisions."""
+        elif isinstance(tour, TourMage) and self.image_orbe_mage is not None:
+            # LOGIQUE SIMPLE identique à l'archer (pas d'interception ici)
+            p = ProjectileTourMage(
+                origine=tour.position, cible_pos=cible.position.copy()
+            )
+            p.cible = cible
+            p.image_base = self.image_orbe_mage
+            self.projectiles.append(p)
+            # Joue le son du mage
+            self.game.jouer_sfx("fire-magic.mp3", volume=0.2)
+
+    def mettre_a_jour_projectiles(
+        self, dt: float, ennemis_actifs: List, visuel: bool = True
+    ) -> None:
+        """
+        Met à jour tous les projectiles et gère les collisions.
+
+        Args:
+            dt: Pas de temps (s)
+            ennemis_actifs: Ennemis que les projectiles peuvent toucher
+            visuel: False pour un pas qui ne sera pas affiché (jeu accéléré) :
+                les explosions n'avancent qu'au prochain pas affiché
+        """
         for pr in self.projectiles:
             if hasattr(pr, "mettreAJour"):
                 pr.mettreAJour(dt)
@@ -182,7 +322,7 @@ class TourManager:
                                 pr.detruit = True
                                 # Créer un effet d'explosion visuel
                                 effet = EffetExplosion(
-                                    pr.x, pr.y, pr.rayon_zone_effet, 0.6
+                                    pr.x, pr.y, pr.rayon_zone_effet, pr.DUREE_EXPLOSION
                                 )
                                 self.effets_explosion.append(effet)
                                 # Son d'explosion magique
@@ -210,14 +350,17 @@ class TourManager:
                     cible.detruit = True
                     pr.detruit = True
 
-        # Mise à jour des effets d'explosion
-        for effet in self.effets_explosion:
-            effet.mettre_a_jour(dt)
+        # Mise à jour des effets d'explosion (purement visuels)
+        self._dt_effets += dt
+        if visuel:
+            for effet in self.effets_explosion:
+                effet.mettre_a_jour(self._dt_effets)
+            self._dt_effets = 0.0
 
-        # Nettoyage des effets d'explosion terminés
-        self.effets_explosion = [
-            effet for effet in self.effets_explosion if effet.actif
-        ]
+            # Nettoyage des effets d'explosion terminés
+            self.effets_explosion = [
+                effet for effet in self.effets_explosion if effet.actif
+            ]
 
         # Nettoyage projectiles
         self.projectiles = [
@@ -239,19 +382,29 @@ class TourManager:
 
     def dessiner_personnages_tours(self, ecran: pygame.Surface) -> None:
         """Dessine les personnages des tours."""
+        file = self.file_personnages
         for t in self.tours:
-            t.draw_person(ecran)
+            t.preparer_rendu_personnage(file)
+        file.soumettre(ecran)
 
     def dessiner_projectiles(self, ecran: pygame.Surface) -> None:
         """Dessine tous les projectiles."""
+        file = self.file_projectiles
         for pr in self.projectiles:
-            if hasattr(pr, "dessiner"):
-                pr.dessiner(ecran)
+            if hasattr(pr, "preparer_rendu"):
+                pr.preparer_rendu(file)
+        file.soumettre(ecran)
 
     def dessiner_effets_explosion(self, ecran: pygame.Surface) -> None:
         """Dessine tous les effets d'explosion."""
-        for effet in self.effets_explosion:
-            effet.dessiner(ecran)
+        file = self.file_explosions
+        effets = self.effets_explosion
+        if self.game.perf.qualite.palier >= PALIER_EXPLOSIONS:
+            # Qualité réduite : seulement les plus récentes
+            effets = effets[-MAX_EXPLOSIONS:]
+        for effet in effets:
+            effet.preparer_rendu(file)
+        file.soumettre(ecran)
 
     def dessiner_range_tour(
         self,
@@ -335,18 +488,15 @@ class TourManager:
         nouvelle_tour = self.creer_tour(type_tour, pos_tour, tour_id)
 
         if nouvelle_tour is not None:
+            nouvelle_tour.portee = self.portee_par_type.get(
+                type_tour, nouvelle_tour.portee
+            )
             self.ajouter_tour(nouvelle_tour)
             self.positions_occupees[case]["instance"] = nouvelle_tour
 
             # Joue le son du campement si c'est un campement
             if type_tour == "campement":
-                try:
-                    campfire_sound = pygame.mixer.Sound(
-                        os.path.join(ASSETS_DIR, "audio", "bruitage", "camp-fire.mp3")
-                    )
-                    campfire_sound.play().set_volume(0.15)
-                except Exception:
-                    pass
+                self.game.jouer_sfx("camp-fire.mp3", volume=0.15)
 
             # Mémorise le prix d'achat pour revente éventuelle
             self.positions_occupees[case]["prix"] = self.prix_par_type.get(type_tour, 0)
@@ -387,31 +537,26 @@ class TourManager:
 
     def _augmenter_prix_apres_achat(self, type_tour: str) -> None:
         """Augmente le prix d'une tour après achat."""
-        if type_tour == "campement":
-            self.prix_par_type["campement"] = int(self.prix_par_type["campement"] * 1.5)
-        elif type_tour == "archer":
-            self.prix_par_type["archer"] = int(self.prix_par_type["archer"] + 2)
-        elif type_tour == "catapulte":
-            self.prix_par_type["catapulte"] = int(self.prix_par_type["catapulte"] + 5)
-        elif type_tour == "mage":
-            self.prix_par_type["mage"] = int(self.prix_par_type["mage"] * 1.5)
+        if type_tour not in self.evolution_prix:
+            return
+        operation, hausse, _, _ = self.evolution_prix[type_tour]
+        prix = self.prix_par_type[type_tour]
+        if operation == "*":
+            self.prix_par_type[type_tour] = int(prix * hausse)
+        else:
+            self.prix_par_type[type_tour] = int(prix + hausse)
 
     def _diminuer_prix_apres_vente(self, case: tuple[int, int]) -> None:
         """Diminue le prix d'une tour après vente."""
         type_tour = self.positions_occupees[case]["type_selectionne"]
-
-        if type_tour == "campement":
-            self.prix_par_type["campement"] = int(
-                round(self.prix_par_type["campement"] * 0.6666)
-            )
-        elif type_tour == "archer":
-            self.prix_par_type["archer"] = max(5, int(self.prix_par_type["archer"] - 2))
-        elif type_tour == "catapulte":
-            self.prix_par_type["catapulte"] = max(
-                10, int(self.prix_par_type["catapulte"] - 5)
-            )
-        elif type_tour == "mage":
-            self.prix_par_type["mage"] = int(round(self.prix_par_type["mage"] * 0.6666))
+        if type_tour not in self.evolution_prix:
+            return
+        operation, _, baisse, prix_min = self.evolution_prix[type_tour]
+        prix = self.prix_par_type[type_tour]
+        if operation == "*":
+            self.prix_par_type[type_tour] = max(prix_min, int(round(prix * baisse)))
+        else:
+            self.prix_par_type[type_tour] = max(prix_min, int(prix - baisse))
 
     def selectionner_tour(self, case: tuple[int, int] | None) -> None:
         """Sélectionne ou désélectionne une tour."""
@@ -456,7 +601,13 @@ class TourManager:
     def reset(self) -> None:
         """Remet le manager à zéro."""
         self.tours = []
+        self._reveil_par_troncon = None
+        self._rang_tours = {}
+        self._eveillees = set()
+        self._actives = set()
+        self._temps_veille = 0.0
         self.projectiles = []
         self.effets_explosion = []
+        self._dt_effets = 0.0
         self.positions_occupees = {}
         self.tour_selectionnee = None
@@ -3,11 +3,18 @@ from typing import TYPE_CHECKING
 
 import pygame
 
+from classes.types_ennemis import TYPES_ENNEMIS
+from classes.polices import obtenir_police, rendre_texte, statistiques_cache_texte
+from classes.qualite import INTERVALLE_NUIT, PALIER_NUIT
 from classes.sprites import charger_image_avec_redimensionnement
+from models.projectile import EffetExplosion
 
 if TYPE_CHECKING:
     from game import Game
 
+# Nombre de frames entre deux rafraîchissements de l'overlay de performance
+INTERVALLE_OVERLAY_PERF = 15
+
 
 class UIManager:
     """Manager pour gérer tous les aspects de l'interface utilisateur."""
@@ -23,6 +30,19 @@ class UIManager:
         # Cache pour les images
         self._victoire_image = None
 
+        # Overlay de performance (recalculé toutes les INTERVALLE_OVERLAY_PERF frames)
+        self._overlay_perf: pygame.Surface | None = None
+        self._frames_overlay_perf = 0
+
+        # Dernier voile de nuit (réutilisé quelques frames en qualité réduite)
+        self._voile_nuit: pygame.Surface | None = None
+        self._frames_voile_nuit = 0
+
+        # Ennemi le plus rapide : temps à portée affiché au survol (pire cas)
+        self._vitesse_max = max(t.vitesse for t in TYPES_ENNEMIS.values())
+        # Fonds des étiquettes de couverture, par taille (largeur, hauteur)
+        self._fonds_couverture: dict[tuple[int, int], pygame.Surface] = {}
+
     def dessiner_quadrillage(self, ecran: pygame.Surface) -> None:
         """Dessine le quadrillage de la grille."""
         largeur_draw = self.game.largeur_ecran
@@ -111,11 +131,50 @@ class UIManager:
             y2 = int(cy + portee * math.sin(angle_end))
             pygame.draw.line(ecran, (255, 255, 255), (x1, y1), (x2, y2), 3)
 
+        if not interdit:
+            self._dessiner_couverture(ecran, (x_case, y_case), rect)
+
+    def _dessiner_couverture(
+        self, ecran: pygame.Surface, case: tuple[int, int], rect: pygame.Rect
+    ) -> None:
+        """Affiche sous la case survolée la longueur de chemin à portée."""
+        couverture = self.game.couverture
+        type_tour = self.game.type_selectionne
+        longueur = couverture.longueur(case, type_tour)
+        temps = couverture.temps(case, type_tour, self._vitesse_max)
+        texte = rendre_texte(
+            obtenir_police(20), f"{longueur:.0f} px - {temps:.1f} s", (255, 255, 255)
+        )
+        # Fond semi-transparent créé une fois par taille d'étiquette
+        taille = (texte.get_width() + 8, texte.get_height() + 4)
+        fond = self._fonds_couverture.get(taille)
+        if fond is None:
+            fond = pygame.Surface(taille, pygame.SRCALPHA)
+            fond.fill((0, 0, 0, 150))
+            self._fonds_couverture[taille] = fond
+        position = fond.get_rect(midtop=(rect.centerx, rect.bottom + 2))
+        position.clamp_ip(
+            pygame.Rect(0, 0, self.game.largeur_ecran, self.game.hauteur_ecran)
+        )
+        ecran.blit(fond, position)
+        ecran.blit(texte, (position.x + 4, position.y + 2))
+
     def dessiner_effet_nuit(self, ecran: pygame.Surface, dt: float) -> None:
         """Dessine l'effet de nuit avec les lumières."""
         if not self.game.ennemi_manager.est_nuit:
             return
 
+        if (
+            self.game.perf.qualite.palier >= PALIER_NUIT
+            and self._voile_nuit is not None
+            and self._frames_voile_nuit < INTERVALLE_NUIT
+        ):
+            # Qualité réduite : voile de la frame précédente, feux animés quand même
+            self._frames_voile_nuit += 1
+            self.game.tour_manager.mettre_a_jour_feux_de_camps(dt, None)
+            ecran.blit(self._voile_nuit, (0, 0))
+            return
+
         nuit_surface = pygame.Surface(
             (self.game.largeur_ecran, self.game.hauteur_ecran), pygame.SRCALPHA
         )
@@ -132,7 +191,7 @@ class UIManager:
             )
         else:
             # Effet de lumière du curseur seulement si la souris est sur la carte
-            x, y = pygame.mouse.get_pos()
+            x, y = self.game.position_souris()
             if x < self.game.largeur_ecran:
                 # Portée de base du curseur
                 portee_curseur = 100
@@ -147,6 +206,8 @@ class UIManager:
         self.game.tour_manager.mettre_a_jour_feux_de_camps(dt, nuit_surface)
 
         ecran.blit(nuit_surface, (0, 0))
+        self._voile_nuit = nuit_surface
+        self._frames_voile_nuit = 1
 
     def dessiner_victoire(self, ecran: pygame.Surface) -> None:
         """Dessine l'écran de victoire."""
@@ -165,32 +226,122 @@ class UIManager:
 
     def dessiner_interface_jeu(self, ecran: pygame.Surface, dt: float) -> None:
         """Dessine l'interface de jeu complète."""
+        perf = self.game.perf
+        t = perf.horloge()
+
         # Dessiner la carte de base
         ecran.blit(self.game.carte, (0, 0))
+        t = perf.noter("rendu carte", t)
 
         # Dessiner les tours
         self.game.tour_manager.dessiner_tours_placees(ecran, self.game.taille_case)
         self.game.tour_manager.dessiner_personnages_tours(ecran)
+        t = perf.noter("rendu tours", t)
 
         # Dessiner les surbrillances
         self.dessiner_surbrillance(ecran)
+        t = perf.noter("rendu surbrillance", t)
 
         # Dessiner l'effet de nuit
         self.dessiner_effet_nuit(ecran, dt)
+        t = perf.noter("rendu nuit", t)
 
         # Dessiner les boutiques
         self.game.shop_manager.dessiner_boutique_tours(ecran)
         self.game.shop_manager.dessiner_boutique_sorts(ecran)
+        t = perf.noter("rendu boutiques", t)
 
         # Dessiner les ennemis
         self.game.ennemi_manager.dessiner_ennemis(ecran)
+        t = perf.noter("rendu ennemis", t)
 
         # Dessiner les effets des sorts
         self.dessiner_effets_sorts(ecran)
+        t = perf.noter("rendu sorts", t)
 
         # Dessiner les projectiles et effets d'explosion
         self.game.tour_manager.dessiner_projectiles(ecran)
         self.game.tour_manager.dessiner_effets_explosion(ecran)
+        perf.noter("rendu projectiles", t)
+
+        # Overlay de performance (F3) et des allocations (F4)
+        if perf.actif or perf.allocations.actif:
+            self.dessiner_performance(ecran)
+
+    def _lignes_performance(self) -> list:
+        """Construit les lignes (libellé, valeur) de l'overlay de performance."""
+        lignes = [
+            (phase, f"{moyenne:6.2f} ms   p99 {p99:6.2f} ms")
+            for phase, moyenne, p99 in self.game.perf.statistiques()
+        ]
+        tm = self.game.tour_manager
+        cache_texte = statistiques_cache_texte()
+        frames_explosion = sum(len(f) for f in EffetExplosion._frames_par_cle.values())
+        qualite = self.game.perf.qualite
+        plus_lourde = qualite.phase_la_plus_lourde()
+        phase_lourde = (
+            f"{plus_lourde[0]} ({plus_lourde[1]:.2f} ms)" if plus_lourde else "-"
+        )
+        lignes += [
+            ("", ""),
+            ("Ennemis actifs", str(len(self.game.ennemi_manager.get_ennemis_actifs()))),
+            ("Projectiles", str(len(tm.projectiles))),
+            ("Explosions", str(len(tm.effets_explosion))),
+            ("Tours", str(len(tm.tours))),
+            ("Tours en veille", str(sum(t.endormie for t in tm.tours))),
+            ("Qualité", qualite.description()),
+            (
+                "Coût moyen frame",
+                f"{qualite.cout_moyen_ms:6.2f} ms / {qualite.budget_ms:.2f} ms",
+            ),
+            ("Phase la plus lourde", phase_lourde),
+            (
+                "Textes en cache",
+                f"{cache_texte['textes_en_cache']}"
+                f" ({cache_texte['succes']} succès / {cache_texte['echecs']} échecs)",
+            ),
+            ("Frames d'explosion", str(frames_explosion)),
+        ]
+        allocations = self.game.perf.allocations
+        if allocations.actif:
+            lignes.append(("", ""))
+            lignes += [
+                (f"alloc {nom}", f"{blocs:6.1f} blocs  {octets:8.0f} o / frame")
+                for nom, blocs, octets in allocations.statistiques_sous_systemes()
+            ]
+            lignes += [
+                (f"pic {phase}", f"{moyen / 1024:7.1f} Kio  max {maximum / 1024:7.1f}")
+                for phase, moyen, maximum in allocations.statistiques_phases()
+            ]
+            lignes += [
+                (site, f"{blocs:6.1f} blocs / frame  ({frames} frames)")
+                for site, _, frames, blocs in allocations.sites_principaux(4)
+            ]
+        return lignes
+
+    def dessiner_performance(self, ecran: pygame.Surface) -> None:
+        """Dessine l'overlay des temps par phase (rafraîchi quelques fois par seconde)."""
+        self._frames_overlay_perf += 1
+        if (
+            self._overlay_perf is None
+            or self._frames_overlay_perf >= INTERVALLE_OVERLAY_PERF
+        ):
+            self._frames_overlay_perf = 0
+            police = obtenir_police(22)
+            lignes = self._lignes_performance()
+            hauteur_ligne = police.get_linesize()
+            overlay = pygame.Surface(
+                (430, 12 + hauteur_ligne * len(lignes)), pygame.SRCALPHA
+            )
+            overlay.fill((0, 0, 0, 170))
+            for i, (libelle, valeur) in enumerate(lignes):
+                y = 6 + i * hauteur_ligne
+                overlay.blit(rendre_texte(police, libelle, (220, 255, 220)), (8, y))
+                # Les valeurs changent souvent, mais beaucoup se répètent d'un
+                # rafraîchissement à l'autre ; le cache LRU oublie les autres
+                overlay.blit(rendre_texte(police, valeur, (220, 255, 220)), (180, y))
+            self._overlay_perf = overlay
+        ecran.blit(self._overlay_perf, (8, 8))
 
     def nettoyer_cache(self) -> None:
         """Nettoie le cache des images."""
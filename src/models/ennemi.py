@@ -1,69 +1,194 @@
-from abc import ABC, abstractmethod
-
 # Evite les boucles dans les imports mutuels
-from typing import TYPE_CHECKING, Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Type
 
 import pygame
 
-from classes.constants import MAP_TILESET_TMJ
+from classes.carte import charger_carte
+from classes.constants import MAP_TMX
 from classes.position import Position
+from classes.rendu import FileRendu, surface_retournee, surface_transparente
 from classes.sprites import charger_sprites_ennemi
+from classes.types_ennemis import (
+    BAS,
+    BLOCAGE,
+    COTE,
+    HAUT,
+    NB_ETATS,
+    PREFIXES_DIRECTION,
+    TYPES_ENNEMIS,
+    TypeEnnemi,
+)
 from classes.utils import charger_chemin_tiled, distance_positions
 
 if TYPE_CHECKING:
     from game import Game
 
 
-SCALE_FACTOR = 2
+# Durée d'une frame de marche (s)
+DUREE_FRAME = 0.15
+# Durée de la pose « Block » après une flèche parée (s)
+DUREE_BLOCAGE = 0.2
+# Délai entre deux attaques d'un ennemi `attaque` (s)
+DELAI_ATTAQUE = 3
+
+
+class Ennemi:
+    """
+    Ennemi qui suit le chemin de la carte.
+
+    Les caractéristiques viennent du type (`TYPE`, une ligne de
+    `data/typeTroupe.txt`) ; chaque type a sa sous-classe, créée par
+    `_creer_classe`. L'animation est un état entier (direction, + BLOCAGE
+    pendant une parade) avancé pour tous les ennemis par `animer_ennemis`.
+    """
 
+    TYPE: TypeEnnemi
+    # Nombre de frames de chaque état d'animation (rempli par type)
+    NB_FRAMES: Tuple[int, ...] = ()
+    # Frames de chaque état, chargées au premier dessin (une fois par type)
+    _frames_par_etat: Optional[Tuple[List[pygame.Surface], ...]] = None
 
-class Ennemi(ABC):
     def __init__(
         self,
-        vitesse: float,
-        pointsDeVie: int,
-        degats: int,
-        argent: int,
         tempsApparition=0,
         chemin: Optional[List[Position]] = None,
         on_reach_castle: Optional[Callable[["Ennemi"], None]] = None,
-        tmj_path: str = MAP_TILESET_TMJ,
+        tmj_path: str = MAP_TMX,
         layer_name: str = "path",
     ):
+        # Carte dont l'ennemi suit le chemin principal (None : chemin fourni)
+        self.source_chemin: Optional[str] = None
         if chemin is None:
-            chemin = charger_chemin_tiled(tmj_path, layer_name=layer_name)
+            if layer_name == "path":
+                carte = charger_carte(tmj_path)
+                chemin = carte.positions_chemin()
+                self.source_chemin = carte.source
+            else:
+                chemin = charger_chemin_tiled(tmj_path, layer_name=layer_name)
         if len(chemin) < 2:
             raise ValueError("Chemin invalide (>=2 points requis).")
-        self.vitesse = float(vitesse)
-        self.pointsDeVie = int(pointsDeVie)
-        self.pointsDeVieInitiaux = int(pointsDeVie)
-        self.pointsDeVieMax = int(pointsDeVie)
-        self.degats = int(degats)
-        # Montant d'or donné au joueur quand cet ennemi est tué
-        self.argent = int(argent)
         self._chemin: List[Position] = chemin
+        self._on_reach_castle = on_reach_castle
+        # Sortie du jeu (mort ou arrivée au bout) : EnnemiManager, voir
+        # `_on_retrait` ; indice dans la liste des ennemis actifs (-1 : aucune)
+        self._on_retrait: Optional[Callable[["Ennemi"], None]] = None
+        # Vies de l'objet : incrémenté à chaque réutilisation (réserve
+        # d'ennemis de l'EnnemiManager), pour repérer les références périmées
+        self.generation = 0
+        self._reinitialiser(tempsApparition)
+
+    def _reinitialiser(self, tempsApparition: float) -> None:
+        """Remet l'ennemi au départ du chemin, avec les caractéristiques du type."""
+        type_ennemi = self.TYPE
+        self.vitesse = type_ennemi.vitesse
+        self.pointsDeVie = type_ennemi.points_de_vie
+        self.pointsDeVieInitiaux = type_ennemi.points_de_vie
+        self.pointsDeVieMax = type_ennemi.points_de_vie
+        self.degats = type_ennemi.degats
+        # Montant d'or donné au joueur quand cet ennemi est tué
+        self.argent = type_ennemi.argent
+        self._recompense_donnee = False
+        self._ne_pas_recompenser = False
         self.position = self._chemin[0].copy()
         self._segment_index = 0
         self._dist_on_segment = 0.0
         self._arrive_au_bout = False
         self.visible = False
-        self._on_reach_castle = on_reach_castle
+        self._indice_actif = -1
+        # Rang d'apparition donné par l'EnnemiManager (ordre de dessin)
+        self._ordre = 0
         self.tempsApparition = tempsApparition
-        self.est_Apparu = False
 
-    @abstractmethod
+        # Animation
+        self.etat = BAS
+        self.frame_index = 0
+        self.frame_timer = 0
+        self.flip = False
+        self.block_timer = 0.0
+        self._time_since_last_attack = 10.0
+
+    def recycler(self, tempsApparition: float) -> None:
+        """
+        Réutilise un ennemi sorti du jeu pour une nouvelle apparition.
+
+        Les références gardées sur l'ancienne vie (cible d'une tour ou d'un
+        projectile) sont périmées : elles le détectent avec `generation`.
+        """
+        self.generation += 1
+        self._reinitialiser(tempsApparition)
+
+    @property
+    def type_nom(self) -> str:
+        return self.TYPE.nom
+
+    @classmethod
+    def frames_par_etat(cls) -> Tuple[List[pygame.Surface], ...]:
+        """Frames de chaque état d'animation, chargées une seule fois par type."""
+        if cls._frames_par_etat is None:
+            t = cls.TYPE
+            marche = [
+                charger_sprites_ennemi(
+                    t.dossier, f"{p}_{t.animation}.png", t.nb_frames, scale=t.echelle
+                )
+                for p in PREFIXES_DIRECTION
+            ]
+            if t.blocage:
+                bloque = [
+                    charger_sprites_ennemi(
+                        t.dossier, f"{p}_Block.png", 1, scale=t.echelle
+                    )
+                    for p in PREFIXES_DIRECTION
+                ]
+            else:
+                bloque = marche  # jamais utilisé : le type ne bloque pas
+            cls._frames_par_etat = tuple(marche + bloque)
+        return cls._frames_par_etat
+
+    def _sprite(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Surface à dessiner (variante en cache) et position du coin haut-gauche."""
+        # Récupérer la frame de l'état courant
+        frame = self.frames_par_etat()[self.etat][self.frame_index]
+
+        # Flip horizontal si besoin (uniquement de côté)
+        if self.flip and self.etat % BLOCAGE == COTE:
+            frame = surface_retournee(frame)
+        # 80% d'opacité si visible (255 * 0.8 = 204), sinon 70
+        frame = surface_transparente(frame, 204 if self.visible else 70)
+        pos = (
+            int(self.position.x - frame.get_width() // 2),
+            int(self.position.y - frame.get_height() // 2),
+        )
+        return frame, pos
+
     def draw(self, ecran: pygame.Surface) -> None:
-        """Dessine l’ennemi (implémenté par chaque sous-classe)."""
-        raise NotImplementedError
+        if self.estMort():
+            return
+        ecran.blit(*self._sprite())
 
-    def apparaitre(self):
-        self.position = self._chemin[0].copy()
-        self._segment_index = 0
-        self._dist_on_segment = 0.0
-        self._arrive_au_bout = False
-        self.visible = False
-        self.pointsDeVie = self.pointsDeVieInitiaux
-        self.est_Apparu = True
+    def preparer_rendu(self, file: FileRendu) -> None:
+        """Ajoute le sprite de l'ennemi à la file de rendu de sa couche."""
+        if self.estMort():
+            return
+        file.ajouter(*self._sprite())
+
+    def block(self):
+        """Pare une flèche : fige l'ennemi sur la frame « Block » (types `blocage`)."""
+        if not self.TYPE.blocage:
+            return
+        self.frame_index = 0
+        self.frame_timer = 0
+        self.etat = self.etat % BLOCAGE + BLOCAGE
+        self.block_timer = DUREE_BLOCAGE
+
+    def ready_to_attack(self) -> bool:
+        """Retourne True si l'ennemi peut attaquer (type `attaque`, délai écoulé)."""
+        return self.TYPE.attaque and self._time_since_last_attack >= DELAI_ATTAQUE
+
+    def react_to_projectile(self):
+        """Déclenche l'attaque de l'ennemi (remet le délai à zéro)."""
+        if not self.ready_to_attack():
+            return  # ignore si le cooldown n'est pas fini
+        self._time_since_last_attack = 0.0
 
     def seDeplacer(self, dt: float):
         """
@@ -101,12 +226,14 @@ class Ennemi(ABC):
             # Déterminer la direction d'animation selon le mouvement dominant
             if abs(dx) > abs(dy):
                 # Mouvement principalement horizontal
-                self.direction = "side"
+                etat = COTE
                 self.flip = dx > 0  # flip si on va vers la droite (convention du jeu)
             else:
                 # Mouvement principalement vertical
-                self.direction = "down" if dy > 0 else "up"
+                etat = BAS if dy > 0 else HAUT
                 self.flip = False  # Pas de flip pour les mouvements verticaux
+            # Pendant un blocage, la feuille « Block » de la même direction
+            self.etat = etat + BLOCAGE if self.block_timer > 1e-9 else etat
 
             # Calculer la longueur du segment et la distance restante
             seg_len = max(1e-9, distance_positions(p0, p1))  # Longueur du segment
@@ -139,7 +266,10 @@ class Ennemi(ABC):
                     break
 
     def perdreVie(self, degats: int):
+        etait_vivant = self.pointsDeVie > 0
         self.pointsDeVie = max(0, self.pointsDeVie - int(degats))
+        if etait_vivant and self.pointsDeVie <= 0 and self._on_retrait is not None:
+            self._on_retrait(self)
 
     def getDistance(self, pos: Position) -> float:
         return distance_positions(self.position, pos)
@@ -157,9 +287,12 @@ class Ennemi(ABC):
         self._arrive_au_bout = True
         if self._on_reach_castle and not self.estMort():
             self._on_reach_castle(self)
+        # Un ennemi mort a déjà été signalé par perdreVie
+        if self._on_retrait is not None and not self.estMort():
+            self._on_retrait(self)
 
     def majVisible(self, game: Optional["Game"]):
-        x, y = pygame.mouse.get_pos()
+        x, y = game.position_souris() if game else pygame.mouse.get_pos()
         pointeurPos = Position(x, y)
 
         # Vérifier d'abord si l'effet de la fée est actif
@@ -183,10 +316,14 @@ class Ennemi(ABC):
         else:
             self.set_visibilite(False)
 
-    def estApparu(self, debutVague):
-        return self.tempsApparition <= round(
-            (pygame.time.get_ticks() - debutVague) / 1000, 1
-        )  # conversion en sec
+    def progression(self, cumul: List[float]) -> float:
+        """
+        Distance parcourue depuis le départ du chemin.
+
+        Args:
+            cumul: Longueurs cumulées du chemin (`couverture.longueurs_cumulees`)
+        """
+        return cumul[self._segment_index] + self._dist_on_segment
 
     def get_distance_restante(self) -> float:
         """
@@ -219,514 +356,76 @@ class Ennemi(ABC):
         return dist_restante
 
 
-class Gobelin(Ennemi):
-    # Attributs de classe : frames par direction
-    _frames_by_dir: dict[str, list[pygame.Surface]] | None = None
-
-    @property
-    def type_nom(self) -> str:
-        return "Gobelin"
-
-    def __init__(
-        self, tempsApparition: int, chemin: Optional[List[Position]] = None, **kw
-    ):
-        super().__init__(
-            tempsApparition=tempsApparition,
-            vitesse=50.0,
-            pointsDeVie=70,
-            degats=8,
-            argent=0,
-            chemin=chemin,
-            **kw
-        )
-
-        # Charger les spritesheets une seule fois
-        if Gobelin._frames_by_dir is None:
-            Gobelin._frames_by_dir = {
-                "down": charger_sprites_ennemi(
-                    "goblin", "D_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-                "up": charger_sprites_ennemi(
-                    "goblin", "U_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-                "side": charger_sprites_ennemi(
-                    "goblin", "S_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-            }
-
-        self.pointsDeVieInitiaux = self.pointsDeVie
-        self.direction = "down"  # par défaut
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.flip = False
-
-    def update_animation(self, dt: float):
-        """Met à jour l’index de frame en fonction du temps (dt)."""
-        self.frame_timer += dt
-        if self.frame_timer >= 0.15:  # change toutes les 150ms
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(
-                Gobelin._frames_by_dir[self.direction]
-            )
-
-    def draw(self, ecran: pygame.Surface) -> None:
-        if self.estMort():
-            return
-
-        # Récupérer les frames correspondant à la direction
-        frames = Gobelin._frames_by_dir[self.direction]
-        frame = frames[self.frame_index]
-
-        # Flip horizontal si besoin (uniquement pour "side")
-        if self.direction == "side" and self.flip:
-            frame = pygame.transform.flip(frame, True, False)
-        pos = (
-            int(self.position.x - frame.get_width() // 2),
-            int(self.position.y - frame.get_height() // 2),
-        )
-        if self.visible:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(204)  # 80% d'opacité (255 * 0.8 = 204)
-            ecran.blit(temp, pos)
-        else:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(70)  # Réduit de 20% par rapport à 90
-            ecran.blit(temp, pos)
-
-
-SCALE_FACTOR = 2  # redimensionne toutes les frames
-
-
-class Rat(Ennemi):
-    _frames_by_dir: dict[str, list[pygame.Surface]] | None = None
-
-    @property
-    def type_nom(self) -> str:
-        return "Rat"
-
-    def __init__(
-        self, tempsApparition: int, chemin: Optional[List[Position]] = None, **kw
-    ):
-        super().__init__(
-            tempsApparition=tempsApparition,
-            vitesse=120.0,
-            pointsDeVie=5,
-            degats=3,
-            argent=0,
-            chemin=chemin,
-            **kw
-        )
-
-        if Rat._frames_by_dir is None:
-            Rat._frames_by_dir = {
-                "down": charger_sprites_ennemi("rat", "D_Run.png", 6, scale=2 / 3),
-                "up": charger_sprites_ennemi("rat", "U_Run.png", 6, scale=2 / 3),
-                "side": charger_sprites_ennemi("rat", "S_Run.png", 6, scale=2 / 3),
-            }
-
-        self.pointsDeVieInitiaux = self.pointsDeVie
-        self.direction = "down"
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.flip = False
-
-    def update_animation(self, dt: float):
-        self.frame_timer += dt
-        if self.frame_timer >= 0.15:
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(
-                Rat._frames_by_dir[self.direction]
-            )
-
-    def draw(self, ecran: pygame.Surface) -> None:
-        if self.estMort():
-            return
-        frames = Rat._frames_by_dir[self.direction]
-        frame = frames[self.frame_index]
-        if self.direction == "side" and self.flip:
-            frame = pygame.transform.flip(frame, True, False)
-        pos = (
-            int(self.position.x - frame.get_width() // 2),
-            int(self.position.y - frame.get_height() // 2),
-        )
-        if self.visible:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(204)  # 80% d'opacité (255 * 0.8 = 204)
-            ecran.blit(temp, pos)
-        else:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(70)  # Réduit de 20% par rapport à 90
-            ecran.blit(temp, pos)
-
-
-class Loup(Ennemi):
-    _frames_by_dir: dict[str, list[pygame.Surface]] | None = None
-
-    @property
-    def type_nom(self) -> str:
-        return "Loup"
-
-    def __init__(
-        self, tempsApparition: int, chemin: Optional[List[Position]] = None, **kw
-    ):
-        super().__init__(
-            tempsApparition=tempsApparition,
-            vitesse=90.0,
-            pointsDeVie=80,
-            degats=10,
-            argent=1,
-            chemin=chemin,
-            **kw
-        )
-
-        if Loup._frames_by_dir is None:
-            Loup._frames_by_dir = {
-                "down": charger_sprites_ennemi(
-                    "wolf", "D_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-                "up": charger_sprites_ennemi(
-                    "wolf", "U_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-                "side": charger_sprites_ennemi(
-                    "wolf", "S_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-            }
-
-        self.pointsDeVieInitiaux = self.pointsDeVie
-        self.direction = "down"
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.flip = False
-
-    def update_animation(self, dt: float):
-        self.frame_timer += dt
-        if self.frame_timer >= 0.15:
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(
-                Loup._frames_by_dir[self.direction]
-            )
-
-    def draw(self, ecran: pygame.Surface) -> None:
-        if self.estMort():
-            return
-        frames = Loup._frames_by_dir[self.direction]
-        frame = frames[self.frame_index]
-        if self.direction == "side" and self.flip:
-            frame = pygame.transform.flip(frame, True, False)
-        pos = (
-            int(self.position.x - frame.get_width() // 2),
-            int(self.position.y - frame.get_height() // 2),
-        )
-        if self.visible:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(204)  # 80% d'opacité (255 * 0.8 = 204)
-            ecran.blit(temp, pos)
-        else:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(70)  # Réduit de 20% par rapport à 90
-            ecran.blit(temp, pos)
-
-
-class Mage(Ennemi):
-
-    ATTACK_COOLDOWN = 3  # en secondes
-
-    _frames_by_dir: dict[str, list[pygame.Surface]] | None = None
-
-    @property
-    def type_nom(self) -> str:
-        return "Mage"
-
-    def __init__(
-        self, tempsApparition: int, chemin: Optional[List[Position]] = None, **kw
-    ):
-        super().__init__(
-            tempsApparition=tempsApparition,
-            vitesse=40.0,
-            pointsDeVie=170,
-            degats=20,
-            argent=3,
-            chemin=chemin,
-            **kw
-        )
-
-        if Mage._frames_by_dir is None:
-            Mage._frames_by_dir = {
-                "down": charger_sprites_ennemi(
-                    "mage", "D_Fly.png", 6, scale=SCALE_FACTOR * 0.6
-                ),
-                "up": charger_sprites_ennemi(
-                    "mage", "U_Fly.png", 6, scale=SCALE_FACTOR * 0.6
-                ),
-                "side": charger_sprites_ennemi(
-                    "mage", "S_Fly.png", 6, scale=SCALE_FACTOR * 0.6
-                ),
-            }
-
-        self.pointsDeVieInitiaux = self.pointsDeVie
-        self.direction = "down"
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.flip = False
-
-        self._time_since_last_attack = 10.0
-
-    def update_animation(self, dt: float):
-        self.frame_timer += dt
-        self._time_since_last_attack += dt
-
-        if self.frame_timer >= 0.15:
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(
-                Mage._frames_by_dir[self.direction]
-            )
-
-    def draw(self, ecran: pygame.Surface) -> None:
-        if self.estMort():
-            return
-        frames = Mage._frames_by_dir[self.direction]
-        frame = frames[self.frame_index]
-        if self.direction == "side" and self.flip:
-            frame = pygame.transform.flip(frame, True, False)
-        pos = (
-            int(self.position.x - frame.get_width() // 2),
-            int(self.position.y - frame.get_height() // 2),
-        )
-        if self.visible:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(204)  # 80% d'opacité (255 * 0.8 = 204)
-            ecran.blit(temp, pos)
-        else:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(70)  # Réduit de 20% par rapport à 90
-            ecran.blit(temp, pos)
-
-    def ready_to_attack(self) -> bool:
-        """Retourne True si le cooldown est écoulé et que le mage peut attaquer."""
-        return self._time_since_last_attack >= Mage.ATTACK_COOLDOWN
-
-    def react_to_projectile(self):
-        """Déclenche l'animation d'attaque du mage."""
-        if not self.ready_to_attack():
-            return  # ignore si le cooldown n'est pas fini
-        # reset du timer
-        self._time_since_last_attack = 0.0
-
-
-class Ogre(Ennemi):
-    _frames_by_dir: dict[str, list[pygame.Surface]] | None = None
-
-    @property
-    def type_nom(self) -> str:
-        return "Ogre"
-
-    def __init__(
-        self, tempsApparition: int, chemin: Optional[List[Position]] = None, **kw
-    ):
-        super().__init__(
-            tempsApparition=tempsApparition,
-            vitesse=25.0,
-            pointsDeVie=700,
-            degats=30,
-            argent=5,
-            chemin=chemin,
-            **kw
-        )
-
-        if Ogre._frames_by_dir is None:
-            Ogre._frames_by_dir = {
-                "down": charger_sprites_ennemi(
-                    "ogre", "D_Walk.png", 6, scale=SCALE_FACTOR
-                ),
-                "up": charger_sprites_ennemi(
-                    "ogre", "U_Walk.png", 6, scale=SCALE_FACTOR
-                ),
-                "side": charger_sprites_ennemi(
-                    "ogre", "S_Walk.png", 6, scale=SCALE_FACTOR
-                ),
-            }
-
-        self.pointsDeVieInitiaux = self.pointsDeVie
-        self.direction = "down"
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.flip = False
-
-    def update_animation(self, dt: float):
-        self.frame_timer += dt
-        if self.frame_timer >= 0.15:
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(
-                Ogre._frames_by_dir[self.direction]
-            )
-
-    def draw(self, ecran: pygame.Surface) -> None:
-        if self.estMort():
-            return
-        frames = Ogre._frames_by_dir[self.direction]
-        frame = frames[self.frame_index]
-        if self.direction == "side" and self.flip:
-            frame = pygame.transform.flip(frame, True, False)
-        pos = (
-            int(self.position.x - frame.get_width() // 2),
-            int(self.position.y - frame.get_height() // 2),
-        )
-        if self.visible:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(204)  # 80% d'opacité (255 * 0.8 = 204)
-            ecran.blit(temp, pos)
-        else:
-            temp = frame.copy()  # Copier pour ne pas modifier l'original
-            temp.set_alpha(70)  # Réduit de 20% par rapport à 90
-            ecran.blit(temp, pos)
-
-
-class Chevalier(Ennemi):
-    _frames_by_dir: dict[str, list[pygame.Surface]] | None = None
-
-    @property
-    def type_nom(self) -> str:
-        return "Chevalier"
-
-    def __init__(
-        self, tempsApparition: int, chemin: Optional[List[Position]] = None, **kw
-    ):
-        super().__init__(
-            tempsApparition=tempsApparition,
-            vitesse=35.0,
-            pointsDeVie=130,
-            degats=15,
-            argent=2,
-            chemin=chemin,
-            **kw
-        )
-
-        if Chevalier._frames_by_dir is None:
-            Chevalier._frames_by_dir = {
-                "down": charger_sprites_ennemi(
-                    "knight", "D_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-                "up": charger_sprites_ennemi(
-                    "knight", "U_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-                "side": charger_sprites_ennemi(
-                    "knight", "S_Walk.png", 6, scale=SCALE_FACTOR * 0.8
-                ),
-                "downBlock": charger_sprites_ennemi(
-                    "knight", "D_Block.png", 1, scale=SCALE_FACTOR * 0.8
-                ),
-                "upBlock": charger_sprites_ennemi(
-                    "knight", "U_Block.png", 1, scale=SCALE_FACTOR * 0.8
-                ),
-                "sideBlock": charger_sprites_ennemi(
-                    "knight", "S_Block.png", 1, scale=SCALE_FACTOR * 0.8
-                ),
-            }
-
-        self.pointsDeVieInitiaux = self.pointsDeVie
-        self.direction = "down"
-        self.frame_index = 0
-        self.frame_timer = 0
-        self.flip = False
-        self.block_timer = 0.0
-        self.block_duration = 0.2
-
-    def update_animation(self, dt: float):
-        # Blocage
-        if self.block_timer > 0:
-            self.block_timer -= dt
-            if self.block_timer <= 0:
-                # Fin du blocage
-                if "Block" in self.direction:
-                    self.direction = self.direction.replace("Block", "")
-            return  # on fige sur la frame Block
-
-        # marche
-        self.frame_timer += dt
-        if self.frame_timer >= 0.15:
-            self.frame_timer = 0
-            self.frame_index = (self.frame_index + 1) % len(
-                Chevalier._frames_by_dir[self.direction]
-            )
-
-    def block(self):
-        self.frame_index = 0
-        self.frame_timer = 0
-        if self.direction == "down":
-            self.direction = "downBlock"
-        elif self.direction == "up":
-            self.direction = "upBlock"
-        elif self.direction == "side":
-            self.direction = "sideBlock"
-        self.block_timer = self.block_duration
-
-    def draw(self, ecran: pygame.Surface) -> None:
-        if self.estMort():
-            return
-        frames = Chevalier._frames_by_dir[self.direction]
-        frame = frames[self.frame_index]
-
-        if self.direction.startswith("side") and self.flip:
-            frame = pygame.transform.flip(frame, True, False)
-        pos = (
-            int(self.position.x - frame.get_width() // 2),
-            int(self.position.y - frame.get_height() // 2),
-        )
-        if self.visible:
-            temp = frame.copy()
-            temp.set_alpha(204)
-            ecran.blit(temp, pos)
-        else:
-            temp = frame.copy()
-            temp.set_alpha(70)
-            ecran.blit(temp, pos)
-
-    def seDeplacer(self, dt: float):
-        if self.estMort() or self._arrive_au_bout:
-            return
-        d = max(0.0, self.vitesse * dt)
-        while d > 1e-6 and not self._arrive_au_bout:
-            if self._segment_index >= len(self._chemin) - 1:
-                self._arrive()
-                break
-
-            p0 = self._chemin[self._segment_index]
-            p1 = self._chemin[self._segment_index + 1]
-
-            dx = p1.x - p0.x
-            dy = p1.y - p0.y
-
-            # bloquage
-            is_blocked = getattr(self, "block_timer", 0) > 1e-9
-            if not is_blocked:
-                if abs(dx) > abs(dy):
-                    self.direction = "side"
-                    self.flip = dx > 0  # flip horizontal si on va vers la gauche
-                else:
-                    self.direction = "down" if dy > 0 else "up"
-                    self.flip = False
-            else:
-                if abs(dx) > abs(dy):
-                    self.direction = "sideBlock"
-                    self.flip = dx > 0  # flip horizontal si on va vers la gauche
-                else:
-                    self.direction = "downBlock" if dy > 0 else "upBlock"
-                    self.flip = False
-
-            seg_len = max(1e-9, distance_positions(p0, p1))
-            reste = seg_len - self._dist_on_segment
-
-            if d < reste:
-                self._dist_on_segment += d
-                t = self._dist_on_segment / seg_len
-                self.position.x = p0.x + (dx * t)
-                self.position.y = p0.y + (dy * t)
-                d = 0.0
-            else:
-                self.position.x, self.position.y = p1.x, p1.y
-                d -= reste
-                self._segment_index += 1
-                self._dist_on_segment = 0.0
-                if self._segment_index >= len(self._chemin) - 1:
-                    self._arrive()
-                    break
+def animer_ennemis(
+    ennemis: Iterable[Ennemi], dt: float, dt_images: Optional[float] = None
+) -> None:
+    """
+    Avance l'animation de tous les ennemis, en un passage par type.
+
+    Args:
+        ennemis: Ennemis apparus à animer
+        dt: Temps écoulé (s), pour le délai entre deux attaques
+        dt_images: Temps à appliquer aux images et au blocage (dt par défaut) ;
+            0 pour un pas non affiché, où seul le délai d'attaque avance
+    """
+    if dt_images is None:
+        dt_images = dt
+    elif not dt_images:
+        for e in ennemis:
+            if e.TYPE.attaque:
+                e._time_since_last_attack += dt
+        return
+
+    par_classe: Dict[type, List[Ennemi]] = {}
+    for e in ennemis:
+        par_classe.setdefault(e.__class__, []).append(e)
+
+    for cls, groupe in par_classe.items():
+        nb_frames = cls.NB_FRAMES
+        attaque = cls.TYPE.attaque
+        for e in groupe:
+            if attaque:
+                e._time_since_last_attack += dt
+            if e.block_timer > 0:
+                # Blocage : on reste figé sur la frame « Block »
+                e.block_timer -= dt_images
+                if e.block_timer <= 0:
+                    e.etat %= BLOCAGE
+                continue
+            e.frame_timer += dt_images
+            if e.frame_timer >= DUREE_FRAME:
+                e.frame_timer = 0
+                e.frame_index = (e.frame_index + 1) % nb_frames[e.etat]
+
+
+def _creer_classe(type_ennemi: TypeEnnemi) -> Type[Ennemi]:
+    """Crée la sous-classe d'`Ennemi` d'un type de la table."""
+    nb = type_ennemi.nb_frames
+    return type(
+        type_ennemi.nom,
+        (Ennemi,),
+        {
+            "__module__": __name__,
+            "__doc__": f"Ennemi « {type_ennemi.nom} » (data/typeTroupe.txt).",
+            "TYPE": type_ennemi,
+            # États de marche : nb frames ; états de blocage : 1 frame
+            "NB_FRAMES": (nb,) * BLOCAGE + (1,) * (NB_ETATS - BLOCAGE),
+        },
+    )
+
+
+# id de la table -> classe d'ennemi
+CLASSES_ENNEMIS: Dict[int, Type[Ennemi]] = {
+    id_ennemi: _creer_classe(t) for id_ennemi, t in TYPES_ENNEMIS.items()
+}
+_classes_par_nom = {cls.__name__: cls for cls in CLASSES_ENNEMIS.values()}
+# Chaque classe est aussi un nom du module (imports existants, pickle)
+globals().update(_classes_par_nom)
+
+
+def classe_ennemi(nom: str) -> Type[Ennemi]:
+    """Retourne la classe d'un type d'ennemi par son nom (ex : « Gobelin »)."""
+    try:
+        return _classes_par_nom[nom]
+    except KeyError:
+        raise ValueError(f"Type d'ennemi inconnu : {nom}") from None
@@ -1,11 +1,13 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 from math import atan2, degrees, hypot
 from typing import TYPE_CHECKING, ClassVar, Optional
 
 import pygame
 
+from classes.constants import FPS
 from classes.position import Position
-from models.ennemi import Chevalier, Ennemi
+from classes.rendu import FileRendu, surface_tournee
+from models.ennemi import Ennemi
 
 if TYPE_CHECKING:
     from game import Game
@@ -14,6 +16,9 @@ if TYPE_CHECKING:
 class Projectile(ABC):
     """Base abstraite d'un projectile (position, direction, mouvement, collision)."""
 
+    # Échelle du sprite (image_base, chargée par le TourManager)
+    ECHELLE: ClassVar[float] = 1.5
+
     def __init__(
         self,
         origine: Position,
@@ -42,7 +47,8 @@ class Projectile(ABC):
         self.vy = self.vitesse * dy / distance
 
         # Ciblage dynamique (optionnel): si défini, on suivra l'ennemi en temps réel
-        self.cible: Optional[Ennemi] = None
+        self._cible: Optional[Ennemi] = None
+        self._generation_cible = -1
 
         # Suivi
         self._distance_parcourue = 0.0
@@ -53,6 +59,19 @@ class Projectile(ABC):
         # Utilisé par le jeu pour charger l'image automatiquement
         # via une fonction générique.
 
+    @property
+    def cible(self) -> Optional[Ennemi]:
+        """Ennemi suivi, ou None s'il a été réutilisé depuis (réserve d'ennemis)."""
+        cible = self._cible
+        if cible is not None and cible.generation != self._generation_cible:
+            return None
+        return cible
+
+    @cible.setter
+    def cible(self, cible: Optional[Ennemi]) -> None:
+        self._cible = cible
+        self._generation_cible = -1 if cible is None else cible.generation
+
     def _angle_degres(self) -> float:
         # 0° = droite, 90° = haut (sens anti-horaire)
         return (degrees(atan2(self.vy, self.vx)) + 360.0) % 360.0
@@ -61,9 +80,10 @@ class Projectile(ABC):
         if self.detruit:
             return
         # Si une cible est assignée, recalculer la direction pour viser en continu
-        if self.cible is not None and not self.cible.estMort():
-            dx = float(self.cible.position.x) - self.x
-            dy = float(self.cible.position.y) - self.y
+        cible = self.cible
+        if cible is not None and not cible.estMort():
+            dx = float(cible.position.x) - self.x
+            dy = float(cible.position.y) - self.y
             dist = max(1e-6, hypot(dx, dy))
             self.vx = self.vitesse * dx / dist
             self.vy = self.vitesse * dy / dist
@@ -85,15 +105,29 @@ class Projectile(ABC):
         e.perdreVie(self.degats)
         self.detruit = True
 
-    @abstractmethod
+    def _sprite(self) -> pygame.Surface:
+        """Image tournée dans le sens du déplacement (rotation en cache)."""
+        return surface_tournee(self.image_base, 90 - self._angle_degres(), self.ECHELLE)
+
     def dessiner(self, ecran: pygame.Surface) -> None:
-        pass
+        if self.detruit or self.image_base is None:
+            return
+        sprite = self._sprite()
+        rect = sprite.get_rect(center=(int(self.x), int(self.y)))
+        ecran.blit(sprite, rect)
+
+    def preparer_rendu(self, file: FileRendu) -> None:
+        """Ajoute le projectile à la file de rendu des projectiles."""
+        if self.detruit or self.image_base is None:
+            return
+        file.ajouter_centre(self._sprite(), self.x, self.y)
 
 
 class ProjectileFleche(Projectile):
     """Flèche: rapide, dégâts fixes = 20."""
 
     CHEMIN_IMAGE: ClassVar[str] = "assets/tower/archer/Arrow/1.png"
+    ECHELLE: ClassVar[float] = 1.0
 
     def __init__(self, origine: Position, cible_pos: Position) -> None:
         super().__init__(
@@ -105,16 +139,8 @@ class ProjectileFleche(Projectile):
         )
         self.image_base: Optional[pygame.Surface] = None
 
-    def dessiner(self, ecran: pygame.Surface) -> None:
-        if self.detruit or self.image_base is None:
-            return
-        angle = self._angle_degres()
-        sprite = pygame.transform.rotozoom(self.image_base, 90 - angle, 1.0)
-        rect = sprite.get_rect(center=(int(self.x), int(self.y)))
-        ecran.blit(sprite, rect)
-
     def appliquerDegats(self, e: Ennemi) -> None:
-        if isinstance(e, Chevalier):
+        if e.TYPE.blocage:
             # Les chevaliers prennent 10% de degats par des fleches
             e.block()
             e.perdreVie(self.degats * 0.1)
@@ -141,20 +167,14 @@ class ProjectilePierre(Projectile):
         )
         self.image_base: Optional[pygame.Surface] = None
 
-    def dessiner(self, ecran: pygame.Surface) -> None:
-        if self.detruit or self.image_base is None:
-            return
-        angle = self._angle_degres()
-        sprite = pygame.transform.rotozoom(self.image_base, 90 - angle, 1.5)
-        rect = sprite.get_rect(center=(int(self.x), int(self.y)))
-        ecran.blit(sprite, rect)
-
 
 # --- Nouveau projectile de tour mage ---
 class ProjectileTourMage(Projectile):
     """Projectile de la tour Mage: orbe magique avec dégâts de zone."""
 
     CHEMIN_IMAGE: ClassVar[str] = "assets/tower/mage/projectiles/1.png"
+    RAYON_ZONE_EFFET: ClassVar[float] = 60.0
+    DUREE_EXPLOSION: ClassVar[float] = 0.6
 
     def __init__(self, origine: Position, cible_pos: Position) -> None:
         # Moins rapide qu'une flèche, dégâts supérieurs
@@ -167,18 +187,7 @@ class ProjectileTourMage(Projectile):
         )
         self.image_base: Optional[pygame.Surface] = None
         # Rayon de la zone d'effet (dégâts de zone)
-        self.rayon_zone_effet = 60.0
-
-    def dessiner(self, ecran: pygame.Surface) -> None:
-        if self.detruit or self.image_base is None:
-            return
-        angle = self._angle_degres()
-        sprite = pygame.transform.rotozoom(self.image_base, 90 - angle, 1.5)
-        rect = sprite.get_rect(center=(int(self.x), int(self.y)))
-        ecran.blit(sprite, rect)
-
-        # Dessiner un cercle de zone d'effet en transparence (optionnel, pour debug)
-        # pygame.draw.circle(ecran, (255, 0, 255, 50), (int(self.x), int(self.y)), int(self.rayon_zone_effet), 2)
+        self.rayon_zone_effet = self.RAYON_ZONE_EFFET
 
     def appliquerDegats(self, e: Ennemi) -> None:
         """Applique les dégâts à l'ennemi touché et marque le projectile pour destruction."""
@@ -254,18 +263,15 @@ class ProjectileMageEnnemi(Projectile):
             return False
         return hypot(self.x - p.x, self.y - p.y) <= self.rayon_collision
 
-    def dessiner(self, ecran: pygame.Surface) -> None:
-        if self.detruit or self.image_base is None:
-            return
-        angle = self._angle_degres()
-        sprite = pygame.transform.rotozoom(self.image_base, 90 - angle, 1.5)
-        rect = sprite.get_rect(center=(int(self.x), int(self.y)))
-        ecran.blit(sprite, rect)
-
 
 class EffetExplosion:
     """Effet visuel temporaire pour les explosions de zone."""
 
+    # Séquences pré-rendues : (rayon, durée) -> [(surface, demi_largeur, demi_hauteur)]
+    _frames_par_cle: ClassVar[
+        dict[tuple[float, float], list[tuple[pygame.Surface, int, int]]]
+    ] = {}
+
     def __init__(self, x: float, y: float, rayon: float, duree: float = 0.5):
         self.x = x
         self.y = y
@@ -273,6 +279,66 @@ class EffetExplosion:
         self.duree = duree
         self.temps_ecoule = 0.0
         self.actif = True
+        self._frames = EffetExplosion.prerendre(rayon, duree)
+
+    @classmethod
+    def prerendre(
+        cls, rayon: float, duree: float
+    ) -> list[tuple[pygame.Surface, int, int]]:
+        """
+        Pré-rend (une seule fois) la séquence d'images d'une explosion.
+
+        Une image par frame à FPS : le cercle s'étend et s'estompe avec la progression.
+
+        Args:
+            rayon: Rayon maximal de l'explosion en pixels
+            duree: Durée de l'effet en secondes
+
+        Returns:
+            Liste de (surface, demi_largeur, demi_hauteur) indexée par frame
+        """
+        cle = (float(rayon), float(duree))
+        frames = cls._frames_par_cle.get(cle)
+        if frames is not None:
+            return frames
+
+        nb_frames = max(1, round(duree * FPS))
+        frames = []
+        for i in range(nb_frames):
+            progress = i / nb_frames
+            # Rayon actuel (expansion progressive) et opacité (diminue avec le temps)
+            rayon_actuel = rayon * progress
+            alpha = int(255 * (1.0 - progress))
+
+            surface_effet = pygame.Surface(
+                (int(rayon_actuel * 2), int(rayon_actuel * 2)), pygame.SRCALPHA
+            )
+            # Cercle d'explosion
+            pygame.draw.circle(
+                surface_effet,
+                (255, 100, 255, alpha),
+                (int(rayon_actuel), int(rayon_actuel)),
+                int(rayon_actuel),
+                3,
+            )
+            # Cercle intérieur plus lumineux
+            pygame.draw.circle(
+                surface_effet,
+                (255, 200, 255, alpha // 2),
+                (int(rayon_actuel), int(rayon_actuel)),
+                int(rayon_actuel * 0.7),
+                2,
+            )
+            frames.append(
+                (
+                    surface_effet,
+                    surface_effet.get_width() // 2,
+                    surface_effet.get_height() // 2,
+                )
+            )
+
+        cls._frames_par_cle[cle] = frames
+        return frames
 
     def mettre_a_jour(self, dt: float) -> None:
         """Met à jour l'effet d'explosion."""
@@ -280,41 +346,21 @@ class EffetExplosion:
         if self.temps_ecoule >= self.duree:
             self.actif = False
 
+    def _image(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Image pré-rendue de la progression de l'effet, et sa position."""
+        frames = self._frames
+        index = int(self.temps_ecoule / self.duree * len(frames))
+        surface_effet, demi_l, demi_h = frames[min(index, len(frames) - 1)]
+        return surface_effet, (int(self.x) - demi_l, int(self.y) - demi_h)
+
     def dessiner(self, ecran: pygame.Surface) -> None:
-        """Dessine l'effet d'explosion."""
+        """Dessine l'image pré-rendue correspondant à la progression de l'effet."""
         if not self.actif:
             return
+        ecran.blit(*self._image())
 
-        # Calculer le rayon actuel (expansion progressive)
-        progress = self.temps_ecoule / self.duree
-        rayon_actuel = self.rayon_max * progress
-
-        # Calculer l'opacité (diminue avec le temps)
-        alpha = int(255 * (1.0 - progress))
-
-        # Créer une surface temporaire pour l'effet
-        surface_effet = pygame.Surface(
-            (int(rayon_actuel * 2), int(rayon_actuel * 2)), pygame.SRCALPHA
-        )
-
-        # Dessiner le cercle d'explosion
-        pygame.draw.circle(
-            surface_effet,
-            (255, 100, 255, alpha),
-            (int(rayon_actuel), int(rayon_actuel)),
-            int(rayon_actuel),
-            3,
-        )
-
-        # Dessiner un cercle intérieur plus lumineux
-        pygame.draw.circle(
-            surface_effet,
-            (255, 200, 255, alpha // 2),
-            (int(rayon_actuel), int(rayon_actuel)),
-            int(rayon_actuel * 0.7),
-            2,
-        )
-
-        # Positionner et afficher l'effet
-        rect_effet = surface_effet.get_rect(center=(int(self.x), int(self.y)))
-        ecran.blit(surface_effet, rect_effet)
+    def preparer_rendu(self, file: FileRendu) -> None:
+        """Ajoute l'effet à la file de rendu des explosions."""
+        if not self.actif:
+            return
+        file.ajouter(*self._image())
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 
 import pygame
 
+from classes import horloge
+from classes.constants import FPS, TILE_SIZE
 from classes.sprites import charger_image_assets, decouper_sprite
 
 if TYPE_CHECKING:
@@ -144,14 +146,14 @@ class SortFee(Sort):
     def activer_effet(self) -> None:
         """Active l'effet d'éclairage de la fée."""
         self.actif = True
-        self.temps_debut = pygame.time.get_ticks() / 1000.0  # Conversion en secondes
+        self.temps_debut = horloge.temps_ms() / 1000.0  # Conversion en secondes
 
     def est_actif(self) -> bool:
         """Vérifie si l'effet est encore actif."""
         if not self.actif or self.temps_debut is None:
             return False
 
-        temps_ecoule = (pygame.time.get_ticks() / 1000.0) - self.temps_debut
+        temps_ecoule = (horloge.temps_ms() / 1000.0) - self.temps_debut
         if temps_ecoule >= self.duree_eclairage:
             self.actif = False
             return False
@@ -177,6 +179,9 @@ class SortEclair(Sort):
     """Sort d'éclair qui inflige 10 dégâts aux ennemis sur une case cliquée."""
 
     _frames: list[pygame.Surface] | None = None
+    _voiles: list[pygame.Surface] | None = None
+
+    ECHELLE_Y = 2.0  # Facteur d'échelle vertical de l'éclair
 
     def __init__(self, niveau: int = 1):
         super().__init__("Eclair", niveau)
@@ -190,11 +195,27 @@ class SortEclair(Sort):
         if SortEclair._frames is None:
             sheet = charger_image_assets("lightning.png", "spell")
             if sheet:
-                SortEclair._frames = decouper_sprite(
-                    sheet, 10, horizontal=True, copy=True
-                )
+                frames = decouper_sprite(sheet, 10, horizontal=True, copy=True)
             else:
-                SortEclair._frames = []
+                frames = []
+            # Étirement vertical de l'éclair appliqué une seule fois au chargement
+            SortEclair._frames = [
+                pygame.transform.scale(
+                    f,
+                    (f.get_width(), int(f.get_height() * SortEclair.ECHELLE_Y)),
+                )
+                for f in frames
+            ]
+
+        if SortEclair._voiles is None:
+            # Voile blanc de la case, une opacité par frame de l'effet
+            nb_voiles = max(1, round(self.duree_effet * FPS))
+            SortEclair._voiles = []
+            for i in range(nb_voiles):
+                alpha = max(0, min(255, int(255 * (1 - i / nb_voiles))))
+                voile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                voile.fill((255, 255, 255, alpha))
+                SortEclair._voiles.append(voile)
 
     @property
     def prix(self) -> int:
@@ -220,7 +241,7 @@ class SortEclair(Sort):
             return False  # Déjà en cours d'activation
 
         self.case_cible = (case_x, case_y)
-        self.temps_activation = pygame.time.get_ticks() / 1000.0
+        self.temps_activation = horloge.temps_ms() / 1000.0
 
         return True
 
@@ -229,7 +250,7 @@ class SortEclair(Sort):
         if self.case_cible is None or self.temps_activation is None:
             return False
 
-        temps_ecoule = (pygame.time.get_ticks() / 1000.0) - self.temps_activation
+        temps_ecoule = (horloge.temps_ms() / 1000.0) - self.temps_activation
         if temps_ecoule >= self.duree_effet:
             self.case_cible = None
             self.temps_activation = None
@@ -260,37 +281,32 @@ class SortEclair(Sort):
     def dessiner_effet(self, ecran: pygame.Surface, game: "Game") -> None:
         if self.est_actif() and self.case_cible:
             case_x, case_y = self.case_cible
-            taille_case = 64
+            taille_case = TILE_SIZE
             x_pos, y_pos = case_x * taille_case, case_y * taille_case
 
-            # --- Animation lightning ---
-            temps_ecoule = (pygame.time.get_ticks() / 1000.0) - self.temps_activation
+            temps_ecoule = (horloge.temps_ms() / 1000.0) - self.temps_activation
             progress = temps_ecoule / self.duree_effet
-            frame_index = int(progress * len(SortEclair._frames))
-            frame_index = min(frame_index, len(SortEclair._frames) - 1)
-            frame = SortEclair._frames[frame_index]
-
-            # Appliquer une échelle verticale pour étirer l’éclair
-            scale_factor_y = 2.0  # Facteur d'échelle vertical
-            new_w = frame.get_width()
-            new_h = int(frame.get_height() * scale_factor_y)
-            frame = pygame.transform.scale(frame, (new_w, new_h))
-
-            # Centrer l’éclair sur la case
-            vertical_offset = -80 * scale_factor_y
-            rect = frame.get_rect(
-                center=(
-                    x_pos + taille_case // 2,
-                    y_pos + taille_case // 2 + vertical_offset,
+
+            # --- Animation lightning (frames déjà étirées) ---
+            if SortEclair._frames:
+                frame_index = int(progress * len(SortEclair._frames))
+                frame_index = min(frame_index, len(SortEclair._frames) - 1)
+                frame = SortEclair._frames[frame_index]
+
+                # Centrer l'éclair sur la case
+                vertical_offset = int(-80 * self.ECHELLE_Y)
+                ecran.blit(
+                    frame,
+                    (
+                        x_pos + taille_case // 2 - frame.get_width() // 2,
+                        y_pos
+                        + taille_case // 2
+                        + vertical_offset
+                        - frame.get_height() // 2,
+                    ),
                 )
-            )
-            ecran.blit(frame, rect)
-
-            # --- Éclaircissement blanc en overlay (déjà existant) ---
-            alpha = int(255 * (1 - progress))
-            alpha = max(0, min(255, alpha))
-            eclairage_surface = pygame.Surface(
-                (taille_case, taille_case), pygame.SRCALPHA
-            )
-            eclairage_surface.fill((255, 255, 255, alpha))
-            ecran.blit(eclairage_surface, (x_pos, y_pos))
+
+            # --- Éclaircissement blanc en overlay, opacité selon la progression ---
+            voiles = SortEclair._voiles
+            index_voile = min(max(0, int(progress * len(voiles))), len(voiles) - 1)
+            ecran.blit(voiles[index_voile], (x_pos, y_pos))
@@ -4,8 +4,10 @@ from typing import Callable, List, Optional, Tuple
 
 import pygame
 
+from classes import horloge
 from classes.animation import AnimateurDirectionnel
 from classes.position import Position
+from classes.rendu import FileRendu
 from classes.sprites import charger_sprites_tour
 from classes.utils import distance_positions
 from models.ennemi import Ennemi
@@ -38,7 +40,8 @@ class Tour(ABC):
         self.prix = int(prix)
 
         self._etat = "idle"
-        self._cible: Optional["Ennemi"] = None
+        self._cible_ennemi: Optional["Ennemi"] = None
+        self._generation_cible = -1
         self._au_tir: Optional[Callable[["Tour", "Ennemi"], None]] = None
 
         person_path = os.path.join(
@@ -56,18 +59,72 @@ class Tour(ABC):
         offsets = {"archer": -18, "catapulte": 2, "mage": -18}
         self._person_offset_y = offsets.get(self.type_nom, 8)
 
+        # Veille (aucun ennemi sur les portions du chemin à portée)
+        self.endormie = False
+        self._debut_veille = 0.0
+        # Tronçons du chemin couverts : (portée, x, y, indices), voir TourManager
+        self.troncons_couverts: Optional[tuple] = None
+
+    @property
+    def est_au_repos(self) -> bool:
+        """True si la tour n'est pas en train de viser ou de tirer."""
+        return self._etat == "idle"
+
     def draw(self, ecran: pygame.Surface) -> None:
         rect = pygame.Rect(int(self.position.x) - 16, int(self.position.y) - 16, 32, 32)
         pygame.draw.rect(ecran, (150, 150, 180), rect)
         self.draw_person(ecran)
 
     def draw_person(self, ecran: pygame.Surface) -> None:
+        if self.endormie:
+            self._anim.caler_sur_horloge(horloge.temps_ms() / 1000)
         self._anim.dessiner(
             ecran,
             int(self.position.x),
             int(self.position.y) - self._person_offset_y,
         )
 
+    def preparer_rendu_personnage(self, file: FileRendu) -> None:
+        """Ajoute le personnage de la tour à la file de rendu des tours."""
+        if self.endormie:
+            self._anim.caler_sur_horloge(horloge.temps_ms() / 1000)
+        self._anim.preparer_rendu(
+            file,
+            int(self.position.x),
+            int(self.position.y) - self._person_offset_y,
+        )
+
+    def endormir(self, temps_s: float) -> None:
+        """
+        Met la tour en veille : `maj` n'est plus appelée jusqu'au réveil.
+
+        L'animation de repos est recalée sur l'horloge de jeu au dessin.
+
+        Args:
+            temps_s: Temps de simulation du TourManager au début de la veille
+        """
+        self.endormie = True
+        self._debut_veille = temps_s
+
+    def reveiller(self, temps_s: float) -> None:
+        """Sort de veille ; le délai de tir récupère le temps passé endormie."""
+        if self.endormie:
+            self._time_since_last_shot += temps_s - self._debut_veille
+            self.endormie = False
+
+    @property
+    def _cible(self) -> Optional["Ennemi"]:
+        """Ennemi visé, ou None s'il a été réutilisé depuis (réserve d'ennemis)."""
+        cible = self._cible_ennemi
+        if cible is not None and cible.generation != self._generation_cible:
+            return None
+        return cible
+
+    @_cible.setter
+    def _cible(self, cible: Optional["Ennemi"]) -> None:
+        self._cible_ennemi = cible
+        self._generation_cible = -1 if cible is None else cible.generation
+
     def maj(
         self,
         dt: float,
@@ -0,0 +1 @@
+# Outils package
@@ -0,0 +1,395 @@
+"""
+Balayage de paramètres d'équilibrage sur des parties simulées en parallèle.
+
+Chaque combinaison d'une grille de paramètres (prix et portée des tours,
+évolution des prix, prix des sorts, récompenses de vague) et d'une
+disposition de tours est jouée sans fenêtre, de la première vague à la
+défaite ou à la victoire : un joueur automatique construit les tours de la
+disposition dans l'ordre dès qu'il peut les payer, et le curseur suit
+l'ennemi le plus avancé. Les parties tournent dans un `ProcessPoolExecutor`
+sur tous les cœurs ; chaque processus charge la carte et les vagues une
+seule fois puis les réutilise pour toutes ses parties.
+
+Le résultat est une table CSV avec une ligne par (combinaison, vague) : or
+au début et à la fin de la vague, or dépensé, PV perdus, fuites (ennemis
+arrivés au château) et nombre de tours.
+
+Depuis la racine du projet :
+
+    python src/outils/equilibrage.py --param prix.archer=15,20,25 \\
+        --param recompenses=0.8,1,1.2 --disposition archers_bord \\
+        --disposition mixte_bord --sortie /tmp/equilibrage.csv
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Le CSV peut être écrit sur la sortie standard : pas de bannière pygame à l'import
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from classes.carte import charger_carte  # noqa: E402
+from classes.constants import FPS  # noqa: E402
+from classes.couverture import charger_couverture  # noqa: E402
+from classes.csv import (  # noqa: E402
+    FICHIER_VAGUES_DEFAUT,
+    charger_vagues,
+    nombre_vagues,
+)
+from game import Game  # noqa: E402
+from headless import (  # noqa: E402
+    SimulationHeadless,
+    cases_bord_chemin,
+    cases_libres,
+    creer_partie,
+    repartir,
+)
+
+# Ordre de construction : liste de (case, type de tour)
+PlanConstruction = List[Tuple[Tuple[int, int], str]]
+
+# Une combinaison : (numéro, disposition, {paramètre: valeur})
+Combinaison = Tuple[int, str, Dict[str, float]]
+
+COLONNES_RESULTATS = [
+    "vague",
+    "argent_debut",
+    "argent_fin",
+    "or_depense",
+    "pv_fin",
+    "pv_perdus",
+    "fuites",
+    "nb_tours",
+    "duree_s",
+    "vague_atteinte",
+    "issue",
+]
+
+
+# ------------------- PARAMÈTRES -------------------
+
+
+def appliquer_parametres(game: Game, parametres: Dict[str, float]) -> None:
+    """
+    Modifie une partie neuve selon les paramètres de la combinaison.
+
+    Paramètres reconnus :
+        prix.<tour>, portee.<tour>: prix initial et portée d'un type de tour
+        hausse.<tour>: hausse du prix après chaque achat (+ ou x selon la tour)
+        sort.<sort>: prix de base d'un sort (vision, fee, eclair)
+        recompenses: facteur appliqué à toutes les récompenses de vague
+        recompense.<n>: récompense de la vague n
+
+    Raises:
+        ValueError: Si un paramètre est inconnu
+    """
+    tm, em = game.tour_manager, game.ennemi_manager
+    for nom, valeur in parametres.items():
+        categorie, _, cle = nom.partition(".")
+        if categorie == "prix" and cle in tm.prix_par_type:
+            tm.prix_par_type[cle] = int(valeur)
+        elif categorie == "portee" and cle in tm.portee_par_type:
+            tm.portee_par_type[cle] = float(valeur)
+        elif categorie == "hausse" and cle in tm.evolution_prix:
+            operation, _, baisse, prix_min = tm.evolution_prix[cle]
+            tm.evolution_prix[cle] = (operation, valeur, baisse, prix_min)
+        elif categorie == "sort" and cle in game.sorts:
+            game.sorts[cle].prix_base = int(valeur)
+        elif nom == "recompenses":
+            em.recompenses_par_vague = {
+                vague: int(recompense * valeur)
+                for vague, recompense in em.recompenses_par_vague.items()
+            }
+        elif categorie == "recompense" and cle.isdigit():
+            em.recompenses_par_vague[int(cle)] = int(valeur)
+        else:
+            raise ValueError(f"Paramètre d'équilibrage inconnu : {nom!r}")
+
+
+def _lire_parametre(texte: str) -> Tuple[str, List[float]]:
+    """Convertit « prix.archer=15,20,25 » en ("prix.archer", [15.0, 20.0, 25.0])."""
+    nom, _, valeurs = texte.partition("=")
+    try:
+        return nom.strip(), [float(v) for v in valeurs.split(",")]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Valeurs invalides : {texte!r}") from e
+
+
+# ------------------- DISPOSITIONS -------------------
+
+
+def _plan_repete(types: List[str]) -> Callable[[Game, int], PlanConstruction]:
+    def plan(game: Game, nb_tours: int) -> PlanConstruction:
+        cases = repartir(cases_bord_chemin(game), nb_tours)
+        return [(case, types[i % len(types)]) for i, case in enumerate(cases)]
+
+    return plan
+
+
+def _plan_couverture(types: List[str]) -> Callable[[Game, int], PlanConstruction]:
+    def plan(game: Game, nb_tours: int) -> PlanConstruction:
+        # Portées éventuellement modifiées par les paramètres de la combinaison
+        carte = charger_couverture(
+            game.tmj_path,
+            game.tour_manager.portee_par_type,
+            game.colonnes,
+            game.lignes,
+            game.taille_case,
+        )
+        libres = cases_libres(game)
+        resultat = []
+        for i in range(min(nb_tours, len(libres))):
+            type_tour = types[i % len(types)]
+            # Case libre restante qui voit le plus de chemin pour ce type
+            case = max(libres, key=lambda c: carte.longueur(c, type_tour))
+            libres.remove(case)
+            resultat.append((case, type_tour))
+        return resultat
+
+    return plan
+
+
+# nom -> fonction (partie, nombre de tours) -> ordre de construction
+DISPOSITIONS: Dict[str, Callable[[Game, int], PlanConstruction]] = {
+    "archers_bord": _plan_repete(["archer"]),
+    "mixte_bord": _plan_repete(["archer", "campement", "catapulte", "archer", "mage"]),
+    "catapultes_mages": _plan_repete(["catapulte", "mage", "campement"]),
+    "mixte_couverture": _plan_couverture(["archer", "campement", "catapulte", "mage"]),
+}
+
+
+# ------------------- SIMULATION (processus de travail) -------------------
+
+_fichier_vagues: str = FICHIER_VAGUES_DEFAUT
+
+
+def initialiser_processus(fichier_vagues: str) -> None:
+    """Charge une fois par processus ce que toutes ses parties réutilisent."""
+    global _fichier_vagues
+    _fichier_vagues = fichier_vagues
+    # Remplit les caches de module (vagues, carte, polices, sprites, sons)
+    charger_vagues(fichier_vagues)
+    charger_carte()
+    creer_partie(fichier_vagues=fichier_vagues, graine=0)
+
+
+def construire(game: Game, plan: PlanConstruction) -> int:
+    """
+    Pose les tours suivantes du plan tant que le joueur peut les payer.
+
+    Returns:
+        L'or dépensé
+    """
+    depense = 0
+    while plan:
+        case, type_tour = plan[0]
+        prix = game.tour_manager.prix_par_type.get(type_tour, 0)
+        if game.joueur.argent < prix:
+            break
+        if game.placer_tour(case, type_tour):
+            depense += prix
+        plan.pop(0)
+    return depense
+
+
+def simuler(
+    combinaison: Combinaison, nb_tours: int, ticks_max: int
+) -> List[Dict[str, object]]:
+    """
+    Joue une partie complète pour une combinaison.
+
+    Returns:
+        Une ligne de résultats par vague jouée
+    """
+    numero, disposition, parametres = combinaison
+    game, _ = creer_partie(fichier_vagues=_fichier_vagues, graine=0)
+    appliquer_parametres(game, parametres)
+    plan = DISPOSITIONS[disposition](game, nb_tours)
+    em, joueur = game.ennemi_manager, game.joueur
+    simulation = SimulationHeadless(
+        game, rendu=False, vagues=nombre_vagues(_fichier_vagues)
+    )
+
+    lignes: List[Dict[str, object]] = []
+    vague: Optional[Dict[str, object]] = None
+    for _ in range(ticks_max):
+        if simulation.est_terminee():
+            break
+        depense = construire(game, plan)
+        num_vague = em.num_vague
+        simulation.tick()
+
+        if em.num_vague != num_vague:
+            vague = {
+                "vague": em.num_vague,
+                "argent_debut": joueur.argent,
+                "or_depense": 0,
+                "pv_debut": joueur.point_de_vie,
+                "fuites_debut": em.fuites,
+                "ticks": 0,
+            }
+        if vague is None:
+            continue
+        vague["or_depense"] += depense
+        vague["ticks"] += 1
+        if not em.est_nuit or joueur.point_de_vie <= 0:
+            lignes.append(_cloturer_vague(game, vague))
+            vague = None
+    if vague is not None:
+        lignes.append(_cloturer_vague(game, vague))
+
+    if joueur.point_de_vie <= 0:
+        issue = "defaite"
+    elif em.est_victoire():
+        issue = "victoire"
+    else:
+        issue = "limite"
+    for ligne in lignes:
+        ligne.update(
+            combinaison=numero,
+            disposition=disposition,
+            vague_atteinte=em.num_vague,
+            issue=issue,
+            **parametres,
+        )
+    return lignes
+
+
+def _cloturer_vague(game: Game, vague: Dict[str, object]) -> Dict[str, object]:
+    """Construit la ligne de résultats d'une vague qui vient de se terminer."""
+    return {
+        "vague": vague["vague"],
+        "argent_debut": vague["argent_debut"],
+        "argent_fin": game.joueur.argent,
+        "or_depense": vague["or_depense"],
+        "pv_fin": game.joueur.point_de_vie,
+        "pv_perdus": vague["pv_debut"] - game.joueur.point_de_vie,
+        "fuites": game.ennemi_manager.fuites - vague["fuites_debut"],
+        "nb_tours": len(game.tour_manager.tours),
+        "duree_s": round(vague["ticks"] / FPS, 2),
+    }
+
+
+def _simuler_tache(tache: Tuple[Combinaison, int, int]) -> List[Dict[str, object]]:
+    return simuler(*tache)
+
+
+# ------------------- BALAYAGE -------------------
+
+
+def grille(
+    parametres: Dict[str, List[float]], dispositions: List[str]
+) -> List[Combinaison]:
+    """Produit toutes les combinaisons (produit cartésien) de la grille."""
+    noms = list(parametres)
+    combinaisons = []
+    for disposition in dispositions:
+        for valeurs in itertools.product(*(parametres[n] for n in noms)):
+            valeurs_par_nom = dict(zip(noms, valeurs))
+            combinaisons.append((len(combinaisons), disposition, valeurs_par_nom))
+    return combinaisons
+
+
+def balayer(
+    combinaisons: List[Combinaison],
+    fichier_vagues: str = FICHIER_VAGUES_DEFAUT,
+    nb_tours: int = 30,
+    ticks_max: int = 30 * 60 * FPS,
+    processus: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """
+    Joue toutes les combinaisons en parallèle.
+
+    Args:
+        combinaisons: Combinaisons à jouer (voir `grille`)
+        fichier_vagues: Fichier CSV des vagues
+        nb_tours: Nombre de tours de chaque disposition
+        ticks_max: Durée maximale d'une partie, en ticks
+        processus: Nombre de processus (None = un par cœur)
+
+    Returns:
+        Les lignes de résultats, dans l'ordre des combinaisons
+    """
+    taches = [(c, nb_tours, ticks_max) for c in combinaisons]
+    processus = processus or os.cpu_count() or 1
+    paquet = max(1, len(taches) // (4 * processus))
+    with ProcessPoolExecutor(
+        max_workers=processus,
+        initializer=initialiser_processus,
+        initargs=(fichier_vagues,),
+    ) as executeur:
+        resultats = executeur.map(_simuler_tache, taches, chunksize=paquet)
+        return [ligne for lignes in resultats for ligne in lignes]
+
+
+def ecrire_resultats(
+    lignes: List[Dict[str, object]], noms_parametres: List[str], fichier
+) -> None:
+    """Écrit la table de résultats au format CSV (séparateur « ; »)."""
+    colonnes = ["combinaison", "disposition", *noms_parametres, *COLONNES_RESULTATS]
+    ecrivain = csv.DictWriter(fichier, colonnes, delimiter=";", lineterminator="\n")
+    ecrivain.writeheader()
+    ecrivain.writerows(lignes)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(
+        description="Balayage de paramètres d'équilibrage."
+    )
+    parser.add_argument(
+        "--param", action="append", type=_lire_parametre, default=[],
+        help="paramètre et valeurs, ex : prix.archer=15,20,25 (option répétable)",
+    )
+    parser.add_argument(
+        "--disposition", action="append", choices=sorted(DISPOSITIONS),
+        help="disposition des tours (toutes par défaut, option répétable)",
+    )
+    parser.add_argument(
+        "--tours", type=int, default=30, help="nombre de tours par disposition"
+    )
+    parser.add_argument(
+        "--ticks-max", type=int, default=30 * 60 * FPS,
+        help="durée maximale d'une partie, en ticks",
+    )
+    parser.add_argument(
+        "--processus", type=int, help="processus (défaut : un par cœur)"
+    )
+    parser.add_argument(
+        "--waves-file", help="fichier CSV des vagues à la place de src/data/jeu.csv"
+    )
+    parser.add_argument(
+        "--sortie", help="fichier CSV produit (défaut : sortie standard)"
+    )
+    args = parser.parse_args(argv)
+
+    parametres = dict(args.param)
+    fichier_vagues = (
+        os.path.abspath(args.waves_file) if args.waves_file else FICHIER_VAGUES_DEFAUT
+    )
+    combinaisons = grille(parametres, args.disposition or list(DISPOSITIONS))
+
+    debut = perf_counter()
+    lignes = balayer(
+        combinaisons, fichier_vagues, args.tours, args.ticks_max, args.processus
+    )
+    print(
+        f"{len(combinaisons)} combinaison(s) en {perf_counter() - debut:.1f} s",
+        file=sys.stderr,
+    )
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8", newline="") as f:
+            ecrire_resultats(lignes, list(parametres), f)
+        print(f"Résultats : {args.sortie}", file=sys.stderr)
+    else:
+        ecrire_resultats(lignes, list(parametres), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
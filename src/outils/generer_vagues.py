@@ -0,0 +1,204 @@
+"""
+Générateur de fichiers de vagues synthétiques pour les tests de montée en charge.
+
+Produit un CSV au même format que `src/data/jeu.csv` (`idEnnemi;numVague;temps`),
+avec un nombre d'ennemis configurable (jusqu'à plusieurs dizaines de milliers
+par vague), un mélange de types pris dans `ENEMY_CLASSES`, une distribution
+des temps d'apparition et des rafales. Le fichier se charge ensuite avec
+`--waves-file`, dans le jeu comme dans la simulation sans fenêtre.
+
+Depuis la racine du projet :
+
+    python src/outils/generer_vagues.py --vagues 5 --ennemis 2000 --ennemis-max 10000 \\
+        --types Rat:5,Gobelin:3,Ogre:1 --distribution rafales --sortie /tmp/stress.csv
+    python src/main.py --waves-file /tmp/stress.csv
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Le CSV peut être écrit sur la sortie standard : pas de bannière pygame à l'import
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from classes.csv import ENEMY_CLASSES  # noqa: E402
+
+# Les temps d'apparition sont comparés au dixième de seconde près en jeu
+PRECISION_TEMPS = 1
+
+
+def _lire_types(texte: str) -> Dict[int, float]:
+    """
+    Convertit « Rat:5,Gobelin:3 » (ou « 2:5,3:3 ») en {id ennemi: poids}.
+
+    Les types sont désignés par leur identifiant ou par leur nom de classe.
+    """
+    ids_par_nom = {cls.__name__.lower(): id_ for id_, cls in ENEMY_CLASSES.items()}
+    poids: Dict[int, float] = {}
+    for element in texte.split(","):
+        nom, _, valeur = element.partition(":")
+        nom = nom.strip().lower()
+        id_ennemi = int(nom) if nom.isdigit() else ids_par_nom.get(nom)
+        if id_ennemi not in ENEMY_CLASSES:
+            raise argparse.ArgumentTypeError(f"Type d'ennemi inconnu : {nom!r}")
+        poids[id_ennemi] = float(valeur) if valeur else 1.0
+    return poids
+
+
+# ------------------- DISTRIBUTIONS DES TEMPS -------------------
+
+
+def temps_reguliers(nb: int, duree: float, _alea: random.Random, **_) -> List[float]:
+    """Apparitions à intervalle constant sur la durée."""
+    return [duree * i / max(1, nb) for i in range(nb)]
+
+
+def temps_uniformes(nb: int, duree: float, alea: random.Random, **_) -> List[float]:
+    """Apparitions tirées uniformément sur la durée."""
+    return [alea.uniform(0.0, duree) for _ in range(nb)]
+
+
+def temps_poisson(nb: int, duree: float, alea: random.Random, **_) -> List[float]:
+    """Processus de Poisson : écarts exponentiels de moyenne duree / nb."""
+    moyenne = duree / max(1, nb)
+    temps, t = [], 0.0
+    for _ in range(nb):
+        temps.append(min(t, duree))
+        t += alea.expovariate(1.0 / moyenne) if moyenne > 0 else 0.0
+    return temps
+
+
+def temps_rafales(
+    nb: int, duree: float, alea: random.Random, rafales: int = 5, largeur: float = 1.0
+) -> List[float]:
+    """Rafales régulièrement espacées, chacune étalée selon une loi normale."""
+    rafales = max(1, rafales)
+    centres = [duree * (i + 0.5) / rafales for i in range(rafales)]
+    return [
+        min(duree, max(0.0, alea.gauss(centres[i % rafales], largeur)))
+        for i in range(nb)
+    ]
+
+
+DISTRIBUTIONS: Dict[str, Callable[..., List[float]]] = {
+    "reguliere": temps_reguliers,
+    "uniforme": temps_uniformes,
+    "poisson": temps_poisson,
+    "rafales": temps_rafales,
+}
+
+
+# ------------------- GÉNÉRATION -------------------
+
+
+def generer_vagues(
+    nb_vagues: int,
+    ennemis_min: int,
+    ennemis_max: Optional[int] = None,
+    types: Optional[Dict[int, float]] = None,
+    distribution: str = "uniforme",
+    duree: float = 60.0,
+    rafales: int = 5,
+    largeur_rafale: float = 1.0,
+    graine: int = 0,
+) -> List[Tuple[int, int, float]]:
+    """
+    Génère les lignes d'un fichier de vagues.
+
+    Args:
+        nb_vagues: Nombre de vagues
+        ennemis_min: Nombre d'ennemis de la première vague
+        ennemis_max: Nombre d'ennemis de la dernière (progression linéaire)
+        types: Poids de chaque type {id ennemi: poids} (tous à égalité par défaut)
+        distribution: Nom de la distribution des temps (voir DISTRIBUTIONS)
+        duree: Durée d'apparition d'une vague, en secondes
+        rafales: Nombre de rafales (distribution « rafales »)
+        largeur_rafale: Écart-type d'une rafale en secondes
+        graine: Graine du générateur aléatoire (résultat reproductible)
+
+    Returns:
+        Lignes (idEnnemi, numVague, temps), triées par vague puis par temps
+    """
+    alea = random.Random(graine)
+    types = types or {id_: 1.0 for id_ in ENEMY_CLASSES}
+    ids, poids = list(types), list(types.values())
+    ennemis_max = ennemis_min if ennemis_max is None else ennemis_max
+    tirer_temps = DISTRIBUTIONS[distribution]
+
+    lignes = []
+    for vague in range(1, nb_vagues + 1):
+        progression = (vague - 1) / max(1, nb_vagues - 1)
+        nb = round(ennemis_min + (ennemis_max - ennemis_min) * progression)
+        temps = sorted(
+            round(t, PRECISION_TEMPS)
+            for t in tirer_temps(
+                nb, duree, alea, rafales=rafales, largeur=largeur_rafale
+            )
+        )
+        for id_ennemi, t in zip(alea.choices(ids, poids, k=nb), temps):
+            lignes.append((id_ennemi, vague, t))
+    return lignes
+
+
+def ecrire_vagues(lignes: List[Tuple[int, int, float]], fichier) -> None:
+    """Écrit les lignes au format `idEnnemi;numVague;temps`."""
+    fichier.write("idEnnemi;numVague;temps\n")
+    for id_ennemi, vague, temps in lignes:
+        fichier.write(f"{id_ennemi};{vague};{temps:.{PRECISION_TEMPS}f}\n")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Génère un fichier de vagues.")
+    parser.add_argument("--vagues", type=int, default=1, help="nombre de vagues")
+    parser.add_argument(
+        "--ennemis", type=int, default=1000, help="ennemis de la première vague"
+    )
+    parser.add_argument(
+        "--ennemis-max", type=int, help="ennemis de la dernière vague (défaut : idem)"
+    )
+    parser.add_argument(
+        "--types", type=_lire_types,
+        help="mélange pondéré, ex : Rat:5,Gobelin:3,Ogre:1 (défaut : uniforme)",
+    )
+    parser.add_argument(
+        "--distribution", choices=sorted(DISTRIBUTIONS), default="uniforme",
+        help="répartition des temps d'apparition",
+    )
+    parser.add_argument(
+        "--duree", type=float, default=60.0, help="durée d'une vague (s)"
+    )
+    parser.add_argument("--rafales", type=int, default=5, help="rafales par vague")
+    parser.add_argument(
+        "--largeur-rafale", type=float, default=1.0, help="étalement d'une rafale (s)"
+    )
+    parser.add_argument("--graine", type=int, default=0, help="graine aléatoire")
+    parser.add_argument(
+        "--sortie", help="fichier CSV produit (défaut : sortie standard)"
+    )
+    args = parser.parse_args(argv)
+
+    lignes = generer_vagues(
+        args.vagues,
+        args.ennemis,
+        args.ennemis_max,
+        args.types,
+        args.distribution,
+        args.duree,
+        args.rafales,
+        args.largeur_rafale,
+        args.graine,
+    )
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8", newline="") as f:
+            ecrire_vagues(lignes, f)
+        print(f"{len(lignes)} ennemis sur {args.vagues} vague(s) : {args.sortie}")
+    else:
+        ecrire_vagues(lignes, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""
+Recherche automatique de dispositions de tours pour un budget donné.
+
+Une disposition est un ensemble de (case, type de tour) dont le coût total,
+hausses de prix comprises, tient dans le budget. Elle est évaluée en jouant
+chaque vague de l'intervalle demandé sans fenêtre, tours posées d'avance et
+PV illimités : son score est le total des PV perdus (puis des fuites, puis
+du coût). La recherche est gloutonne (on ajoute la meilleure tour tant que
+le budget le permet) puis locale (déplacer ou changer une tour tant que cela
+améliore le score).
+
+Pour limiter le nombre de simulations :
+- le score de chaque couple (disposition, vague) est mémorisé ;
+- une heuristique de couverture (longueur de chemin à portée de la tour,
+  voir `classes.couverture`) écarte d'emblée les cases qui voient peu le
+  chemin, et seuls les meilleurs mouvements selon cette heuristique sont
+  simulés.
+
+Les simulations d'une même étape tournent en parallèle dans un
+`ProcessPoolExecutor`.
+
+Depuis la racine du projet :
+
+    python src/outils/optimiseur.py --budget 300 --vague-debut 1 --vague-fin 3
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from time import perf_counter
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from classes.constants import FPS  # noqa: E402
+from classes.couverture import charger_couverture  # noqa: E402
+from classes.csv import FICHIER_VAGUES_DEFAUT  # noqa: E402
+from game import Game  # noqa: E402
+from headless import SimulationHeadless, cases_libres, creer_partie  # noqa: E402
+from outils.equilibrage import initialiser_processus  # noqa: E402
+
+TYPES_OPTIMISES = ["archer", "catapulte", "mage", "campement"]
+
+# PV du joueur pendant l'évaluation : une vague ne s'arrête jamais sur une défaite
+PV_EVALUATION = 10**6
+
+Placement = Tuple[Tuple[int, int], str]
+Disposition = FrozenSet[Placement]
+# (PV perdus, fuites) d'une vague
+ResultatVague = Tuple[int, int]
+
+
+# ------------------- HEURISTIQUE DE COUVERTURE -------------------
+
+
+def couvertures(game: Game, types: Sequence[str]) -> Dict[Placement, float]:
+    """
+    Longueur de chemin à portée pour chaque case libre et chaque type.
+
+    Returns:
+        {(case, type): longueur couverte en px}
+    """
+    carte = charger_couverture(
+        game.tmj_path,
+        game.tour_manager.portee_par_type,
+        game.colonnes,
+        game.lignes,
+        game.taille_case,
+    )
+    return {
+        (case, type_tour): carte.longueur(case, type_tour)
+        for case in cases_libres(game)
+        for type_tour in types
+    }
+
+
+def elaguer(
+    couverture: Dict[Placement, float], nb_par_type: int, fraction_min: float
+) -> Dict[Placement, float]:
+    """
+    Garde, pour chaque type, les cases qui couvrent le plus de chemin.
+
+    Args:
+        couverture: Couverture de chaque placement (voir `couvertures`)
+        nb_par_type: Nombre maximal de cases gardées par type
+        fraction_min: Couverture minimale, en fraction de la meilleure du type
+    """
+    gardes = {}
+    for type_tour in {t for _, t in couverture}:
+        du_type = sorted(
+            ((c, p) for p, c in couverture.items() if p[1] == type_tour), reverse=True
+        )
+        if not du_type or du_type[0][0] <= 0:
+            continue
+        seuil = du_type[0][0] * fraction_min
+        for c, placement in du_type[:nb_par_type]:
+            if c >= seuil:
+                gardes[placement] = c
+    return gardes
+
+
+# ------------------- COÛT -------------------
+
+
+def cout(disposition: Disposition, game: Game) -> int:
+    """Coût d'achat de la disposition, hausses de prix après chaque achat comprises."""
+    tm = game.tour_manager
+    total = 0
+    for type_tour in {t for _, t in disposition}:
+        prix = tm.prix_par_type[type_tour]
+        operation, hausse, _, _ = tm.evolution_prix[type_tour]
+        for _ in range(sum(1 for _, t in disposition if t == type_tour)):
+            total += prix
+            prix = int(prix * hausse) if operation == "*" else int(prix + hausse)
+    return total
+
+
+# ------------------- SIMULATION (processus de travail) -------------------
+
+
+def simuler_vague(
+    disposition: Disposition, vague: int, fichier_vagues: str, ticks_max: int
+) -> ResultatVague:
+    """
+    Joue une vague avec la disposition posée d'avance.
+
+    Returns:
+        (PV perdus, fuites)
+    """
+    game, _ = creer_partie(fichier_vagues=fichier_vagues, graine=0)
+    game.joueur.argent = 10**9
+    for case, type_tour in sorted(disposition):
+        game.tour_manager.placer_tour(case, type_tour)
+    game.joueur.point_de_vie = PV_EVALUATION
+    em = game.ennemi_manager
+    em.num_vague = vague - 1
+    simulation = SimulationHeadless(game, rendu=False, vagues=1)
+    for _ in range(ticks_max):
+        simulation.tick()
+        if em.num_vague == vague and not em.est_nuit:
+            break
+    return PV_EVALUATION - game.joueur.point_de_vie, em.fuites
+
+
+def _simuler_tache(tache: Tuple[Disposition, int, str, int]) -> ResultatVague:
+    return simuler_vague(*tache)
+
+
+# ------------------- RECHERCHE -------------------
+
+
+class Optimiseur:
+    """Recherche gloutonne puis locale, avec mémorisation des simulations."""
+
+    def __init__(
+        self,
+        game: Game,
+        executeur: Executor,
+        budget: int,
+        vagues: Sequence[int],
+        candidats: Dict[Placement, float],
+        fichier_vagues: str = FICHIER_VAGUES_DEFAUT,
+        largeur: int = 6,
+        ticks_max: int = 10 * 60 * FPS,
+    ) -> None:
+        """
+        Args:
+            game: Partie de référence (prix, portées, cases libres)
+            executeur: Pool qui exécute les simulations
+            budget: Or disponible pour la disposition
+            vagues: Vagues jouées pour évaluer une disposition
+            candidats: Placements autorisés et leur couverture (voir `elaguer`)
+            fichier_vagues: Fichier CSV des vagues
+            largeur: Nombre de mouvements simulés par étape (les mieux couverts)
+            ticks_max: Durée maximale d'une vague simulée
+        """
+        self.game = game
+        self.executeur = executeur
+        self.budget = budget
+        self.vagues = list(vagues)
+        self.candidats = candidats
+        self.fichier_vagues = fichier_vagues
+        self.largeur = largeur
+        self.ticks_max = ticks_max
+        # (disposition, vague) -> (PV perdus, fuites)
+        self._memo: Dict[Tuple[Disposition, int], ResultatVague] = {}
+        self.nb_simulations = 0
+
+    def score(self, disposition: Disposition) -> Tuple[int, int, int]:
+        """Score (PV perdus, fuites, coût) d'une disposition déjà évaluée."""
+        pv = sum(self._memo[(disposition, v)][0] for v in self.vagues)
+        fuites = sum(self._memo[(disposition, v)][1] for v in self.vagues)
+        return pv, fuites, cout(disposition, self.game)
+
+    def evaluer(self, dispositions: List[Disposition]) -> None:
+        """Simule en parallèle les couples (disposition, vague) pas encore connus."""
+        taches = []
+        for disposition in dict.fromkeys(dispositions):
+            for vague in self.vagues:
+                if (disposition, vague) not in self._memo:
+                    taches.append(
+                        (disposition, vague, self.fichier_vagues, self.ticks_max)
+                    )
+        for tache, resultat in zip(taches, self.executeur.map(_simuler_tache, taches)):
+            self._memo[(tache[0], tache[1])] = resultat
+        self.nb_simulations += len(taches)
+
+    def _meilleure(self, dispositions: List[Disposition]) -> Optional[Disposition]:
+        """Évalue les dispositions les mieux couvertes et retourne la meilleure."""
+        dispositions = sorted(
+            dispositions,
+            key=lambda d: sum(self.candidats[p] for p in d),
+            reverse=True,
+        )[: self.largeur]
+        if not dispositions:
+            return None
+        self.evaluer(dispositions)
+        return min(dispositions, key=self.score)
+
+    def _abordable(self, disposition: Disposition) -> bool:
+        return cout(disposition, self.game) <= self.budget
+
+    def glouton(self) -> Disposition:
+        """Ajoute la meilleure tour tant que le budget le permet."""
+        disposition: Disposition = frozenset()
+        while True:
+            cases = {case for case, _ in disposition}
+            suivantes = [
+                disposition | {p}
+                for p in self.candidats
+                if p[0] not in cases and self._abordable(disposition | {p})
+            ]
+            meilleure = self._meilleure(suivantes)
+            if meilleure is None:
+                return disposition
+            disposition = meilleure
+
+    def voisines(self, disposition: Disposition) -> List[Disposition]:
+        """Dispositions obtenues en déplaçant une tour ou en changeant son type."""
+        cases = {case for case, _ in disposition}
+        resultat = []
+        for placement in disposition:
+            reste = disposition - {placement}
+            for p in self.candidats:
+                if p == placement or (p[0] in cases and p[0] != placement[0]):
+                    continue
+                voisine = reste | {p}
+                if self._abordable(voisine):
+                    resultat.append(voisine)
+        return resultat
+
+    def recherche_locale(self, disposition: Disposition, iterations: int) -> Disposition:
+        """Applique le meilleur mouvement tant qu'il améliore le score."""
+        self.evaluer([disposition])
+        for _ in range(iterations):
+            meilleure = self._meilleure(self.voisines(disposition))
+            if meilleure is None or self.score(meilleure) >= self.score(disposition):
+                break
+            disposition = meilleure
+        return disposition
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Point d'entrée de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Optimise la disposition des tours.")
+    parser.add_argument("--budget", type=int, default=300, help="or disponible")
+    parser.add_argument(
+        "--vague-debut", type=int, default=1, help="première vague jouée"
+    )
+    parser.add_argument("--vague-fin", type=int, default=3, help="dernière vague jouée")
+    parser.add_argument(
+        "--types", default=",".join(TYPES_OPTIMISES),
+        help="types de tours autorisés, séparés par des virgules",
+    )
+    parser.add_argument(
+        "--candidats", type=int, default=12,
+        help="cases gardées par type (les mieux couvertes)",
+    )
+    parser.add_argument(
+        "--couverture-min", type=float, default=0.5,
+        help="couverture minimale d'une case, en fraction de la meilleure",
+    )
+    parser.add_argument(
+        "--largeur", type=int, default=6, help="mouvements simulés par étape"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=10, help="étapes de recherche locale"
+    )
+    parser.add_argument(
+        "--processus", type=int, help="processus (défaut : un par cœur)"
+    )
+    parser.add_argument(
+        "--waves-file", help="fichier CSV des vagues à la place de src/data/jeu.csv"
+    )
+    args = parser.parse_args(argv)
+
+    fichier_vagues = (
+        os.path.abspath(args.waves_file) if args.waves_file else FICHIER_VAGUES_DEFAUT
+    )
+    game, _ = creer_partie(fichier_vagues=fichier_vagues, graine=0)
+    types = [t.strip() for t in args.types.split(",")]
+    candidats = elaguer(
+        couvertures(game, types), args.candidats, args.couverture_min
+    )
+
+    debut = perf_counter()
+    # « spawn » : les processus ne partent pas de l'état pygame de ce processus
+    with ProcessPoolExecutor(
+        max_workers=args.processus or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initialiser_processus,
+        initargs=(fichier_vagues,),
+    ) as executeur:
+        optimiseur = Optimiseur(
+            game,
+            executeur,
+            args.budget,
+            range(args.vague_debut, args.vague_fin + 1),
+            candidats,
+            fichier_vagues,
+            args.largeur,
+        )
+        disposition = optimiseur.glouton()
+        print(f"Glouton : score {optimiseur.score(disposition)}", file=sys.stderr)
+        disposition = optimiseur.recherche_locale(disposition, args.iterations)
+
+    pv, fuites, prix = optimiseur.score(disposition)
+    print(
+        f"{len(candidats)} placements candidats, {optimiseur.nb_simulations} "
+        f"simulations en {perf_counter() - debut:.1f} s",
+        file=sys.stderr,
+    )
+    print(f"PV perdus : {pv}, fuites : {fuites}, coût : {prix}/{args.budget}")
+    # Réutilisable tel quel avec src/headless.py
+    print(" ".join(f"--tour {t}:{x},{y}" for (x, y), t in sorted(disposition)))
+
+
+if __name__ == "__main__":
+    main()
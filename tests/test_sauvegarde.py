@@ -0,0 +1,64 @@
+"""Sauvegarde : restaurer dans une partie en cours équivaut à une partie neuve."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from classes.sauvegarde import capturer, restaurer  # noqa: E402
+from headless import cases_bord_chemin, creer_partie, repartir  # noqa: E402
+
+DT = 1 / 60
+TYPES = ("archer", "catapulte", "mage", "campement")
+
+
+def _partie(nb_tours: int, decalage: int = 0):
+    game, _ = creer_partie(graine=1)
+    game.joueur.argent = 100000
+    cases = repartir(cases_bord_chemin(game), nb_tours + decalage)[decalage:]
+    for i, case in enumerate(cases):
+        game.placer_tour(case, TYPES[i % len(TYPES)])
+    game.lancer_vague()
+    return game
+
+
+def _avancer(game, nb_ticks: int, vitesse: int = 1) -> None:
+    """Avance de `nb_ticks` pas ; en jeu accéléré, un pas sur `vitesse` est affiché."""
+    for i in range(nb_ticks):
+        game.maj(DT, visuel=(i + 1) % vitesse == 0)
+
+
+class TestRestaurationPartieEnCours(unittest.TestCase):
+    def test_partie_en_cours_et_partie_neuve(self) -> None:
+        source = _partie(12)
+        _avancer(source, 600, vitesse=4)
+        donnees = capturer(source)
+
+        # Partie en cours : autres tours, vague entamée, pas non affichés en
+        # attente et tours en veille
+        en_cours = _partie(6, decalage=3)
+        _avancer(en_cours, 403, vitesse=4)
+        self.assertGreater(en_cours.ennemi_manager._ordre_suivant, 0)
+        self.assertGreater(en_cours.ennemi_manager._dt_images, 0.0)
+        self.assertGreater(en_cours.tour_manager._temps_veille, 0.0)
+
+        restaurer(en_cours, donnees)
+        em, tm = en_cours.ennemi_manager, en_cours.tour_manager
+        self.assertEqual(em._dt_images, 0.0)
+        self.assertEqual(tm._dt_effets, 0.0)
+        self.assertEqual(tm._temps_veille, 0.0)
+        self.assertEqual(
+            sorted(e._ordre for e in em.ennemis), list(range(len(em.ennemis)))
+        )
+        _avancer(en_cours, 300, vitesse=2)
+        apres_en_cours = capturer(en_cours)
+
+        neuve, _ = creer_partie(graine=1)
+        restaurer(neuve, donnees)
+        _avancer(neuve, 300, vitesse=2)
+        self.assertEqual(capturer(neuve), apres_en_cours)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Veille des tours : poser ou vendre une tour ne réveille pas les autres."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from headless import creer_partie  # noqa: E402
+
+DT = 1 / 60
+
+
+class TestVeilleTours(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game, _ = creer_partie(graine=1)
+        self.game.joueur.argent = 10000
+        self.assertTrue(self.game.placer_tour((7, 3), "catapulte"))
+        self.catapulte = self.game.tour_manager.tours[0]
+        # Aucune vague : la catapulte s'endort au bout de deux pas
+        for _ in range(10):
+            self.game.maj(DT)
+        self.assertTrue(self.catapulte.endormie)
+        self.debut_veille = self.catapulte._debut_veille
+        self.delai = self.catapulte._time_since_last_shot
+
+    def _verifier_toujours_endormie(self) -> None:
+        self.game.maj(DT)
+        self.assertTrue(self.catapulte.endormie)
+        self.assertEqual(self.catapulte._debut_veille, self.debut_veille)
+        self.assertEqual(self.catapulte._time_since_last_shot, self.delai)
+
+    def test_pose_d_une_tour(self) -> None:
+        self.assertTrue(self.game.placer_tour((11, 11), "archer"))
+        self._verifier_toujours_endormie()
+
+    def test_vente_d_une_tour(self) -> None:
+        self.assertTrue(self.game.placer_tour((11, 11), "archer"))
+        for _ in range(5):
+            self.game.maj(DT)
+        self.debut_veille = self.catapulte._debut_veille
+        self.assertTrue(self.game.vendre_tour((11, 11)))
+        self._verifier_toujours_endormie()
+
+    def test_reveil_rend_le_temps_de_veille(self) -> None:
+        tm = self.game.tour_manager
+        self.assertTrue(self.game.placer_tour((11, 11), "archer"))
+        for _ in range(30):
+            self.game.maj(DT)
+        self.catapulte.reveiller(tm._temps_veille)
+        self.assertFalse(self.catapulte.endormie)
+        self.assertAlmostEqual(
+            self.catapulte._time_since_last_shot,
+            self.delai + tm._temps_veille - self.debut_veille,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()